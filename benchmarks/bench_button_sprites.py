@@ -0,0 +1,69 @@
+# bench_button_sprites.py - RoundedButton 矢量模式 vs 图片模式：创建、映射、状态切换、内存
+# 用法: python benchmarks/bench_button_sprites.py [按钮数]
+import os
+import resource
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from moderntkui import RoundedButton, get_sprite_cache
+
+BUTTONS = 2000
+COLUMNS = 40
+HOVER_ROUNDS = 3
+
+
+def max_rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def run(count, use_sprites):
+    root = tk.Tk()
+    rss_before = max_rss_kb()
+    frame = tk.Frame(root, bg="#1e1e1e")
+    frame.pack()
+    start = time.perf_counter()
+    buttons = []
+    for i in range(count):
+        b = RoundedButton(frame, text="B%d" % i, width=60, height=25,
+                          animation_duration=0, use_sprites=use_sprites)
+        b.grid(row=i // COLUMNS, column=i % COLUMNS)
+        buttons.append(b)
+    built = time.perf_counter()
+    root.update()
+    mapped = time.perf_counter()
+    # 悬停 -> 按下 -> 离开，每轮每个按钮三次状态切换
+    for _ in range(HOVER_ROUNDS):
+        for b in buttons:
+            b._on_enter()
+            b._on_press()
+            b._on_leave()
+        root.update()
+    toggled = time.perf_counter()
+    result = {
+        "build_ms": (built - start) * 1000,
+        "map_ms": (mapped - built) * 1000,
+        "toggle_ms": (toggled - mapped) * 1000,
+        "rss_kb": max_rss_kb() - rss_before,
+        "sprites": len(get_sprite_cache(root)),
+    }
+    root.destroy()
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else BUTTONS
+    # 图片模式先跑，避免 ru_maxrss 被矢量模式的峰值掩盖
+    sprite = run(count, True)
+    vector = run(count, False)
+    print("按钮数: %d，状态切换 %d 轮" % (count, HOVER_ROUNDS))
+    print("%-8s %10s %10s %12s %12s %8s" % ("模式", "创建 ms", "映射 ms", "切换 ms",
+                                          "RSS 增量 KB", "图片数"))
+    for name, r in (("矢量", vector), ("图片", sprite)):
+        print("%-8s %10.1f %10.1f %12.1f %12d %8d" % (
+            name, r["build_ms"], r["map_ms"], r["toggle_ms"], r["rss_kb"], r["sprites"]))
+
+
+if __name__ == "__main__":
+    main()
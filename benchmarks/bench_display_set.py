@@ -0,0 +1,56 @@
+# bench_display_set.py - 只读 ModernEntry 高频 set() 吞吐量测试
+# 用法: python benchmarks/bench_display_set.py [控件数] [秒数]
+import os
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from moderntkui import ModernEntry
+
+WIDGET_COUNT = 500
+DURATION = 5.0
+COLUMNS = 10
+
+
+def run(readonly, count=WIDGET_COUNT, duration=DURATION):
+    root = tk.Tk()
+    root.geometry("1600x1000")
+    frame = tk.Frame(root, bg="#1e1e1e")
+    frame.pack(fill=tk.BOTH, expand=True)
+    entries = []
+    for i in range(count):
+        e = ModernEntry(frame, width=150, height=30, readonly=readonly, animation_duration=0)
+        e.grid(row=i // COLUMNS, column=i % COLUMNS, padx=1, pady=1)
+        entries.append(e)
+    root.update()
+
+    updates = 0
+    value = 0
+    start = time.perf_counter()
+    # 模拟数据源：每轮给全部控件推送一个新值，然后处理一次事件
+    while time.perf_counter() - start < duration:
+        value += 1
+        text = "%.2f" % (value * 0.01)
+        for e in entries:
+            e.set(text)
+        updates += count
+        root.update()
+    elapsed = time.perf_counter() - start
+    root.destroy()
+    return updates / elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else WIDGET_COUNT
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else DURATION
+    normal = run(False, count, duration)
+    display = run(True, count, duration)
+    print("控件数: %d" % count)
+    print("普通模式:   %10.0f updates/sec" % normal)
+    print("只读模式:   %10.0f updates/sec" % display)
+    print("加速比:     %10.2fx" % (display / normal if normal else float("inf")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# bench_filter.py - FilterPipeline 在 2M 字符串上的逐键过滤测试
+# 用法: python benchmarks/bench_filter.py [数据量] [thread]
+import os
+import random
+import string
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from moderntkui import FilterPipeline
+
+DATA_SIZE = 2_000_000
+QUERY = "abcde"
+KEY_INTERVAL = 0.08   # 秒，模拟打字速度
+
+
+def make_data(n):
+    rnd = random.Random(42)
+    letters = string.ascii_lowercase
+    return ["".join(rnd.choice(letters) for _ in range(12)) for _ in range(n)]
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DATA_SIZE
+    use_thread = len(sys.argv) > 2 and sys.argv[2] == "thread"
+    data = make_data(size)
+    root = tk.Tk()
+    root.withdraw()
+
+    state = {"done_at": None, "count": 0}
+    pipeline = FilterPipeline(root, data, lambda r, done: state.update(
+        count=len(r) if r is not None else size,
+        done_at=time.perf_counter() if done else None), use_thread=use_thread)
+
+    # 记录事件循环的最大停顿，衡量界面是否保持可交互
+    gaps = []
+    last = [time.perf_counter()]
+
+    def heartbeat():
+        now = time.perf_counter()
+        gaps.append(now - last[0])
+        last[0] = now
+        root.after(1, heartbeat)
+
+    root.after(1, heartbeat)
+    start = time.perf_counter()
+    for i in range(1, len(QUERY) + 1):
+        pipeline.update(QUERY[:i])
+        key_deadline = time.perf_counter() + KEY_INTERVAL
+        while time.perf_counter() < key_deadline:
+            root.update()
+    while pipeline.running:
+        root.update()
+    elapsed = state["done_at"] - start if state["done_at"] else time.perf_counter() - start
+    root.destroy()
+
+    gaps.sort()
+    print("数据量:         %d" % size)
+    print("模式:           %s" % ("工作线程" if use_thread else "分帧扫描"))
+    print("最终匹配数:     %d" % state["count"])
+    print("完成耗时:       %.3f s" % elapsed)
+    print("事件循环 p99 停顿: %.1f ms" % (gaps[int(len(gaps) * 0.99)] * 1000))
+    print("事件循环最大停顿:  %.1f ms" % (gaps[-1] * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# bench_find.py - MatchIndex 增量更新 vs 每次整段重扫：逐键编辑文本、逐键输入查找词
+# 用法: python benchmarks/bench_find.py [文本长度]
+#       只测索引本身，不需要显示环境
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from moderntkui import MatchIndex
+
+TEXT_LENGTH = 1000      # ModernEntry 默认的 max_length
+EDITS = 2000
+QUERY = "level=error"
+
+
+def make_text(n):
+    rnd = random.Random(7)
+    words = ("level=error", "level=info", "user=42", "path=/api/v1", "ms=12", "ok")
+    parts = []
+    while sum(len(p) + 1 for p in parts) < n:
+        parts.append(rnd.choice(words))
+    return " ".join(parts)[:n]
+
+
+def bench_edits(text, edits):
+    rnd = random.Random(3)
+    ops = []
+    for _ in range(edits):
+        pos = rnd.randint(0, len(text) - 1)
+        ops.append((pos, rnd.choice(("", "e", "level=error "))))
+    results = {}
+    for name in ("整段重扫", "增量"):
+        index = MatchIndex(QUERY, text)
+        current = text
+        start = time.perf_counter()
+        for pos, ins in ops:
+            end = pos + (0 if ins else 1)
+            current = current[:pos] + ins + current[end:]
+            if name == "增量":
+                index.replace(pos, end, current, len(ins))
+            else:
+                index.reset(current)
+        results[name] = ((time.perf_counter() - start) * 1e6 / edits, len(index))
+    return results
+
+
+def bench_typing(text, rounds=200):
+    results = {}
+    for name in ("整段重扫", "增量"):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            index = MatchIndex(QUERY[0], text)
+            for i in range(2, len(QUERY) + 1):
+                if name == "增量":
+                    index.refine(QUERY[:i], text)
+                else:
+                    index = MatchIndex(QUERY[:i], text)
+        results[name] = ((time.perf_counter() - start) * 1e6 / (rounds * len(QUERY)), len(index))
+    return results
+
+
+def main():
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else TEXT_LENGTH
+    text = make_text(length)
+    print("文本长度: %d，查找词: %r" % (len(text), QUERY))
+    for title, results in (("编辑文本 (每次编辑)", bench_edits(text, EDITS)),
+                           ("输入查找词 (每个字符)", bench_typing(text))):
+        print(title)
+        for name, (us, count) in results.items():
+            print("  %-10s %10.2f us  匹配 %d" % (name, us, count))
+
+
+if __name__ == "__main__":
+    main()
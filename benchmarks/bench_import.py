@@ -0,0 +1,73 @@
+# bench_import.py - 导入耗时（python -X importtime）与第一个窗口出现的耗时
+# 用法: python benchmarks/bench_import.py [重复次数]
+#       第一个窗口的测量需要显示环境，无显示时用 xvfb-run 运行
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPEAT = 5
+MODULES = ("moderntkui", "moderntkui.button", "moderntkui.entry", "moderntkui.listbox")
+
+FIRST_WINDOW = r"""
+import time
+start = time.perf_counter()
+import tkinter as tk
+from moderntkui import ModernEntry, RoundedButton
+imported = time.perf_counter()
+root = tk.Tk()
+ModernEntry(root).pack()
+RoundedButton(root, text="OK").pack()
+root.update()
+shown = time.perf_counter()
+root.destroy()
+print("%f %f" % ((imported - start) * 1000, (shown - start) * 1000))
+"""
+
+
+def import_times(module):
+    """单独导入 module，返回 (自身耗时, 累计耗时, 模块总数)，单位毫秒"""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + module],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    own = cumulative = 0
+    count = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = [p.strip() for p in line[len("import time:"):].split("|")]
+        if not parts[0].isdigit():
+            continue
+        count += 1
+        if parts[2] == module:
+            own, cumulative = int(parts[0]), int(parts[1])
+    return own / 1000.0, cumulative / 1000.0, count
+
+
+def first_window():
+    proc = subprocess.run([sys.executable, "-c", FIRST_WINDOW], cwd=ROOT,
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        return None
+    imported, shown = proc.stdout.split()
+    return float(imported), float(shown)
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else REPEAT
+    print("%-20s %10s %10s %8s" % ("模块", "自身 ms", "累计 ms", "模块数"))
+    for module in MODULES:
+        runs = [import_times(module) for _ in range(repeat)]
+        print("%-20s %10.2f %10.2f %8d" % (
+            module, statistics.median(r[0] for r in runs),
+            statistics.median(r[1] for r in runs), runs[0][2]))
+    windows = [w for w in (first_window() for _ in range(repeat)) if w is not None]
+    if not windows:
+        print("第一个窗口: 无法创建 Tk 窗口（没有显示环境？）")
+        return
+    print("导入 ms (中位数): %.2f" % statistics.median(w[0] for w in windows))
+    print("第一个窗口 ms (中位数): %.2f" % statistics.median(w[1] for w in windows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+# bench_remote_x.py - 统计每种交互发给 X 服务器的请求数，对比普通模式和远程模式
+# 用法: python benchmarks/bench_remote_x.py
+#       需要 X11 显示（DISPLAY）；本脚本在本机开一个 TCP 代理转发到真实显示并按操作码计数，
+#       无显示时用 xvfb-run 运行
+import os
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+import tkinter as tk
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from moderntkui import ModernEntry, RoundedButton
+
+PROXY_DISPLAYS = range(50, 100)   # 代理尝试监听 6000+N
+TYPED_TEXT = "remote display typing benchmark "
+BACKSPACE_REPEATS = 30            # 按住 BackSpace 的自动重复次数
+REPEAT_INTERVAL_MS = 8            # 自动重复间隔：经网络到达时按键常常挤在一起
+HOVER_ROUNDS = 10
+IDLE_MS = 2000                    # 聚焦后空闲，主要是光标闪烁
+
+# 有回复的核心请求：每个都是一次往返
+REPLY_OPCODES = frozenset((
+    3, 14, 15, 16, 17, 20, 21, 23, 26, 31, 38, 39, 40, 43, 44, 47, 48, 49, 50,
+    52, 73, 83, 84, 85, 86, 87, 91, 92, 97, 98, 99, 101, 103, 106, 108, 110,
+    116, 117, 118, 119))
+
+
+def _pad(n):
+    return (n + 3) & ~3
+
+
+def _display_socket(display):
+    """按 DISPLAY 连接真实的 X 服务器"""
+    host, _, rest = display.rpartition(":")
+    number = int(rest.split(".")[0])
+    if host in ("", "unix"):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect("/tmp/.X11-unix/X%d" % number)
+    else:
+        sock = socket.create_connection((host, 6000 + number))
+    return sock
+
+
+def _xauth_cookie(display):
+    """从 xauth 取 MIT-MAGIC-COOKIE-1；没有 xauth 或没有记录时返回 None"""
+    try:
+        out = subprocess.run(["xauth", "list", display], capture_output=True,
+                             text=True).stdout
+    except OSError:
+        return None
+    for line in out.splitlines():
+        parts = line.split()
+        if len(parts) == 3 and parts[1] == "MIT-MAGIC-COOKIE-1":
+            return bytes.fromhex(parts[2])
+    return None
+
+
+def _recv_exact(sock, n):
+    data = b""
+    while len(data) < n:
+        chunk = sock.recv(n - len(data))
+        if not chunk:
+            raise EOFError
+        data += chunk
+    return data
+
+
+class XRequestCounter:
+    """转发到真实显示的 X 协议代理，按操作码统计客户端发出的请求"""
+
+    def __init__(self, display):
+        self.display = display
+        self.cookie = _xauth_cookie(display)
+        self.lock = threading.Lock()
+        self.counts = {}
+        self.listener = None
+        for n in PROXY_DISPLAYS:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            try:
+                sock.bind(("127.0.0.1", 6000 + n))
+            except OSError:
+                sock.close()
+                continue
+            sock.listen(4)
+            self.listener = sock
+            self.proxy_display = "127.0.0.1:%d" % n
+            break
+        if self.listener is None:
+            raise RuntimeError("no free port for the X proxy")
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.counts)
+
+    def _accept(self):
+        while True:
+            client, _ = self.listener.accept()
+            server = _display_socket(self.display)
+            threading.Thread(target=self._pipe, args=(server, client), daemon=True).start()
+            threading.Thread(target=self._client_to_server, args=(client, server),
+                             daemon=True).start()
+
+    @staticmethod
+    def _pipe(src, dst):
+        try:
+            while True:
+                data = src.recv(65536)
+                if not data:
+                    break
+                dst.sendall(data)
+        except OSError:
+            pass
+
+    def _client_to_server(self, client, server):
+        try:
+            # 连接建立包：字节序、版本、认证名和认证数据的长度
+            head = _recv_exact(client, 12)
+            order = "<" if head[:1] == b"l" else ">"
+            name_len, data_len = struct.unpack(order + "HH", head[6:10])
+            auth = _recv_exact(client, _pad(name_len) + _pad(data_len))
+            if name_len == 0 and self.cookie is not None:
+                # 客户端认为代理显示没有认证记录，替它带上真实显示的 cookie
+                name = b"MIT-MAGIC-COOKIE-1"
+                head = head[:6] + struct.pack(order + "HH", len(name), len(self.cookie)) + head[10:]
+                auth = name + b"\0" * (_pad(len(name)) - len(name)) + self.cookie
+                auth += b"\0" * (_pad(len(self.cookie)) - len(self.cookie))
+            server.sendall(head + auth)
+            while True:
+                header = _recv_exact(client, 4)
+                opcode = header[0]
+                length = struct.unpack(order + "H", header[2:4])[0]
+                if length == 0:
+                    # BIG-REQUESTS：长度放在后面 4 字节里，单位仍是 4 字节
+                    extra = _recv_exact(client, 4)
+                    length = struct.unpack(order + "I", extra)[0]
+                    header += extra
+                    body = _recv_exact(client, length * 4 - 8)
+                else:
+                    body = _recv_exact(client, length * 4 - 4)
+                with self.lock:
+                    self.counts[opcode] = self.counts.get(opcode, 0) + 1
+                server.sendall(header + body)
+        except (EOFError, OSError):
+            pass
+
+
+def diff(after, before):
+    requests = sum(after.values()) - sum(before.values())
+    round_trips = sum(after.get(op, 0) - before.get(op, 0) for op in REPLY_OPCODES)
+    # 去掉 flush 自己的 QueryPointer
+    return requests - 1, round_trips - 1
+
+
+def flush(root):
+    """处理完所有待办事件，再用一次往返确认之前的请求都已到达代理"""
+    root.update_idletasks()
+    root.update()
+    root.winfo_pointerxy()
+
+
+def pump(root, ms):
+    deadline = time.perf_counter() + ms / 1000.0
+    while time.perf_counter() < deadline:
+        root.update()
+        time.sleep(0.001)
+
+
+def key(keysym, char=""):
+    return SimpleNamespace(keysym=keysym, char=char, state=0)
+
+
+def run(counter, remote):
+    root = tk.Tk()
+    root.configure(bg="#1e1e1e")
+    entry = ModernEntry(root, width=300, height=30, remote=remote)
+    entry.pack(padx=10, pady=10)
+    button = RoundedButton(root, text="OK", remote=remote)
+    button.pack(pady=10)
+    flush(root)
+    pump(root, 100)
+    results = []
+
+    def measure(name, action):
+        flush(root)
+        before = counter.snapshot()
+        action()
+        flush(root)
+        results.append((name,) + diff(counter.snapshot(), before))
+
+    def focus():
+        entry.focus_force()
+        entry._on_focus_in()
+        pump(root, 50)
+
+    def typing():
+        for ch in TYPED_TEXT:
+            entry._on_key_press(key(ch, ch))
+            pump(root, REPEAT_INTERVAL_MS)
+        pump(root, 50)
+
+    def backspace():
+        for _ in range(BACKSPACE_REPEATS):
+            entry._on_key_press(key("BackSpace"))
+            pump(root, REPEAT_INTERVAL_MS)
+        pump(root, 50)
+
+    def hover():
+        for _ in range(HOVER_ROUNDS):
+            button._on_enter()
+            pump(root, 30)
+            button._on_leave()
+            pump(root, 30)
+        pump(root, 200)
+
+    def idle():
+        pump(root, IDLE_MS)
+
+    measure("聚焦", focus)
+    measure("输入 %d 字" % len(TYPED_TEXT), typing)
+    measure("按住 BackSpace x%d" % BACKSPACE_REPEATS, backspace)
+    measure("悬停 x%d" % HOVER_ROUNDS, hover)
+    measure("空闲 %d ms" % IDLE_MS, idle)
+    root.destroy()
+    return results
+
+
+def main():
+    display = os.environ.get("DISPLAY")
+    if not display:
+        print("需要 X11 显示（DISPLAY 未设置）")
+        return
+    counter = XRequestCounter(display)
+    # Tk 在创建根窗口时读取 DISPLAY，之后的窗口都经过代理
+    os.environ["DISPLAY"] = counter.proxy_display
+    try:
+        normal = run(counter, False)
+        remote = run(counter, True)
+    finally:
+        os.environ["DISPLAY"] = display
+    print("%-22s %10s %10s %10s %10s" % ("交互", "普通请求", "普通往返", "远程请求", "远程往返"))
+    for (name, n_req, n_rt), (_, r_req, r_rt) in zip(normal, remote):
+        print("%-22s %10d %10d %10d %10d" % (name, n_req, n_rt, r_req, r_rt))
+
+
+if __name__ == "__main__":
+    main()
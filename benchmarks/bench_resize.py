@@ -0,0 +1,69 @@
+# bench_resize.py - 100 个非固定尺寸 ModernEntry 在窗口拖动缩放时的开销
+# 用法: python benchmarks/bench_resize.py [控件数] [步数]
+import os
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from moderntkui import ModernEntry
+
+ENTRY_COUNT = 100
+STEPS = 300
+MIN_W, MAX_W = 300, 1200
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else ENTRY_COUNT
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else STEPS
+    root = tk.Tk()
+    root.geometry("%dx800" % MAX_W)
+    entries = []
+    for i in range(count):
+        e = ModernEntry(root, width=MAX_W, height=30, fixed_size=False, animation_duration=0)
+        e.set("可变宽度输入框 %d " % i * 4)
+        e.pack(fill=tk.X, padx=4)
+        entries.append(e)
+    root.update()
+
+    # 统计 Configure 事件数和实际布局次数
+    counters = {"configure": 0, "layout": 0}
+    for e in entries:
+        e.bind("<Configure>", lambda ev: counters.__setitem__("configure", counters["configure"] + 1),
+               add="+")
+        apply = e._apply_resize
+
+        def counted(apply=apply):
+            counters["layout"] += 1
+            apply()
+        e._apply_resize = counted
+
+    # 模拟拖动窗口边缘：每一步改宽度并只处理一次事件，接近真实拖动的事件密度
+    frame_times = []
+    start = time.perf_counter()
+    for i in range(steps):
+        phase = i % 100
+        w = MIN_W + (MAX_W - MIN_W) * (phase if (i // 100) % 2 == 0 else 100 - phase) // 100
+        t0 = time.perf_counter()
+        root.geometry("%dx800" % w)
+        root.update()
+        frame_times.append(time.perf_counter() - t0)
+    # 等待最后一帧布局完成
+    settle = time.perf_counter() + 0.1
+    while time.perf_counter() < settle:
+        root.update()
+    elapsed = time.perf_counter() - start
+    root.destroy()
+
+    frame_times.sort()
+    print("控件数:          %d" % count)
+    print("缩放步数:        %d" % steps)
+    print("总耗时:          %.3f s" % elapsed)
+    print("每步 p50:        %.2f ms" % (frame_times[len(frame_times) // 2] * 1000))
+    print("每步 p99:        %.2f ms" % (frame_times[int(len(frame_times) * 0.99)] * 1000))
+    print("Configure 事件:  %d" % counters["configure"])
+    print("实际布局次数:    %d" % counters["layout"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# bench_selection_drag.py - 拖动选择时每个 Motion 事件的 measure 次数、画布命令数和耗时
+# 用法: python benchmarks/bench_selection_drag.py [拖动步数]
+import os
+import sys
+import time
+import tkinter as tk
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from moderntkui import ModernEntry, perfstats
+
+STEPS = 400
+TEXT = "selection drag benchmark with a fairly long value " * 2
+
+
+def sweep(root, entry, xs):
+    """按 xs 依次发出拖动事件，返回 (measure 次数, 画布命令数, 毫秒)"""
+    stats = perfstats.stats_for(entry)
+    measures, commands = stats.measure_calls, stats.canvas_commands
+    start = time.perf_counter()
+    for x in xs:
+        entry._on_drag(SimpleNamespace(x=x))
+    elapsed = time.perf_counter() - start
+    root.update()
+    return stats.measure_calls - measures, stats.canvas_commands - commands, elapsed * 1000
+
+
+def main():
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else STEPS
+    perfstats.enable()
+    root = tk.Tk()
+    entry = ModernEntry(root, width=500, height=30, animation_duration=0)
+    entry.pack(padx=10, pady=10)
+    entry.set(TEXT)
+    root.update()
+    entry.focus_force()
+    entry._on_focus_in()
+    width = entry.winfo_width()
+    entry._on_click(SimpleNamespace(x=width // 2))
+    # 来回拖动：第一趟建立前缀宽度缓存，第二趟起应当不再测量
+    xs = [width // 2 + (width // 2 - 10) * (i / steps) for i in range(steps)]
+    xs += xs[::-1] + [width - x for x in xs]
+    print("%-8s %10s %12s %10s" % ("趟次", "measure", "画布命令", "耗时 ms"))
+    for name in ("首趟", "再趟"):
+        measures, commands, ms = sweep(root, entry, xs)
+        print("%-8s %10d %12d %10.2f" % (name, measures, commands, ms))
+    entry._on_release(None)
+    print("每个 Motion 事件 (再趟): %.2f 次 measure" % (measures / len(xs)))
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
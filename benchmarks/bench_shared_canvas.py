@@ -0,0 +1,81 @@
+# bench_shared_canvas.py - 独立画布控件 vs 共享画布模式：窗口数、内存、映射耗时
+# 用法: python benchmarks/bench_shared_canvas.py [表单行数]
+import os
+import resource
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from moderntkui import ModernEntry, RoundedButton, SharedCanvas
+
+ROWS = 250          # 每行一个输入框和一个按钮，共 500 个控件
+ENTRY_W, ENTRY_H = 200, 30
+BUTTON_W, BUTTON_H = 60, 25
+COLUMNS = 5
+
+
+def max_rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def count_windows(widget):
+    return 1 + sum(count_windows(c) for c in widget.winfo_children())
+
+
+def build_native(root, rows):
+    frame = tk.Frame(root, bg="#1e1e1e")
+    frame.pack(fill=tk.BOTH, expand=True)
+    for i in range(rows):
+        r, c = divmod(i, COLUMNS)
+        ModernEntry(frame, width=ENTRY_W, height=ENTRY_H, animation_duration=0).grid(
+            row=r, column=c * 2)
+        RoundedButton(frame, text="按钮%d" % i, width=BUTTON_W, height=BUTTON_H).grid(
+            row=r, column=c * 2 + 1)
+
+
+def build_shared(root, rows):
+    cell_w, cell_h = ENTRY_W + BUTTON_W + 8, ENTRY_H + 4
+    canvas = SharedCanvas(root, width=cell_w * COLUMNS,
+                          height=cell_h * ((rows + COLUMNS - 1) // COLUMNS))
+    canvas.pack(fill=tk.BOTH, expand=True)
+    for i in range(rows):
+        r, c = divmod(i, COLUMNS)
+        x, y = c * cell_w, r * cell_h
+        canvas.add_entry(x, y, width=ENTRY_W, height=ENTRY_H, animation_duration=0)
+        canvas.add_button(x + ENTRY_W + 4, y + 2, "按钮%d" % i, width=BUTTON_W, height=BUTTON_H)
+
+
+def run(builder, rows):
+    root = tk.Tk()
+    rss_before = max_rss_kb()
+    start = time.perf_counter()
+    builder(root, rows)
+    built = time.perf_counter()
+    root.update()
+    mapped = time.perf_counter()
+    windows = count_windows(root)
+    rss_after = max_rss_kb()
+    root.destroy()
+    return {
+        "windows": windows,
+        "build_ms": (built - start) * 1000,
+        "map_ms": (mapped - built) * 1000,
+        "rss_kb": rss_after - rss_before,
+    }
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+    # 共享画布先跑，避免 ru_maxrss 被独立画布的峰值掩盖
+    shared = run(build_shared, rows)
+    native = run(build_native, rows)
+    print("控件数: %d" % (rows * 2))
+    print("%-10s %10s %12s %12s %12s" % ("模式", "窗口数", "创建 ms", "映射 ms", "RSS 增量 KB"))
+    for name, r in (("独立画布", native), ("共享画布", shared)):
+        print("%-10s %10d %12.1f %12.1f %12d" % (
+            name, r["windows"], r["build_ms"], r["map_ms"], r["rss_kb"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# stress_lifecycle.py - 反复创建/销毁控件，检查内存和 Tcl after 回调是否泄漏
+# 用法: python benchmarks/stress_lifecycle.py [控件总数]
+import gc
+import os
+import resource
+import sys
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from moderntkui import ModernEntry, RoundedButton
+
+TOTAL = 10_000
+BATCH = 200                 # 每轮创建的控件数（输入框和按钮各半）
+RSS_TOLERANCE_KB = 4096     # 预热后允许的 RSS 波动
+
+
+def rss_kb():
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def pending_after(root):
+    return root.tk.splitlist(root.tk.call("after", "info"))
+
+
+def cycle(root, batch):
+    """模拟一个表单页：创建、聚焦、输入、悬停，然后整体销毁"""
+    frame = tk.Frame(root)
+    frame.pack()
+    var = tk.StringVar(frame)
+    widgets = []
+    for i in range(batch // 2):
+        entry = ModernEntry(frame, width=120, height=28, textvariable=var if i == 0 else None)
+        entry.pack()
+        entry.set("item %d" % i)
+        button = RoundedButton(frame, text="B%d" % i)
+        button.pack()
+        widgets.extend((entry, button))
+    root.update()
+    widgets[0].focus_force()
+    widgets[0]._on_focus_in()
+    widgets[1]._on_enter()
+    root.update()
+    frame.destroy()
+    del widgets, frame, var
+    root.update()
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else TOTAL
+    root = tk.Tk()
+    root.geometry("300x300")
+
+    # 预热一轮：建立调度器、帧时钟、焦点管理器等每个根窗口一份的对象，RSS 从这里算起
+    cycle(root, BATCH)
+    settle_id = root.after(500, lambda: None)
+    while settle_id in pending_after(root):
+        root.update()
+    gc.collect()
+    baseline_rss = rss_kb()
+
+    created = BATCH
+    while created < total:
+        cycle(root, BATCH)
+        created += BATCH
+    # 等待进行中的动画结束
+    deadline_id = root.after(500, lambda: None)
+    while deadline_id in pending_after(root):
+        root.update()
+    gc.collect()
+
+    # 所有控件都已销毁、动画已结束：不应再有任何待执行的 after 回调
+    leaked_after = pending_after(root)
+    rss_growth = rss_kb() - baseline_rss
+    root.destroy()
+
+    print("创建/销毁控件数: %d" % created)
+    print("残留 after 回调: %d %s" % (len(leaked_after), " ".join(leaked_after)))
+    print("RSS 增长:        %d KB" % rss_growth)
+    assert not leaked_after, "pending after callbacks: %r" % (leaked_after,)
+    ok = rss_growth <= RSS_TOLERANCE_KB
+    print("结果:            %s" % ("通过" if ok else "失败"))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
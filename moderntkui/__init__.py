@@ -0,0 +1,49 @@
+# moderntkui - 现代风格的 Tkinter 控件
+#
+#     from moderntkui import ModernEntry, RoundedButton
+#
+# 导入包本身不加载任何控件模块，也不做 Tk 操作；
+# 第一次访问某个名字时才导入对应的子模块。
+import importlib
+
+__version__ = "0.1.0"
+
+_EXPORTS = {
+    "ModernEntry": "entry",
+    "PureCursor": "entry",
+    "RoundedButton": "button",
+    "ModernList": "listbox",
+    "SharedCanvas": "sharedcanvas",
+    "FilterPipeline": "filterpipeline",
+    "GraphemeIndex": "graphemes",
+    "SelectionModel": "selection",
+    "MatchIndex": "matchindex",
+    "get_clock": "animation",
+    "animate": "animation",
+    "request_frame": "animation",
+    "get_dispatcher": "dispatcher",
+    "call_in_tk": "dispatcher",
+    "thread_safe": "dispatcher",
+    "get_focus_manager": "focusmanager",
+    "is_remote_display": "remote",
+    "get_scaling": "scaling",
+    "set_scaling": "scaling",
+    "get_sprite_cache": "spritecache",
+    "TkAsyncBridge": "asynctk",
+    "run": "asynctk",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module("." + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
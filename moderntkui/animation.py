@@ -0,0 +1,217 @@
+# animation.py - 共享帧时钟的过渡动画
+import sys
+import time
+import tkinter as tk
+
+# ====================== 常量定义 ======================
+DEFAULT_FPS = 60
+DEFAULT_DURATION = 120  # 毫秒
+
+
+# ====================== 插值与缓动 ======================
+def ease_out_cubic(t):
+    """缓出三次曲线"""
+    t -= 1.0
+    return t * t * t + 1.0
+
+
+def linear(t):
+    return t
+
+
+def _parse_color(color):
+    """'#rgb' / '#rrggbb' / '#rrrgggbbb' / '#rrrrggggbbbb' -> 8 位的 (r, g, b)
+
+    颜色名不在这里解析，由 FrameClock 创建动画时经 winfo_rgb 换算成十六进制。
+    """
+    digits = color[1:] if color.startswith("#") else ""
+    n = len(digits) // 3
+    if n not in (1, 2, 3, 4) or len(digits) != n * 3:
+        raise ValueError("not a hex color: %r" % (color,))
+    r, g, b = (int(digits[i * n:(i + 1) * n], 16) for i in range(3))
+    if n == 1:
+        return r * 17, g * 17, b * 17
+    shift = (n - 2) * 4
+    return r >> shift, g >> shift, b >> shift
+
+
+def is_hex_color(color):
+    try:
+        _parse_color(color)
+    except ValueError:
+        return False
+    return True
+
+
+def lerp_color(start, end, t):
+    """两个十六进制颜色之间插值"""
+    r1, g1, b1 = _parse_color(start)
+    r2, g2, b2 = _parse_color(end)
+    return "#%02x%02x%02x" % (round(r1 + (r2 - r1) * t),
+                              round(g1 + (g2 - g1) * t),
+                              round(b1 + (b2 - b1) * t))
+
+
+def lerp(start, end, t):
+    """数值、坐标元组或颜色插值"""
+    if isinstance(start, str):
+        return lerp_color(start, end, t)
+    if isinstance(start, (tuple, list)):
+        return type(start)(a + (b - a) * t for a, b in zip(start, end))
+    return start + (end - start) * t
+
+
+# ====================== Animation ======================
+class Animation:
+    """单个属性的过渡动画，由 FrameClock 驱动"""
+    def __init__(self, start, end, duration, setter, easing=ease_out_cubic):
+        self.start = start
+        self.end = end
+        self.duration = max(1, duration) / 1000.0
+        self.setter = setter
+        self.easing = easing
+        self.value = start
+        self.started_at = time.perf_counter()
+        self.finished = False
+
+    def retarget(self, end, duration):
+        """从当前值出发转向新的目标"""
+        self.start = self.value
+        self.end = end
+        self.duration = max(1, duration) / 1000.0
+        self.started_at = time.perf_counter()
+        self.finished = False
+
+    def step(self, now):
+        t = (now - self.started_at) / self.duration
+        if t >= 1.0:
+            t = 1.0
+            self.finished = True
+        self.value = self.end if self.finished else lerp(self.start, self.end, self.easing(t))
+        self.setter(self.value)
+
+
+# ====================== FrameClock ======================
+class FrameClock:
+    """每个根窗口一个的帧时钟：没有动画时完全停止计时"""
+    def __init__(self, root, fps=DEFAULT_FPS):
+        self.root = root
+        self.interval = max(1, 1000 // fps)
+        self._animations = {}
+        self._frame_callbacks = {}
+        self._after_id = None
+        self._colors = {}   # Tk 颜色名 -> '#rrggbb'
+
+    def resolve_color(self, color):
+        """把 Tk 颜色名（如 'red'）换算成可插值的 '#rrggbb'；无效颜色照常抛出 TclError"""
+        if is_hex_color(color):
+            return color
+        hex_color = self._colors.get(color)
+        if hex_color is None:
+            r, g, b = self.root.winfo_rgb(color)
+            hex_color = self._colors[color] = "#%02x%02x%02x" % (r >> 8, g >> 8, b >> 8)
+        return hex_color
+
+    def animate(self, key, start, end, duration, setter, easing=ease_out_cubic):
+        """启动或合并动画；同一 key 的新目标会接续进行中的动画"""
+        if isinstance(end, str):
+            start, end = self.resolve_color(start), self.resolve_color(end)
+        anim = self._animations.get(key)
+        if anim is not None:
+            if anim.end != end:
+                anim.retarget(end, duration)
+            anim.setter = setter
+            anim.easing = easing
+        else:
+            if start == end:
+                setter(end)
+                return None
+            anim = Animation(start, end, duration, setter, easing)
+            self._animations[key] = anim
+        self._schedule()
+        return anim
+
+    def request_frame(self, key, callback):
+        """在下一帧调用 callback；同一 key 在一帧内只保留最后一次请求"""
+        self._frame_callbacks[key] = callback
+        self._schedule()
+
+    def cancel(self, key):
+        self._animations.pop(key, None)
+        self._frame_callbacks.pop(key, None)
+        if not self._animations and not self._frame_callbacks:
+            self._stop()
+
+    def cancel_owner(self, owner):
+        """取消某个控件的全部动画和帧回调（key 的第一个元素为控件）"""
+        for table in (self._animations, self._frame_callbacks):
+            for key in [k for k in table if k[0] is owner]:
+                del table[key]
+        if not self._animations and not self._frame_callbacks:
+            self._stop()
+
+    def has_pending_frames(self):
+        """是否还有等待下一帧执行的合并更新（不含过渡动画）"""
+        return bool(self._frame_callbacks)
+
+    def _schedule(self):
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval, self._tick)
+
+    def _stop(self):
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def _tick(self):
+        self._after_id = None
+        now = time.perf_counter()
+        for key, anim in list(self._animations.items()):
+            try:
+                anim.step(now)
+            except tk.TclError:
+                anim.finished = True  # 控件已销毁，直接丢弃
+            except Exception:
+                anim.finished = True
+                self.root.report_callback_exception(*sys.exc_info())
+            if anim.finished and self._animations.get(key) is anim:
+                del self._animations[key]
+        callbacks, self._frame_callbacks = self._frame_callbacks, {}
+        for callback in callbacks.values():
+            try:
+                callback()
+            except tk.TclError:
+                pass
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
+        if self._animations or self._frame_callbacks:
+            self._schedule()
+
+
+def get_clock(widget, fps=DEFAULT_FPS):
+    """获取控件所在根窗口的共享帧时钟"""
+    root = widget._root()
+    clock = getattr(root, "_modern_frame_clock", None)
+    if clock is None:
+        clock = FrameClock(root, fps)
+        root._modern_frame_clock = clock
+    return clock
+
+
+def animate(widget, name, start, end, setter, duration=DEFAULT_DURATION,
+            easing=ease_out_cubic):
+    """在 widget 上对名为 name 的属性做过渡；duration<=0 时立即设置"""
+    clock = get_clock(widget)
+    if duration <= 0:
+        clock.cancel((widget, name))
+        setter(end)
+        return None
+    return clock.animate((widget, name), start, end, duration, setter, easing)
+
+
+def request_frame(widget, name, callback):
+    """把 widget 的 name 更新合并到下一帧执行"""
+    get_clock(widget).request_frame((widget, name), callback)
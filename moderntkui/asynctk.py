@@ -0,0 +1,147 @@
+# asynctk.py - Tk 与 asyncio 事件循环集成
+import asyncio
+import threading
+import tkinter as tk
+import _tkinter
+from .dispatcher import get_dispatcher
+
+# ====================== 常量定义 ======================
+MIN_POLL_INTERVAL = 0.001   # 秒，刚处理过事件时的轮询间隔
+MAX_POLL_INTERVAL = 0.016   # 秒，空闲时退避到约一帧
+MAX_EVENTS_PER_PUMP = 500   # 每次最多处理的 Tk 事件数，避免饿死协程
+
+
+# ====================== TkAsyncBridge ======================
+class TkAsyncBridge:
+    """以 asyncio 为主循环，用自适应定时器驱动 Tk 事件处理
+
+    有输入时以 1ms 间隔连续处理事件，空闲时逐步退避到一帧，
+    既不空转 CPU，也不会像 update()+sleep() 那样固定增加输入延迟。
+    """
+    def __init__(self, root, loop=None):
+        self.root = root
+        self.loop = loop
+        self._interval = MIN_POLL_INTERVAL
+        self._handle = None
+        self._closed = None
+        root._modern_async_bridge = self
+        root.bind("<Destroy>", self._on_destroy, add="+")
+
+    def _on_destroy(self, event):
+        if event.widget is self.root:
+            self.stop()
+
+    def _pump(self):
+        self._handle = None
+        processed = 0
+        try:
+            while processed < MAX_EVENTS_PER_PUMP and \
+                    self.root.dooneevent(_tkinter.ALL_EVENTS | _tkinter.DONT_WAIT):
+                processed += 1
+        except tk.TclError:
+            self.stop()
+            return
+        # 没有 mainloop 时，工作线程排队的更新由这里执行
+        dispatcher = getattr(self.root, "_modern_dispatcher", None)
+        if dispatcher is not None:
+            dispatcher.drain()
+        if self._closed is None or self._closed.done():
+            return
+        if processed:
+            self._interval = MIN_POLL_INTERVAL
+        else:
+            self._interval = min(MAX_POLL_INTERVAL, self._interval * 2)
+        self._handle = self.loop.call_later(self._interval, self._pump)
+
+    def start(self):
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+        if self._closed is None:
+            self._closed = self.loop.create_future()
+        if self._handle is None:
+            self._handle = self.loop.call_soon(self._pump)
+
+    def stop(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._closed is not None and not self._closed.done():
+            self._closed.set_result(None)
+
+    async def wait_closed(self):
+        """驱动 Tk 直到根窗口被销毁"""
+        self.start()
+        await self._closed
+
+
+async def run_tk(root):
+    """在当前事件循环中运行 Tk，直到根窗口关闭"""
+    bridge = getattr(root, "_modern_async_bridge", None) or TkAsyncBridge(root)
+    await bridge.wait_closed()
+
+
+def run(root):
+    """asyncio.run 的便捷入口，代替 root.mainloop()"""
+    asyncio.run(run_tk(root))
+
+
+# ====================== 协程命令 ======================
+_background_loop = None
+_background_lock = threading.Lock()
+
+
+def _get_background_loop():
+    """普通 mainloop() 下没有 asyncio 循环，协程命令改在一个后台线程的循环里运行"""
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="moderntkui-asyncio",
+                             daemon=True).start()
+            _background_loop = loop
+    return _background_loop
+
+
+def _get_loop(widget):
+    """Tk 线程上的事件循环：asyncio 桥的循环或当前运行中的循环；都没有时为 None"""
+    bridge = getattr(widget._root(), "_modern_async_bridge", None)
+    if bridge is not None and bridge.loop is not None:
+        return bridge.loop
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def spawn_command(button, command):
+    """把协程命令调度到事件循环上，运行期间禁用按钮
+
+    没有驱动 Tk 的 asyncio 循环时（普通 mainloop()），协程在后台线程中运行，
+    其中对控件的修改应通过 thread_safe 方法或 call_in_tk 进行。
+    """
+    loop = _get_loop(button)
+    was_enabled = button.enabled
+    button.set_enabled(False)
+
+    def _done(t):
+        button._command_task = None
+        try:
+            if was_enabled and button.winfo_exists():
+                button.set_enabled(True)
+        except tk.TclError:
+            return
+        if t.cancelled():
+            return
+        exc = t.exception()
+        if exc is not None:
+            button.report_callback_exception(type(exc), exc, exc.__traceback__)
+
+    if loop is not None:
+        task = loop.create_task(command())
+        task.add_done_callback(_done)
+    else:
+        task = asyncio.run_coroutine_threadsafe(command(), _get_background_loop())
+        dispatcher = get_dispatcher(button)
+        task.add_done_callback(lambda t: dispatcher.post(_done, t))
+    button._command_task = task
+    return task
@@ -0,0 +1,305 @@
+# button.py - RoundedButton 圆角按钮
+import tkinter as tk
+import functools
+from .animation import animate, get_clock, DEFAULT_DURATION
+from .dispatcher import get_dispatcher, thread_safe
+from .focusmanager import get_focus_manager
+from .spritecache import get_sprite_cache
+from .scaling import get_scaling
+from .fonts import default_family
+from .remote import is_remote_display
+from .geometry import arc_rect_points
+from .theme import (BG_COLOR, BUTTON_COLOR, BUTTON_HOVER_COLOR, BUTTON_PRESS_COLOR, TEXT_COLOR,
+                    BUTTON_OUTLINE_COLOR, BUTTON_DISABLED_COLOR, BUTTON_DISABLED_TEXT_COLOR,
+                    BUTTON_FONT_SIZE)
+
+CO_COROUTINE = 0x0080   # inspect.CO_COROUTINE
+
+
+def _is_coroutine_function(func):
+    """不导入 asyncio/inspect 的协程函数判断，同步命令的点击不付导入代价"""
+    while isinstance(func, functools.partial):
+        func = func.func
+    code = getattr(getattr(func, "__func__", func), "__code__", None)
+    return code is not None and bool(code.co_flags & CO_COROUTINE)
+
+
+class RoundedButton(tk.Canvas):
+    """自定义圆角按钮控件"""
+    def __init__(self, master, text, command=None, width=60, height=25, radius=4,
+                 bg_color=BG_COLOR, button_color=BUTTON_COLOR, hover_color=BUTTON_HOVER_COLOR,
+                 press_color=BUTTON_PRESS_COLOR, text_color=TEXT_COLOR,
+                 outline_color=BUTTON_OUTLINE_COLOR,
+                 font_family="default", font_size=BUTTON_FONT_SIZE, font_weight="normal",
+                 animation_duration=DEFAULT_DURATION, use_sprites=False, remote=None):
+        # 尺寸参数按 96 DPI 的基准像素给出，这里换算成当前缩放下的像素
+        scaling = get_scaling(master)
+        self._base_geometry = (width, height, radius)
+        width, height, radius = scaling.scaled(width), scaling.scaled(height), scaling.scaled(radius)
+        super().__init__(master, width=width, height=height, 
+                        highlightthickness=0, bd=0, bg=bg_color)
+        get_dispatcher(self)
+        self.command = command   # 可以是普通函数，也可以是协程函数
+        self._command_task = None
+        self.radius = radius
+        
+        # 保存原始尺寸
+        self.width = width
+        self.height = height
+
+        # 禁用配置
+        self.enabled = True           # 当前是否可用
+        self.disabled_color = BUTTON_DISABLED_COLOR            # 禁用时的面板色
+        self.disabled_text_color = BUTTON_DISABLED_TEXT_COLOR  # 禁用时的文字色
+        
+        # 颜色配置
+        self.button_color = button_color
+        self.hover_color = hover_color
+        self.press_color = press_color
+        self.text_color = text_color
+        self.outline_color = outline_color
+        self._current_fill = self.button_color
+        # 远程模式（默认按显示自动判断）：面板用普通矩形，状态切换不做过渡
+        self.remote = is_remote_display(self) if remote is None else bool(remote)
+        if self.remote:
+            animation_duration = 0
+            use_sprites = False
+        self.animation_duration = animation_duration  # 0 表示不做过渡
+        # 图片模式：面板用共享缓存里的预渲染图片，状态切换只换图片
+        self.use_sprites = use_sprites
+        self._bg_color = bg_color
+        self._sprite = None
+        
+        # 字体处理
+        if font_family == "default":
+            # 默认字体族每个解释器只解析一次，不再每个按钮查询
+            font_family = default_family(self)
+        
+        self.font_config = (font_family, font_size, font_weight)
+        
+        # 绘制圆角按钮
+        if use_sprites:
+            self._sprite = self._get_sprite(self.button_color)
+            self.btn_id = self.create_image(0, 0, anchor="nw", image=self._sprite)
+        else:
+            self.btn_id = self._draw_rounded_rect(
+                1, 1, width-1, height-1,
+                fill=self.button_color,
+                outline=self.outline_color
+            )
+        
+        # 添加按钮文字 - 保存文字ID
+        self.text_id = self.create_text(
+            width//2, height//2,
+            text=text,
+            fill=self.text_color,
+            font=self.font_config
+        )
+        
+        # 事件绑定
+        self.bind("<Enter>", self._on_enter)
+        self.bind("<Leave>", self._on_leave)
+        self.bind("<Button-1>", self._on_press)
+        self.bind("<ButtonRelease-1>", self._on_release)
+        self.bind("<FocusIn>", self._on_enter)
+        self.bind("<FocusOut>", self._on_leave)
+        self.bind("<Return>", self._on_release)
+        self.bind("<space>", self._on_release)
+        get_focus_manager(self).register(self)
+        scaling.register(self)
+    
+    def _on_scaling_changed(self, factor):
+        """缩放系数变化：按基准尺寸重建面板，图片模式会取新尺寸对应的缓存图片"""
+        scaling = get_scaling(self)
+        base_w, base_h, base_r = self._base_geometry
+        self.width, self.height = scaling.scaled(base_w), scaling.scaled(base_h)
+        self.radius = scaling.scaled(base_r)
+        tk.Canvas.configure(self, width=self.width, height=self.height)
+        if self.use_sprites:
+            self._set_fill(self._current_fill)
+        else:
+            self.delete(self.btn_id)
+            self.btn_id = self._draw_rounded_rect(
+                1, 1, self.width-1, self.height-1,
+                fill=self._current_fill,
+                outline=self.outline_color
+            )
+        # 元组字体在重新设置时按新的 tk scaling 解析
+        self.coords(self.text_id, self.width//2, self.height//2)
+        self.itemconfig(self.text_id, font=self.font_config)
+        self.tag_raise(self.text_id)
+
+    def _on_enter(self, event=None):
+        """鼠标悬停效果"""
+        if not self.enabled:
+            return
+        try:
+            self._animate_fill(self.hover_color)
+        except tk.TclError:
+            pass
+    
+    def _on_leave(self, event=None):
+        """鼠标离开效果"""
+        try:
+            self._refresh_appearance() 
+        except tk.TclError:
+            pass
+    
+    def _on_press(self, event=None):
+        """鼠标按下效果"""
+        if not self.enabled:
+            return
+        try:
+            self._animate_fill(self.press_color)
+        except tk.TclError:
+            pass
+    
+    def _on_release(self, event=None):
+        """鼠标释放并执行命令"""
+        if not self.enabled:
+            return
+        try:
+            self._animate_fill(self.hover_color)
+            if self.command:
+                if _is_coroutine_function(self.command):
+                    # asyncio 只在真正用到协程命令时才导入
+                    from .asynctk import spawn_command
+                    spawn_command(self, self.command)
+                else:
+                    self.command()
+        except tk.TclError:
+            pass
+    
+    def _get_sprite(self, fill):
+        return get_sprite_cache(self).rounded_rect(
+            self.width, self.height, self.radius, fill, self.outline_color, self._bg_color)
+
+    def _set_fill(self, color):
+        self._current_fill = color
+        if self.use_sprites:
+            self._sprite = self._get_sprite(color)
+            self.itemconfig(self.btn_id, image=self._sprite)
+        else:
+            self.itemconfig(self.btn_id, fill=color)
+
+    def _animate_fill(self, color):
+        """面板色过渡到 color，由共享帧时钟驱动"""
+        if self.use_sprites:
+            # 过渡的每一帧都是新颜色，会把缓存冲掉；图片模式直接切换
+            get_clock(self).cancel((self, "fill"))
+            if color != self._current_fill:
+                self._set_fill(color)
+            return
+        animate(self, "fill", self._current_fill, color, self._set_fill,
+                duration=self.animation_duration)
+
+    def _draw_rounded_rect(self, x1, y1, x2, y2, **kwargs):
+        """绘制圆角矩形（路径按尺寸缓存，同尺寸按钮共用）"""
+        if self.remote:
+            return self.create_rectangle(x1, y1, x2, y2, **kwargs)
+        points = arc_rect_points(x1, y1, x2, y2, self.radius)
+        return self.create_polygon(points, **kwargs, smooth=True)
+
+    @thread_safe
+    def configure(self, **kwargs):
+        """配置按钮属性（含 state / disabled_color）"""
+        try:
+            # 1. 文本
+            if 'text' in kwargs:
+                self.itemconfig(self.text_id, text=kwargs['text'])
+
+            # 2. 命令
+            if 'command' in kwargs:
+                self.command = kwargs['command']
+
+            # 3. 字体
+            font_changed = False
+            if any(k in kwargs for k in ('font_family', 'font_size', 'font_weight')):
+                family, size, weight = self.font_config
+                family = kwargs.pop('font_family', family)
+                size   = kwargs.pop('font_size',   size)
+                weight = kwargs.pop('font_weight', weight)
+                self.font_config = (family, size, weight)
+                self.itemconfig(self.text_id, font=self.font_config)
+
+            # 4. 禁用色
+            if 'disabled_color' in kwargs:
+                self.disabled_color = kwargs.pop('disabled_color')
+                self._refresh_appearance()
+            if 'disabled_text_color' in kwargs:
+                self.disabled_text_color = kwargs.pop('disabled_text_color')
+                self._refresh_appearance()
+
+            # 5. 状态
+            if 'state' in kwargs:
+                state = kwargs.pop('state')
+                self.set_enabled(state == 'normal')
+
+            # 6. 其余颜色（button_color / hover_color / outline_color / text_color）
+            color_changed = False
+            color_keys = ['button_color', 'hover_color', 'press_color', 'text_color', 'outline_color']
+            for key in color_keys:
+                if key in kwargs:
+                    setattr(self, key, kwargs[key])
+                    color_changed = True
+
+            if color_changed:
+                # 如果当前禁用，仍保持 disabled_color；否则用新 button_color
+                current_fill = (self.disabled_color if not self.enabled
+                                else self.button_color)
+                get_clock(self).cancel((self, "fill"))
+                if self.use_sprites:
+                    self._set_fill(current_fill)
+                else:
+                    self._current_fill = current_fill
+                    self.delete(self.btn_id)
+                    self.btn_id = self._draw_rounded_rect(
+                        1, 1, self.width-1, self.height-1,
+                        fill=current_fill,
+                        outline=self.outline_color
+                    )
+                if 'text_color' in kwargs:
+                    self.itemconfig(self.text_id, fill=self.text_color)
+                self.tag_raise(self.text_id)
+
+        except tk.TclError:
+            pass   # 窗口已销毁
+    
+    def destroy(self):
+        """清理资源"""
+        if self._command_task is not None:
+            self._command_task.cancel()
+            self._command_task = None
+        try:
+            get_clock(self).cancel_owner(self)
+            get_focus_manager(self).unregister(self)
+        except tk.TclError:
+            pass
+        self.command = None
+        self._sprite = None
+        try:
+            super().destroy()
+        except tk.TclError:
+            pass
+    
+    @thread_safe
+    def set_enabled(self, flag=True):
+        """True=启用 False=禁用"""
+        self.enabled = bool(flag)
+        self._refresh_appearance()
+
+
+    def _refresh_appearance(self):
+        """刷新按钮和文字的颜色"""
+        if self.enabled:
+            fill_color      = self.button_color
+            text_fill_color = self.text_color
+        else:
+            fill_color      = self.disabled_color
+            text_fill_color = self.disabled_text_color
+
+        try:
+            self._animate_fill(fill_color)
+            self.itemconfig(self.text_id, fill=text_fill_color)
+        except tk.TclError:
+            pass
\ No newline at end of file
@@ -0,0 +1,177 @@
+# dispatcher.py - 工作线程到 Tk 线程的更新队列
+import queue
+import socket
+import sys
+import threading
+import time
+import tkinter as tk
+
+# ====================== 常量定义 ======================
+DEFAULT_POLL_INTERVAL = 16   # 毫秒，约一帧
+DEFAULT_FRAME_BUDGET = 8     # 毫秒，每帧最多用于执行更新的时间
+
+
+# ====================== Dispatcher ======================
+class Dispatcher:
+    """线程安全的更新队列，由 Tk 线程上的 after 回调分批执行
+
+    工作线程从不调用 Tk：第一条更新到来时往一对本地 socket 里写一个字节，
+    Tk 的文件事件（mainloop 和 dooneevent 都会处理）唤醒 Tk 线程，
+    之后每帧取一批，直到队列清空再停下。没有文件事件的平台（Windows）
+    退回到 Tk 线程上按帧轮询。
+    """
+    def __init__(self, root, poll_interval=DEFAULT_POLL_INTERVAL,
+                 frame_budget=DEFAULT_FRAME_BUDGET):
+        self.root = root
+        self.poll_interval = poll_interval
+        self.frame_budget = frame_budget / 1000.0
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._armed = False          # 已唤醒或已排好下一次 _drain
+        self._tk_thread = threading.get_ident()
+        self._closed = False
+        self._drain_after_id = None
+        self._poll_after_id = None
+        self._wake_r = self._wake_w = None
+        if hasattr(root.tk, "createfilehandler"):
+            self._wake_r, self._wake_w = socket.socketpair()
+            self._wake_r.setblocking(False)
+            self._wake_w.setblocking(False)
+            root.tk.createfilehandler(self._wake_r, tk.READABLE, self._on_wake)
+        else:
+            self._poll_after_id = root.after(self.poll_interval, self._poll)
+        root.bind("<Destroy>", self._on_destroy, add="+")
+
+    def in_tk_thread(self):
+        return threading.get_ident() == self._tk_thread
+
+    def post(self, func, *args, **kwargs):
+        """从任意线程提交一次调用；在 Tk 线程中执行"""
+        if self._closed:
+            return
+        with self._lock:
+            self._queue.put((func, args, kwargs))
+            if self._armed:
+                return
+            self._armed = True
+        if not self.in_tk_thread():
+            self._wake()
+            return
+        try:
+            self._drain_after_id = self.root.after_idle(self._drain)
+        except tk.TclError:
+            self._closed = True   # 根窗口已销毁
+
+    def _wake(self):
+        """工作线程唤醒 Tk 线程；轮询模式下由 _poll 自己发现"""
+        sock = self._wake_w
+        if sock is None:
+            return
+        try:
+            sock.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass   # 缓冲区已满说明 Tk 线程还没读，已经会被唤醒；或者已关闭
+
+    def _on_wake(self, file=None, mask=None):
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+        self.drain()
+
+    def _poll(self):
+        self._poll_after_id = None
+        self.drain()
+        if not self._closed:
+            self._poll_after_id = self.root.after(self.poll_interval, self._poll)
+
+    def drain(self):
+        """在 Tk 线程中执行已排队的更新；不经过 mainloop 驱动 Tk 的一方（如 asyncio 桥）每轮调用"""
+        if self._drain_after_id is None and not self._queue.empty():
+            self._drain()
+
+    def _drain(self):
+        self._drain_after_id = None
+        if self._closed:
+            return
+        deadline = time.perf_counter() + self.frame_budget
+        try:
+            # 每轮至少执行一条，预算再小也能前进
+            while True:
+                try:
+                    func, args, kwargs = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    func(*args, **kwargs)
+                except tk.TclError:
+                    pass  # 目标控件已销毁
+                except Exception:
+                    self.root.report_callback_exception(*sys.exc_info())
+                if time.perf_counter() >= deadline:
+                    break
+        finally:
+            self._rearm()
+
+    def _rearm(self):
+        """预算用完时剩余的更新留到下一帧；队列清空就停下，等下一次提交唤醒"""
+        with self._lock:
+            if self._closed or self._queue.empty():
+                self._armed = False
+                return
+        try:
+            self._drain_after_id = self.root.after(self.poll_interval, self._drain)
+        except tk.TclError:
+            self._closed = True
+
+    def _on_destroy(self, event):
+        if event.widget is self.root:
+            self.close()
+
+    def close(self):
+        self._closed = True
+        for attr in ("_drain_after_id", "_poll_after_id"):
+            after_id = getattr(self, attr)
+            if after_id is not None:
+                try:
+                    self.root.after_cancel(after_id)
+                except tk.TclError:
+                    pass
+                setattr(self, attr, None)
+        if self._wake_r is not None:
+            try:
+                self.root.tk.deletefilehandler(self._wake_r)
+            except tk.TclError:
+                pass
+            self._wake_r.close()
+            self._wake_w.close()
+            self._wake_r = self._wake_w = None
+
+
+def get_dispatcher(widget):
+    """获取控件所在根窗口的调度器（控件创建时在 Tk 线程中建立）"""
+    root = widget._root()
+    dispatcher = getattr(root, "_modern_dispatcher", None)
+    if dispatcher is None:
+        dispatcher = Dispatcher(root)
+        root._modern_dispatcher = dispatcher
+    return dispatcher
+
+
+def call_in_tk(widget, func, *args, **kwargs):
+    """在 Tk 线程中直接调用，在其他线程中排队"""
+    dispatcher = get_dispatcher(widget)
+    if dispatcher.in_tk_thread():
+        return func(*args, **kwargs)
+    dispatcher.post(func, *args, **kwargs)
+    return None
+
+
+def thread_safe(method):
+    """方法装饰器：非 Tk 线程的调用自动转交给调度器"""
+    def wrapper(self, *args, **kwargs):
+        return call_in_tk(self, method, self, *args, **kwargs)
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
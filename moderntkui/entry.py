@@ -0,0 +1,1229 @@
+# entry.py - ModernEntry 输入框与 PureCursor 光标
+import tkinter as tk
+from .animation import animate, get_clock, request_frame, DEFAULT_DURATION
+from .dispatcher import get_dispatcher, thread_safe
+from .focusmanager import get_focus_manager
+from .graphemes import GraphemeIndex
+from .selection import SelectionModel
+from .matchindex import MatchIndex
+from .spritecache import get_sprite_cache
+from .scaling import get_scaling
+from .fonts import make_font
+from .remote import is_remote_display
+from .geometry import rounded_rect_geometry, sprite_border_geometry
+from .theme import (ENTRY_BG_COLOR, BORDER_NORMAL_COLOR, BORDER_FOCUS_COLOR,
+                    TEXT_COLOR, PLACEHOLDER_COLOR, CURSOR_COLOR, SELECTION_COLOR, HIGHLIGHT_COLOR,
+                    ENTRY_FONT_FAMILY, ENTRY_FONT_SIZE)
+
+# ====================== 常量定义 ======================
+DEFAULT_WIDTH = 240
+DEFAULT_HEIGHT = 36
+DEFAULT_RADIUS = 8
+DEFAULT_CURSOR_HEIGHT = 18
+DEFAULT_CURSOR_BLINK_SPEED = 450
+SELECTION_HEIGHT_OFFSET = -3
+TEXT_PADDING_X = 12
+MIN_CURSOR_HEIGHT = 14
+CURSOR_VERTICAL_OFFSET_REDUCTION = 4
+MAX_TEXT_LENGTH = 1000
+REPEATABLE_KEYS = ("BackSpace", "Delete", "Left", "Right")
+FIND_TAG = "find"   # 查找结果在附加高亮中的标签
+
+# ====================== PureCursor ======================
+class PureCursor:
+    """自定义光标控件，实现闪烁效果"""
+    def __init__(self, canvas, x=0, y=0, height=DEFAULT_CURSOR_HEIGHT, width=1,
+                 color=CURSOR_COLOR, blink_speed=DEFAULT_CURSOR_BLINK_SPEED):
+        self.canvas = canvas
+        self.x = x
+        self.y = y
+        self.height = height
+        self.width = width
+        self.color = color
+        self.blink_speed = blink_speed
+        self.visible = True
+        self.blink_id = None
+        self._fill = color
+        self.cursor_id = canvas.create_rectangle(
+            x, y, x + width, y + height,
+            fill=color, outline="", width=0)
+
+    def _set_fill(self, fill):
+        # 颜色没变就不发 itemconfig，免得画布为同样的内容重绘
+        if fill != self._fill:
+            self._fill = fill
+            self.canvas.itemconfig(self.cursor_id, fill=fill)
+
+    def move(self, x, y):
+        if self.blink_id:
+            self.canvas.after_cancel(self.blink_id)
+            self.blink_id = None
+        if (x, y) != (self.x, self.y):
+            self.x = x
+            self.y = y
+            self.canvas.coords(self.cursor_id, x, y, x + self.width, y + self.height)
+        self.start_blinking()
+
+    def blink(self):
+        self.visible = not self.visible
+        self._set_fill(self.color if self.visible else "")
+        self.blink_id = self.canvas.after(self.blink_speed, self.blink)
+
+    def start_blinking(self):
+        """显示光标并开始闪烁；blink_speed <= 0 时常亮不闪烁"""
+        if self.blink_id:
+            self.canvas.after_cancel(self.blink_id)
+            self.blink_id = None
+        self.visible = True
+        self._set_fill(self.color)
+        if self.blink_speed > 0:
+            self.blink_id = self.canvas.after(self.blink_speed, self.blink)
+
+    def stop_blinking(self):
+        if self.blink_id:
+            self.canvas.after_cancel(self.blink_id)
+            self.blink_id = None
+        self.visible = False
+        self._set_fill("")
+
+    def set_height(self, height):
+        self.height = height
+        self.canvas.coords(self.cursor_id, self.x, self.y, self.x + self.width, self.y + height)
+
+    def set_color(self, color):
+        self.color = color
+        if self.visible:
+            self._set_fill(color)
+
+    def destroy(self):
+        """取消闪烁定时器并删除光标项"""
+        if self.blink_id:
+            try:
+                self.canvas.after_cancel(self.blink_id)
+            except tk.TclError:
+                pass
+            self.blink_id = None
+        try:
+            # 宿主画布可能覆盖了 delete（如 ModernEntry），直接调用 Canvas 的版本
+            tk.Canvas.delete(self.canvas, self.cursor_id)
+        except tk.TclError:
+            pass
+
+    def hide(self):
+        self.canvas.itemconfig(self.cursor_id, state='hidden')
+
+    def show(self):
+        self.canvas.itemconfig(self.cursor_id, state='normal')
+
+# ====================== ModernEntry ======================
+class ModernEntry(tk.Canvas):
+    """现代风格的输入框组件"""
+
+    def _redraw_rect(self, w, h, focus=False):
+        """更新背景和边框：尺寸不变时不动多边形，只过渡边框色"""
+        if self.use_sprites:
+            self._redraw_sprite_border(w, h)
+            return
+        if (w, h) != self._rect_size:
+            if self.remote:
+                # 远程模式用普通矩形：不做样条细分，绘制请求也最少
+                pts = (0, 0, w - 1, h - 1)
+                create = self.create_rectangle
+            else:
+                pts = rounded_rect_geometry(w, h, self._radius)
+                create = lambda *a, **kw: self.create_polygon(*a, smooth=True, **kw)
+            if self._rect_bg is None:
+                self._rect_bg = create(pts, fill=self.bg_color, outline="")
+                self._rect_outline = create(pts, fill="", outline=self._border_color, width=1)
+            else:
+                self.coords(self._rect_bg, pts)
+                self.coords(self._rect_outline, pts)
+            self._rect_size = (w, h)
+            # 只在边框项创建或移动后调整层次，换边框色不引起额外重绘
+            self.tag_raise(self.text_id)
+            if getattr(self, "cursor", None):
+                self.tag_raise(self.cursor.cursor_id)
+        target = self._current_border_focus if self.focus_get() == self else self.border_normal
+        self._animate_border(target)
+
+    def _redraw_sprite_border(self, w, h):
+        """图片边框：四个缓存的抗锯齿圆角 + 直线边，尺寸变化只改坐标"""
+        if (w, h) != self._rect_size:
+            corner = max(1, min(self._radius + 1, w // 2, h // 2))
+            self._corner_size = corner
+            edges, fills, anchors = sprite_border_geometry(w, h, corner)
+            if self._rect_bg is None:
+                self._rect_bg = [self.create_rectangle(*f, fill=self.bg_color, outline="",
+                                                       width=0) for f in fills]
+                self._rect_outline = [self.create_line(*e, fill=self._border_color,
+                                                       tags=("border_edge",)) for e in edges]
+                self._corner_ids = [self.create_image(x, y, anchor=a) for a, x, y in anchors]
+                self._corner_sprites = [None] * 4
+                self._corner_key = None
+            else:
+                for item, f in zip(self._rect_bg, fills):
+                    self.coords(item, f)
+                for item, e in zip(self._rect_outline, edges):
+                    self.coords(item, e)
+                for item, (a, x, y) in zip(self._corner_ids, anchors):
+                    self.coords(item, x, y)
+            self._rect_size = (w, h)
+            self._corner_key = None
+            self.tag_raise(self.text_id)
+            if getattr(self, "cursor", None):
+                self.tag_raise(self.cursor.cursor_id)
+        target = self._current_border_focus if self.focus_get() == self else self.border_normal
+        self._animate_border(target)
+
+    def _set_border_color(self, color):
+        self._border_color = color
+        if not self.use_sprites:
+            self.itemconfig(self._rect_outline, outline=color)
+            return
+        key = (self._corner_size, color)
+        if key == self._corner_key:
+            return
+        # 换边框色只是换四张缓存图片和四条线的颜色，不重新细分多边形
+        self._corner_key = key
+        cache = get_sprite_cache(self)
+        radius = min(self._radius, self._corner_size)
+        for i, (item, which) in enumerate(zip(self._corner_ids, ("nw", "ne", "sw", "se"))):
+            sprite = cache.corner(self._corner_size, radius, self.bg_color, color,
+                                  self._canvas_bg, which)
+            self._corner_sprites[i] = sprite
+            self.itemconfig(item, image=sprite)
+        self.itemconfig("border_edge", fill=color)
+
+    def _animate_border(self, color):
+        """边框色过渡到 color，由共享帧时钟驱动"""
+        if self.use_sprites:
+            # 过渡的每一帧都要新图片，图片模式直接切换
+            get_clock(self).cancel((self, "border"))
+            self._set_border_color(color)
+            return
+        animate(self, "border", self._border_color, color, self._set_border_color,
+                duration=self.animation_duration)
+
+    def __init__(self, master, width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT,
+                 radius=DEFAULT_RADIUS, bg_color=ENTRY_BG_COLOR,
+                 border_normal=BORDER_NORMAL_COLOR, border_focus=BORDER_FOCUS_COLOR,
+                 text_color=TEXT_COLOR, placeholder="", placeholder_color=PLACEHOLDER_COLOR,
+                 font_family=ENTRY_FONT_FAMILY, font_size=ENTRY_FONT_SIZE,
+                 fixed_size=True, max_length=MAX_TEXT_LENGTH,
+                 animation_duration=DEFAULT_DURATION, textvariable=None,
+                 readonly=False, use_sprites=False, remote=None, **kwargs):
+        # 尺寸参数按 96 DPI 的基准像素给出，这里换算成当前缩放下的像素
+        scaling = get_scaling(master)
+        self._base_geometry = (width, height, radius)
+        width, height, radius = scaling.scaled(width), scaling.scaled(height), scaling.scaled(radius)
+        super().__init__(master, width=width, height=height,
+                         highlightthickness=0, bd=0, bg=bg_color)
+        get_dispatcher(self)
+        self.bg_color = bg_color
+        self.border_normal = border_normal
+        self.border_focus = border_focus
+        self.text_color = text_color
+        self.placeholder = placeholder
+        self.placeholder_color = placeholder_color
+        self._selection = SelectionModel()  # 锚点 + 活动端（光标），以及附加高亮区间
+        self._text = ""
+        self._graphemes = GraphemeIndex()  # 字素簇边界，随编辑增量更新
+        self._font = make_font(font_family, font_size)
+        self._cursor_height = scaling.scaled(DEFAULT_CURSOR_HEIGHT)
+        self._radius = radius
+        self._text_left = 0
+        self.fixed_size = fixed_size
+        self.readonly = readonly  # 只读显示模式：无光标、无选择，set() 合并到帧
+        self._shown_text = placeholder
+        self._original_border_focus = border_focus
+        self._current_border_focus = border_focus
+        self._border_color = border_normal
+        # 远程模式（默认按显示自动判断）：不闪烁、不过渡、不用平滑多边形和图片，按键重绘合并到帧
+        self.remote = is_remote_display(self) if remote is None else bool(remote)
+        if self.remote:
+            animation_duration = 0
+            use_sprites = False
+        self.animation_duration = animation_duration  # 0 表示不做过渡
+        if max_length is not None and max_length < 1:
+            raise ValueError("max_length must be at least 1 or None for no limit")
+        self.max_length = max_length
+        font_height = self._linespace = self._font.metrics("linespace")
+        self._prefix_text = None    # _prefix_widths 对应的文本
+        self._prefix_widths = {}    # 前缀长度 -> 像素宽度
+        self._pending_size = None
+        self._rect_bg = None
+        self._rect_outline = None
+        self._rect_size = None
+        self.use_sprites = use_sprites  # 边框用缓存的圆角图片代替平滑多边形
+        self._canvas_bg = bg_color
+        self._corner_size = None
+        self._corner_ids = None
+        self._corner_sprites = None
+        self._corner_key = None
+        self.text_x = scaling.scaled(TEXT_PADDING_X)
+        self.text_y = (height - font_height) // 2
+        self.cursor_y_offset = max(0, (font_height - self._cursor_height) // 2)
+        self.text_id = self.create_text(
+            self.text_x, self.text_y,
+            text=placeholder, anchor="nw", fill=placeholder_color, font=self._font)
+        self._redraw_rect(width, height)
+        self.cursor = None
+        self._dragging_select = False
+        self._selection_item = None     # 常驻的选区矩形，没有选区时隐藏
+        self._selection_box = None      # 选区矩形当前坐标，None 表示隐藏
+        self._highlight_items = {}      # 标签 -> [[矩形, 坐标或 None], ...]，按需增加、循环复用
+        self._highlight_colors = {}
+        self._find_index = None         # 当前查找词的 MatchIndex，随编辑增量更新
+        self._preedit = ""          # 输入法组合中的预编辑串
+        self._preedit_items = None  # (背景, 文本, 下划线)，首次组合时创建
+        self._preedit_x = None      # 组合开始时的光标 x，组合期间不再测量前缀
+        self._composing = False
+        self._clamp_after_keys = False  # 合并的删除编辑在重绘前需要收紧滚动偏移
+        self._key_render_id = None      # 待执行的按键重绘（after_idle）
+        self._clip = None           # (文本, 起, 止)：CLIPBOARD 按需取用的快照
+        self._owns_primary = False
+        self._primary_clip = None   # (文本, 起, 止)：失去焦点后 PRIMARY 继续提供的选区快照
+        self._bind_events()
+        self._textvariable = None
+        self._var_trace = None
+        self._syncing_var = False
+        if textvariable is not None:
+            self._bind_textvariable(textvariable)
+        if not readonly:
+            get_focus_manager(self).register(self)
+        scaling.register(self)
+        self.tag_raise(self.text_id)
+
+    def _bind_events(self):
+        if self.fixed_size:
+            self.bind("<Configure>", lambda e: "break")
+        else:
+            self.bind("<Configure>", self._on_resize)
+        if self.readonly:
+            return
+        self.bind("<Button-1>", self._on_click)
+        self.bind("<Key>", self._on_key_press)
+        self.bind("<BackSpace>", self._on_key_press)
+        self.bind("<Delete>", self._on_key_press)
+        self.bind("<FocusIn>", self._on_focus_in)
+        self.bind("<FocusOut>", self._on_focus_out)
+        self.bind("<B1-Motion>", self._on_drag)
+        self.bind("<ButtonRelease-1>", self._on_release)
+        self.bind("<Control-v>", self._on_paste)
+        self.bind("<Control-V>", self._on_paste)
+        self.bind("<Control-c>", self._on_copy)
+        self.bind("<Control-C>", self._on_copy)
+        self.bind("<Control-x>", self._on_cut)
+        self.bind("<Control-X>", self._on_cut)
+        self.bind("<Button-2>", self._on_middle_click)
+        self.bind("<Control-a>", self._select_all)
+        self.bind("<Control-A>", self._select_all)
+        self._bind_selection_handlers()
+        # Tk 在 macOS 上用这组虚拟事件报告输入法的标记文本
+        self.bind("<<TkStartIMEMarkedText>>", self._on_ime_start)
+        self.bind("<<TkEndIMEMarkedText>>", self._on_ime_end)
+        self.bind("<<TkClearIMEMarkedText>>", lambda e: self.cancel_preedit())
+        self.bind("<<TkAccentBackspace>>", self._on_ime_backspace)
+
+    def _bind_selection_handlers(self):
+        """注册 PRIMARY/CLIPBOARD 的取数回调，数据在对方请求时才分块切出"""
+        self.selection_handle(self._serve_primary, selection="PRIMARY")
+        self.selection_handle(self._serve_clipboard, selection="CLIPBOARD")
+        # 丢失所有权的回调只注册一次，避免每次 selection own 都新建 Tcl 命令
+        self._primary_lost_cmd = self.register(self._on_primary_lost)
+        self._clipboard_lost_cmd = self.register(self._on_clipboard_lost)
+
+    def _bind_textvariable(self, var):
+        """与 tk.StringVar 双向绑定"""
+        self._textvariable = var
+        self._var_trace = var.trace_add("write", self._on_var_write)
+        self.set(var.get())
+
+    def _on_var_write(self, *args):
+        # 自身写回变量时不再回显；外部的连续写入合并到一帧刷新一次
+        if self._syncing_var:
+            return
+        request_frame(self, "textvariable", self._apply_var_value)
+
+    def _apply_var_value(self):
+        if self._textvariable is None:
+            return
+        value = self._textvariable.get()
+        if value != self._text:
+            self.set(value)
+
+    def _sync_var(self):
+        """把当前文本写回绑定的变量"""
+        if self._textvariable is None or self._syncing_var:
+            return
+        if self._textvariable.get() == self._text:
+            return
+        self._syncing_var = True
+        try:
+            self._textvariable.set(self._text)
+        finally:
+            self._syncing_var = False
+
+    def destroy(self):
+        """取消所有定时器和帧回调，解除变量跟踪与焦点注册"""
+        if self._clip is not None:
+            # 按需提供的 CLIPBOARD 随窗口销毁而失效，交给 Tk 自己的剪贴板保存
+            text, start, end = self._clip
+            self._clip = None
+            try:
+                self.clipboard_clear()
+                self.clipboard_append(text[start:end])
+            except tk.TclError:
+                pass
+        if self.cursor is not None:
+            self.cursor.destroy()
+            self.cursor = None
+        if self._var_trace is not None:
+            try:
+                self._textvariable.trace_remove("write", self._var_trace)
+            except tk.TclError:
+                pass
+            self._var_trace = None
+            self._textvariable = None
+        self._corner_sprites = None
+        if self._key_render_id is not None:
+            try:
+                self.after_cancel(self._key_render_id)
+            except tk.TclError:
+                pass
+            self._key_render_id = None
+        try:
+            get_clock(self).cancel_owner(self)
+            manager = get_focus_manager(self)
+            if manager.active is self:
+                manager.active = None
+            manager.unregister(self)
+        except tk.TclError:
+            pass
+        super().destroy()
+
+    def _fix_index(self, idx):
+        if idx in (tk.END, "end"):
+            return len(self._text)
+        try:
+            idx = int(idx)
+        except ValueError:
+            idx = 0
+        if idx < 0:
+            idx = max(0, len(self._text) + idx)
+        return max(0, min(idx, len(self._text)))
+
+    @property
+    def _cursor_pos(self):
+        """光标位置，即选区的活动端"""
+        return self._selection.head
+
+    @_cursor_pos.setter
+    def _cursor_pos(self, pos):
+        self._selection.head = pos
+
+    def _clusters(self):
+        """与当前文本同步的字素簇索引（文本被整体替换时才完整重算）"""
+        self._graphemes.ensure(self._text)
+        return self._graphemes
+
+    def _replace_text(self, start, end, txt=""):
+        """把 [start, end) 替换为 txt，并只重新切分编辑点附近的簇"""
+        clusters = self._clusters()
+        widths = self._prefix_widths if self._prefix_text is self._text else {}
+        self._text = self._text[:start] + txt + self._text[end:]
+        clusters.replace(start, end, self._text)
+        # 编辑点之前的前缀不变，宽度缓存只丢掉其后的部分
+        self._prefix_widths = {i: w for i, w in widths.items() if i <= start}
+        self._prefix_text = self._text
+        self._selection.adjust(start, end, len(txt))
+        if self._find_index is not None:
+            self._find_index.replace(start, end, self._text, len(txt))
+
+    @thread_safe
+    def insert(self, idx, txt):
+        if self.max_length is not None:
+            current_length = len(self._text)
+            remaining = self.max_length - current_length
+            if remaining <= 0:
+                return
+            if len(txt) > remaining:
+                txt = txt[:remaining]
+        idx = self._fix_index(idx)
+        self._replace_text(idx, idx, txt)
+        self._cursor_pos = idx + len(txt)
+        self._refresh_text_and_cursor()
+        self._clear_selection()
+
+    def delete(self, first, last=None):
+        start, end = self._selection.span()
+        if start is not None and end is not None:
+            self._replace_text(start, end)
+            self._cursor_pos = start
+            self._clear_selection()
+            self._refresh_text_and_cursor()
+            return
+        first = self._fix_index(first)
+        last = self._clusters().next(first) if last is None else self._fix_index(last)
+        if first > last:
+            first, last = last, first
+        self._replace_text(first, last)
+        self._cursor_pos = first
+        self._refresh_text_and_cursor()
+        self._clear_selection()
+
+    @thread_safe
+    def set(self, text):
+        if self.max_length is not None and len(text) > self.max_length:
+            text = text[:self.max_length]
+        if self.readonly:
+            self._stream_set(text)
+            return
+        self._selection.adjust(0, len(self._text), len(text))
+        self._text = text
+        if self._find_index is not None:
+            self._find_index.reset(text)
+        self._cursor_pos = len(text)
+        self._set_text_left(0)
+        self.itemconfig(self.text_id, text=text or self.placeholder,
+                        fill=self.text_color if text else self.placeholder_color)
+        if self.cursor is None:
+            self._create_cursor()
+            self.cursor.hide()
+        self._scroll_to_cursor()
+        self._clear_selection()
+        self._sync_var()
+
+    def _stream_set(self, text):
+        """只读模式的轻量 set：只记录最新值，下一帧仅更新文本项"""
+        self._text = text
+        self._sync_var()
+        request_frame(self, "display_text", self._flush_display)
+
+    def _flush_display(self):
+        show_text = self._text or self.placeholder
+        if show_text == self._shown_text:
+            return
+        self._shown_text = show_text
+        self.itemconfig(self.text_id, text=show_text,
+                        fill=self.text_color if self._text else self.placeholder_color)
+        if self._find_index is not None:
+            self._find_index.reset(self._text)
+            self._update_selection_visual()
+
+    def get(self):
+        return self._text
+
+    def get_selected_text(self):
+        start, end = self._selection.span()
+        if start is None or end is None or start == end:
+            return ""
+        return self._text[start:end]
+
+    def _refresh_text_and_cursor(self):
+        self._sync_var()
+        show_text = self._text if self._text else self.placeholder
+        show_color = self.text_color if self._text else self.placeholder_color
+        self.itemconfig(self.text_id, text=show_text, fill=show_color)
+        if self.max_length is not None and len(self._text) >= self.max_length:
+            new_color = "#ff4d4d"
+        else:
+            new_color = self._original_border_focus
+        if new_color != self._current_border_focus:
+            self._current_border_focus = new_color
+            if self is self.focus_displayof():
+                self._redraw_rect(self.winfo_width(), self.winfo_height(), focus=True)
+        self._update_cursor()
+        self._scroll_to_cursor()
+        self._update_selection_visual()
+
+    def _clear_selection(self):
+        self._selection.clear()
+        self._hide_selection()
+
+    def _hide_selection(self):
+        """选区为空：隐藏选区矩形并交还 PRIMARY，别的程序不会再从这里粘贴到空串
+
+        失去焦点时留下的快照例外：PRIMARY 保留到出现新选区或被别的程序取走。
+        """
+        if self._selection_box is not None:
+            self._selection_box = None
+            self.itemconfig(self._selection_item, state="hidden")
+        if self._primary_clip is None:
+            self._disown_primary()
+
+    def _keep_primary(self):
+        """失去焦点前记下当前选区，中键粘贴到别的程序时仍能取到"""
+        if self._owns_primary and self._selection.active:
+            start, end = self._selection.span()
+            self._primary_clip = (self._text, start, end)
+
+    def _selection_band(self):
+        """选区和高亮矩形的上下边"""
+        sel_height = self._linespace + SELECTION_HEIGHT_OFFSET
+        y1 = self.text_y + (self._linespace - sel_height) // 2
+        return y1, y1 + sel_height
+
+    def _update_selection_visual(self):
+        """选区矩形常驻：拖动时只用缓存的前缀宽度改坐标，不删建、不测量"""
+        self._refresh_highlights()
+        if not self._selection.active:
+            self._hide_selection()
+            return
+        self._own_primary()
+        start, end = self._selection.span()
+        left = self.text_x + self._text_left
+        y1, y2 = self._selection_band()
+        box = (left + self._prefix_width(start), y1, left + self._prefix_width(end), y2)
+        if box == self._selection_box:
+            return
+        if self._selection_item is None:
+            self._selection_item = self.create_rectangle(
+                box, fill=SELECTION_COLOR, outline="", width=0)
+            self.tag_lower(self._selection_item, self.text_id)
+        else:
+            self.coords(self._selection_item, box)
+            if self._selection_box is None:
+                self.itemconfig(self._selection_item, state="normal")
+        self._selection_box = box
+
+    # ====================== 附加高亮 ======================
+    def highlight(self, tag, ranges, color=HIGHLIGHT_COLOR):
+        """用 color 标出 ranges 中的每个 [start, end)；同一 tag 再次调用会整体替换"""
+        self._selection.set_ranges(tag, ranges)
+        slots = self._highlight_items.setdefault(tag, [])
+        if self._highlight_colors.get(tag) != color:
+            self._highlight_colors[tag] = color
+            for item, _ in slots:
+                self.itemconfig(item, fill=color)
+        self._render_highlights()
+
+    def clear_highlight(self, tag):
+        self._selection.clear_ranges(tag)
+        self._render_highlights()
+
+    # ====================== 查找 ======================
+    def find(self, term, ignore_case=False, color=HIGHLIGHT_COLOR):
+        """高亮 term 的所有出现位置，返回匹配个数；term 为空时清除查找
+
+        匹配索引随之后的编辑增量更新，只绘制滚动窗口内可见的匹配。
+        连续输入查找词时（新词是旧词的延长）只核对旧匹配，不重扫全文。
+        """
+        if not term:
+            self.clear_find()
+            return 0
+        index = self._find_index
+        if index is not None and index.ignore_case == ignore_case and index.length \
+                and term.startswith(index.term):
+            index.refine(term, self._text)
+        else:
+            index = self._find_index = MatchIndex(term, self._text, ignore_case)
+        self.highlight(FIND_TAG, self._visible_matches(), color)
+        return len(index)
+
+    def find_next(self, backward=False):
+        """选中光标之后（backward 为真时是之前）的下一处匹配并滚动到它，到头后回绕
+
+        没有匹配时返回 False。
+        """
+        index = self._find_index
+        if index is None or not len(index):
+            return False
+        start, _ = self._selection.span()
+        pos = self._cursor_pos if start is None else start
+        found = index.prev_before(pos) if backward else index.next_after(pos)
+        self._selection.select(found, found + index.length)
+        self._scroll_to_cursor()
+        return True
+
+    def find_matches(self):
+        """当前查找的全部匹配 [(start, end), ...]"""
+        return list(self._find_index) if self._find_index is not None else []
+
+    def clear_find(self):
+        self._find_index = None
+        self.clear_highlight(FIND_TAG)
+
+    def _visible_matches(self):
+        """与当前滚动窗口重叠的匹配；只有这些匹配需要测量前缀宽度"""
+        if not self._text:
+            return ()
+        offset = -self._text_left
+        visible_w = self.winfo_width() - 2 * self.text_x
+        lo = max(0, self._first_index_past(offset) - 1)
+        hi = self._first_index_past(offset + visible_w) + 1
+        return self._find_index.between(lo, hi)
+
+    def _refresh_highlights(self):
+        """按当前滚动窗口重取可见的查找匹配，并重新摆放附加高亮"""
+        if self._find_index is not None:
+            self._selection.set_ranges(FIND_TAG, self._visible_matches())
+        if self._highlight_items:
+            self._render_highlights()
+
+    def _render_highlights(self):
+        """按当前滚动位置摆放附加区间，矩形在同一标签内循环复用，多出的隐藏"""
+        left = self.text_x + self._text_left
+        y1, y2 = self._selection_band()
+        below = self._selection_item if self._selection_item is not None else self.text_id
+        for tag, slots in self._highlight_items.items():
+            ranges = self._selection.ranges(tag)
+            for i, (start, end) in enumerate(ranges):
+                box = (left + self._prefix_width(start), y1, left + self._prefix_width(end), y2)
+                if i == len(slots):
+                    item = self.create_rectangle(box, fill=self._highlight_colors[tag],
+                                                 outline="", width=0)
+                    self.tag_lower(item, below)
+                    slots.append([item, box])
+                    continue
+                slot = slots[i]
+                if slot[1] != box:
+                    self.coords(slot[0], box)
+                    if slot[1] is None:
+                        self.itemconfig(slot[0], state="normal")
+                    slot[1] = box
+            for slot in slots[len(ranges):]:
+                if slot[1] is not None:
+                    slot[1] = None
+                    self.itemconfig(slot[0], state="hidden")
+
+    def _create_cursor(self):
+        if self.cursor is None:
+            self.cursor = PureCursor(
+                self, x=self.text_x, y=self.text_y + self.cursor_y_offset,
+                height=self._cursor_height, width=2, color=CURSOR_COLOR,
+                blink_speed=0 if self.remote else DEFAULT_CURSOR_BLINK_SPEED)
+            self.cursor.stop_blinking()
+            self.cursor.hide()
+
+    def _update_cursor(self):
+        if self.readonly:
+            return   # 只读模式没有光标
+        if self.cursor is None:
+            self._create_cursor()
+        cursor_x = self.text_x + self._prefix_width(self._cursor_pos) + self._text_left
+        cursor_y = self.text_y + self.cursor_y_offset
+        self.cursor.move(cursor_x, cursor_y)
+        if not self.remote:
+            # 远程模式下输入法位置只在获得焦点时同步，避免每次按键都发 XIM 请求
+            self._place_ime_window(cursor_x)
+
+    def _place_ime_window(self, x):
+        """让系统输入法的候选/组合窗口跟随光标"""
+        try:
+            self.tk.call("tk", "caret", self._w, "-x", int(x),
+                         "-y", self.text_y, "-height", self._linespace)
+        except tk.TclError:
+            pass
+
+    # ---------- 输入法预编辑 ----------
+    def set_preedit(self, text):
+        """在光标处显示预编辑串（带下划线的覆盖层）
+
+        只更新覆盖层的三个画布项，已提交文本项、光标前缀宽度和簇索引都不动，
+        高频的组合更新只需测量预编辑串本身。
+        """
+        if self.readonly:
+            return
+        if not text:
+            self.cancel_preedit()
+            return
+        if self.cursor is None:
+            self._create_cursor()
+        if self._preedit_items is None:
+            bg = self.create_rectangle(0, 0, 0, 0, fill=self.bg_color, outline="", width=0)
+            txt = self.create_text(0, 0, text="", anchor="nw", fill=self.text_color,
+                                   font=self._font)
+            line = self.create_line(0, 0, 0, 0, fill=self.text_color)
+            self._preedit_items = (bg, txt, line)
+        bg, txt, line = self._preedit_items
+        if self._preedit_x is None:
+            self._preedit_x = (self.text_x + self._prefix_width(self._cursor_pos)
+                               + self._text_left)
+            for item in self._preedit_items:
+                self.itemconfig(item, state="normal")
+                self.tag_raise(item)
+        if text == self._preedit:
+            return
+        self._preedit = text
+        x, y = self._preedit_x, self.text_y
+        width = self._font.measure(text)
+        bottom = y + self._linespace - 1
+        self.itemconfig(txt, text=text)
+        self.coords(txt, x, y)
+        self.coords(bg, x, y, x + width, y + self._linespace)
+        self.coords(line, x, bottom, x + width, bottom)
+        self.cursor.move(x + width, y + self.cursor_y_offset)
+        self.tag_raise(self.cursor.cursor_id)
+        self._place_ime_window(x + width)
+
+    def commit_preedit(self):
+        """把预编辑串作为普通输入提交"""
+        text = self._preedit
+        self.cancel_preedit()
+        if text:
+            self.insert(self._cursor_pos, text)
+
+    def cancel_preedit(self):
+        if self._preedit_x is None:
+            return
+        self._preedit = ""
+        self._preedit_x = None
+        for item in self._preedit_items:
+            self.itemconfig(item, state="hidden")
+        if self.cursor is not None:
+            self._update_cursor()
+
+    def _on_ime_start(self, event=None):
+        self._composing = True
+        self.cancel_preedit()
+
+    def _on_ime_end(self, event=None):
+        # 标记文本保持显示，直到输入法发出 Clear 并提交最终文本
+        self._composing = False
+
+    def _on_ime_backspace(self, event=None):
+        if self._preedit:
+            self.set_preedit(self._preedit[:-1])
+            return "break"
+        if self._cursor_pos > 0:
+            self.delete(self._clusters().prev(self._cursor_pos), self._cursor_pos)
+        return "break"
+
+    def _on_click(self, event):
+        if self.cursor is None:
+            self._create_cursor()
+        self._composing = False
+        self.cancel_preedit()
+        new_pos = self._get_char_index_at_x(event.x)
+        new_pos = max(0, min(new_pos, len(self._text)))
+        if new_pos != self._cursor_pos:
+            self._cursor_pos = new_pos
+            self._update_cursor()
+            self._scroll_to_cursor()
+        if not self._dragging_select:
+            self._clear_selection()
+        self._selection.anchor = self._cursor_pos
+        self._dragging_select = True
+        self.focus_set()
+
+    def _on_drag(self, event):
+        if not self._dragging_select:
+            return
+        new_pos = self._get_char_index_at_x(event.x)
+        if new_pos != self._cursor_pos:
+            # 锚点一侧的宽度已缓存，命中测试又测过新位置，这里不再有 measure
+            self._cursor_pos = new_pos
+            self._scroll_to_cursor()
+
+    def _on_release(self, event):
+        self._dragging_select = False
+        if not self._selection.active:
+            self._clear_selection()
+
+    def _on_key_press(self, event):
+        if self.cursor is None:
+            self._create_cursor()
+        first_key_after_focus_in = (self._cursor_pos == 0 and self._text_left == 0)
+        keysym = event.keysym
+        shift_pressed = (event.state & 0x0001) != 0
+        if self._composing:
+            # 组合期间的按键只进入预编辑覆盖层
+            if keysym == "BackSpace":
+                self.set_preedit(self._preedit[:-1])
+            elif event.char and event.char.isprintable():
+                self.set_preedit(self._preedit + event.char)
+            return "break"
+
+        if keysym == "BackSpace":
+            start, end = self._selection.span()
+            if start is not None and end is not None:
+                self._replace_text(start, end)
+                self._cursor_pos = start
+                self._clear_selection()
+                self._refresh_text_and_cursor()
+                return
+            if self._cursor_pos > 0:
+                # 退格删除整个字素簇，不会把 emoji 或组合字符拆开
+                prev_pos = self._clusters().prev(self._cursor_pos)
+                self._replace_text(prev_pos, self._cursor_pos)
+                self._cursor_pos = prev_pos
+                self._clamp_after_keys |= not first_key_after_focus_in
+        elif keysym == "Delete":
+            start, end = self._selection.span()
+            if start is not None and end is not None:
+                self._replace_text(start, end)
+                self._cursor_pos = start
+                self._clear_selection()
+                self._refresh_text_and_cursor()
+                return
+            if self._cursor_pos < len(self._text):
+                self._replace_text(self._cursor_pos, self._clusters().next(self._cursor_pos))
+                self._clamp_after_keys |= not first_key_after_focus_in
+        elif keysym == "Left":
+            if shift_pressed:
+                self._selection.begin()
+                self._cursor_pos = self._clusters().prev(self._cursor_pos)
+            else:
+                self._clear_selection()
+                self._cursor_pos = self._clusters().prev(self._cursor_pos)
+        elif keysym == "Right":
+            if shift_pressed:
+                self._selection.begin()
+                self._cursor_pos = self._clusters().next(self._cursor_pos)
+            else:
+                self._clear_selection()
+                self._cursor_pos = self._clusters().next(self._cursor_pos)
+        if keysym in REPEATABLE_KEYS:
+            # 按住不放时自动重复的事件只改文本和光标位置，不测量也不重绘；
+            # 同一批到达的多次编辑合并成一次重绘，松开按键时光标不会滞后
+            self._schedule_key_render()
+            return
+        if keysym == "Home":
+            if shift_pressed:
+                self._selection.begin()
+                self._cursor_pos = 0
+            else:
+                self._clear_selection()
+                self._cursor_pos = 0
+        elif keysym == "End":
+            if shift_pressed:
+                self._selection.begin()
+                self._cursor_pos = len(self._text)
+            else:
+                self._clear_selection()
+                self._cursor_pos = len(self._text)
+        elif event.char and event.char.isprintable():
+            char = event.char
+            if self.max_length is not None:
+                # 输入法一次提交的可能是多个字符
+                remaining = self.max_length - len(self._text)
+                if remaining <= 0:
+                    return
+                char = char[:remaining]
+            if self._selection.active:
+                start, end = self._selection.span()
+                self._replace_text(start, end)
+                self._cursor_pos = start
+                self._clear_selection()
+            self._replace_text(self._cursor_pos, self._cursor_pos, char)
+            self._cursor_pos += len(char)
+            if self.remote:
+                # 远程模式下普通输入也合并到帧，快速打字时每帧只发一批绘制请求
+                self._clamp_after_keys |= not first_key_after_focus_in
+                self._schedule_key_render()
+                return
+            if not first_key_after_focus_in:
+                self._clamp_text_left()
+        else:
+            return
+        self._refresh_text_and_cursor()
+
+    def _schedule_key_render(self):
+        """按键编辑后立即写回变量，重绘推迟合并
+
+        本地显示用 after_idle：事件队列中积压的重复按键处理完后重绘一次，
+        单次按键不额外等待一帧；远程模式按帧合并，进一步减少请求。
+        """
+        self._sync_var()
+        if self.remote:
+            request_frame(self, "key_edits", self._render_key_edits)
+        elif self._key_render_id is None:
+            self._key_render_id = self.after_idle(self._render_key_edits)
+
+    def _render_key_edits(self):
+        """累积的按键编辑：一次收紧滚动偏移，一次重绘"""
+        self._key_render_id = None
+        if self._clamp_after_keys:
+            self._clamp_after_keys = False
+            self._clamp_text_left()
+        self._refresh_text_and_cursor()
+
+    def _clamp_text_left(self):
+        """删除或输入后文本变短时，收回右侧多出的空白"""
+        min_left = min(0, self.winfo_width() - 2 * self.text_x - self._text_width())
+        self._set_text_left(max(min_left, min(0, self._text_left)))
+
+    def _on_copy(self, event):
+        start, end = self._selection.span()
+        if start is None or start == end:
+            return "break"
+        if self._windowingsystem == "x11":
+            # 只记下对当前（不可变）文本的引用和范围，粘贴方请求时再分块提供
+            self._clip = (self._text, start, end)
+            self.tk.call("selection", "own", "-selection", "CLIPBOARD",
+                         "-command", self._clipboard_lost_cmd, self._w)
+        else:
+            # Windows/macOS 的剪贴板不支持按需提供，只能一次写入
+            self.clipboard_clear()
+            self.clipboard_append(self._text[start:end])
+        return "break"
+
+    def _on_cut(self, event):
+        start, end = self._selection.span()
+        if start is None or start == end:
+            return "break"
+        self._on_copy(event)
+        self.delete(start, end)
+        return "break"
+
+    def _serve_clipboard(self, offset, length):
+        if self._clip is None:
+            return ""
+        text, start, end = self._clip
+        offset = start + int(offset)
+        return text[offset:min(end, offset + int(length))]
+
+    def _on_clipboard_lost(self):
+        self._clip = None
+
+    def _serve_primary(self, offset, length):
+        if self._primary_clip is not None:
+            text, start, end = self._primary_clip
+        else:
+            text = self._text
+            start, end = self._selection.span()
+            if start is None or start == end:
+                return ""
+        offset = start + int(offset)
+        return text[offset:min(end, offset + int(length))]
+
+    def _own_primary(self):
+        self._primary_clip = None   # 新选区取代失去焦点时的快照
+        if self._owns_primary or self.readonly:
+            return   # 只读模式没有注册 PRIMARY 的取数回调
+        self._owns_primary = True
+        try:
+            self.tk.call("selection", "own", "-selection", "PRIMARY",
+                         "-command", self._primary_lost_cmd, self._w)
+        except tk.TclError:
+            self._owns_primary = False
+
+    def _disown_primary(self):
+        self._primary_clip = None
+        if not self._owns_primary:
+            return
+        self._owns_primary = False
+        try:
+            self.tk.call("selection", "clear", "-displayof", self._w, "-selection", "PRIMARY")
+        except tk.TclError:
+            pass
+
+    def _on_primary_lost(self):
+        self._owns_primary = False
+        self._primary_clip = None
+
+    def _on_middle_click(self, event):
+        try:
+            text = self.selection_get(selection="PRIMARY")
+        except tk.TclError:
+            return "break"
+        text = text.replace('\n', ' ').replace('\r', '')
+        if not text:
+            return "break"
+        if self.max_length is not None:
+            text = text[:max(0, self.max_length - len(self._text))]
+        self.focus_set()
+        self._clear_selection()
+        self.insert(self._get_char_index_at_x(event.x), text)
+        return "break"
+
+    def _select_all(self, event):
+        self._selection.select(0, len(self._text))
+        self._refresh_text_and_cursor()
+        return "break"
+
+    def _on_paste(self, event):
+        try:
+            clipboard_text = self.clipboard_get()
+        except tk.TclError:
+            return
+        if not clipboard_text:
+            return
+        clipboard_text = clipboard_text.replace('\n', ' ').replace('\r', '')
+        if self.max_length is not None:
+            current_length = len(self._text)
+            remaining = self.max_length - current_length
+            if remaining <= 0:
+                return
+            if len(clipboard_text) > remaining:
+                clipboard_text = clipboard_text[:remaining]
+        if self._selection.active:
+            start, end = self._selection.span()
+            self._replace_text(start, end)
+            self._cursor_pos = start
+            self._clear_selection()
+        self.insert(self._cursor_pos, clipboard_text)
+        return "break"
+
+    def _on_focus_in(self, event=None):
+        if self.cursor is None:
+            self._create_cursor()
+        manager = get_focus_manager(self)
+        active = manager.active
+        if active is not None and active is not self and active.cursor:
+            active.cursor.stop_blinking()
+            active.cursor.hide()
+            active._keep_primary()
+            active._clear_selection()
+        manager.active = self
+        self.cursor.show()
+        self.cursor.start_blinking()
+        if self.remote:
+            self._place_ime_window(self.cursor.x)
+        self._redraw_rect(self.winfo_width(), self.winfo_height(), focus=True)
+        self._update_selection_visual()
+
+    def _on_focus_out(self, event=None):
+        # 下面会把光标移回开头，先记下选区
+        self._keep_primary()
+        manager = get_focus_manager(self)
+        if manager.active is self:
+            if self.cursor:
+                self.cursor.stop_blinking()
+                self.cursor.hide()
+            manager.active = None
+        self._composing = False
+        self.cancel_preedit()
+        self._cursor_pos = 0
+        self._set_text_left(0)
+        if self.cursor is None:
+            self._create_cursor()
+        cursor_x = self.text_x + self._prefix_width(self._cursor_pos) + self._text_left
+        cursor_y = self.text_y + self.cursor_y_offset
+        self.cursor.move(cursor_x, cursor_y)
+        self._redraw_rect(self.winfo_width(), self.winfo_height(), focus=False)
+        self._clear_selection()
+
+    def _get_char_index_at_x(self, x):
+        click_x_text = x - (self.text_x + self._text_left)
+        if not self._text:
+            return 0
+        left = self._first_index_past(click_x_text)
+        # 落在簇内部时取离点击位置更近的簇边界，光标不会停在 emoji 中间
+        clusters = self._clusters()
+        right = clusters.ceil(left)
+        left = clusters.prev(right)
+        if right > 0:
+            prev_width = self._prefix_width(left)
+            curr_width = self._prefix_width(right)
+            if abs(click_x_text - prev_width) < abs(click_x_text - curr_width):
+                return left
+        return right
+
+    def _first_index_past(self, offset):
+        """第一个前缀宽度超过 offset 的下标，没有时为文本长度（二分，宽度走缓存）"""
+        left, right = 0, len(self._text)
+        while left < right:
+            mid = (left + right) // 2
+            if self._prefix_width(mid) <= offset:
+                left = mid + 1
+            else:
+                right = mid
+        return left
+
+    def _scroll_to_cursor(self):
+        if not self._text:
+            self._set_text_left(0)
+            if self.cursor:
+                self._update_cursor()
+            self._refresh_highlights()
+            return
+        cursor_rel_x = self._prefix_width(self._cursor_pos)
+        visible_w = self.winfo_width() - 2 * self.text_x
+        text_width = self._text_width()
+        cursor_width = self.cursor.width if self.cursor else 1
+        left = self._text_left
+        if text_width <= visible_w:
+            left = 0
+        else:
+            cursor_left = cursor_rel_x + left
+            cursor_right = cursor_left + cursor_width
+            if cursor_left < 0:
+                left = -cursor_rel_x
+            elif cursor_right > visible_w:
+                left = -(cursor_rel_x + cursor_width - visible_w)
+            min_left = min(0, visible_w - text_width)
+            max_left = 0
+            left = max(min_left, min(max_left, left))
+        self._set_text_left(left)
+        self._update_cursor()
+        self._update_selection_visual()
+        
+    def _set_text_left(self, left):
+        """水平滚动偏移的唯一入口：移动文本项，偏移变化时附加高亮跟着重新摆放"""
+        changed = left != self._text_left
+        self._text_left = left
+        self.coords(self.text_id, self.text_x + left, self.text_y)
+        if changed:
+            self._refresh_highlights()
+
+    def _prefix_width(self, index):
+        """text[:index] 的像素宽度；同一文本和字体下每个前缀只测量一次"""
+        if self._prefix_text is not self._text:
+            self._prefix_text = self._text
+            self._prefix_widths = {}
+        width = self._prefix_widths.get(index)
+        if width is None:
+            width = self._prefix_widths[index] = self._font.measure(self._text[:index])
+        return width
+
+    def _text_width(self):
+        """整段文本宽度，文本不变时复用上次测量"""
+        return self._prefix_width(len(self._text))
+
+    def _on_scaling_changed(self, factor):
+        """缩放系数变化：按基准尺寸重建几何、字体度量和宽度缓存，每次变化只做一次"""
+        scaling = get_scaling(self)
+        base_w, base_h, base_r = self._base_geometry
+        self._radius = scaling.scaled(base_r)
+        self.text_x = scaling.scaled(TEXT_PADDING_X)
+        self._cursor_height = scaling.scaled(DEFAULT_CURSOR_HEIGHT)
+        # 已创建的磅值字体不会跟随新的 tk scaling，重设一次字号让 Tk 重新换算
+        self._font.configure(size=self._font.cget("size"))
+        self._linespace = self._font.metrics("linespace")
+        self.cursor_y_offset = max(0, (self._linespace - self._cursor_height) // 2)
+        self._prefix_text = None
+        self._rect_size = None
+        self._corner_key = None
+        if self.fixed_size:
+            w, h = scaling.scaled(base_w), scaling.scaled(base_h)
+            tk.Canvas.configure(self, width=w, height=h)
+        else:
+            w, h = self.winfo_width(), self.winfo_height()
+        self._pending_size = (w, h)
+        self._apply_resize()
+
+    def _on_resize(self, event):
+        if self.fixed_size:
+            return
+        # 拖动窗口边缘时 Configure 成串到来，只在下一帧按最新尺寸布局一次
+        self._pending_size = (event.width, event.height)
+        request_frame(self, "resize", self._apply_resize)
+
+    def _apply_resize(self):
+        if self._pending_size is None:
+            return
+        w, h = self._pending_size
+        self._pending_size = None
+        if (w, h) == self._rect_size:
+            return
+
+        self._redraw_rect(w, h, focus=(self.focus_get() == self))
+        font_height = self._linespace
+        self.text_y = (h - font_height) // 2
+        scaling = get_scaling(self)
+        cursor_h = max(scaling.scaled(MIN_CURSOR_HEIGHT),
+                       font_height - scaling.scaled(CURSOR_VERTICAL_OFFSET_REDUCTION))
+        if self.cursor:
+            self.cursor.set_height(cursor_h)
+
+        text_width = self._text_width()
+        visible_w = w - 2 * self.text_x
+        self._set_text_left(visible_w - text_width if text_width > visible_w else 0)
+        if not self.readonly:
+            # 只读模式没有光标
+            self._cursor_pos = len(self._text)
+            self._update_cursor()
+        # 可见宽度和文本行的位置都变了，选区和高亮按新布局重摆
+        self._update_selection_visual()
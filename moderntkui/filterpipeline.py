@@ -0,0 +1,204 @@
+# filterpipeline.py - 边输入边过滤的大数据管线
+import threading
+import time
+from array import array
+from .dispatcher import get_dispatcher
+
+# ====================== 常量定义 ======================
+DEFAULT_FRAME_BUDGET = 8     # 毫秒，每帧用于扫描的时间
+CHECK_EVERY = 1024           # 每扫描多少项检查一次时间
+
+
+# ====================== FilterPipeline ======================
+class FilterPipeline:
+    """子串过滤管线
+
+    - 新查询包含上一次的查询时（继续输入），只在上次结果里收窄，
+      上次没扫完的部分接着扫；
+    - 扫描按每帧时间预算分块，或放到工作线程里；
+    - 新输入会取消过期查询，部分结果通过 callback(result, done) 流式送出。
+    """
+    def __init__(self, widget, source, callback, frame_budget=DEFAULT_FRAME_BUDGET,
+                 use_thread=False, ignore_case=False):
+        self.widget = widget
+        self.callback = callback
+        self.frame_budget = frame_budget / 1000.0
+        self.use_thread = use_thread
+        self.ignore_case = ignore_case
+        self.query = ""
+        self.result = None    # array('q')，None 表示未过滤
+        self.done = True
+        self._generation = 0
+        self._job = None
+        self._var = None
+        self._var_trace = None
+        self._hay = None
+        self.set_source(source)
+
+    # ---------- 数据源 ----------
+    def set_source(self, source, result=None):
+        """数据源整体替换或发生删除/插入后调用，丢弃所有缓存
+
+        result 为调用方已按新数据源重映射好的当前结果时直接接管，不重新扫描。
+        """
+        self.cancel()
+        self.source = source
+        self._folded = None
+        self._candidates = None
+        self._cand_pos = 0
+        self._tail_pos = len(source)
+        self.done = True
+        if result is not None and self.query:
+            self.result = result
+            return
+        self._tail_pos = 0
+        self.result = None
+        query, self.query = self.query, ""
+        if query:
+            self.update(query)
+
+    def source_appended(self):
+        """数据源只在末尾追加后调用：空闲时直接扫描新增部分，扫描中则由后续分块覆盖"""
+        if self.running or not self.query:
+            return
+        hay = self._haystack()
+        query = self.query
+        self.result.extend(i for i in range(self._tail_pos, len(hay)) if query in hay[i])
+        self._tail_pos = len(hay)
+
+    def _haystack(self):
+        if not self.ignore_case:
+            return self.source
+        if self._folded is None:
+            self._folded = []
+        if len(self._folded) < len(self.source):
+            # 数据源只追加时增量折叠
+            self._folded.extend(s.casefold() for s in self.source[len(self._folded):])
+        return self._folded
+
+    # ---------- 查询 ----------
+    def bind_variable(self, var):
+        """跟随 tk.StringVar（例如 ModernEntry 的 textvariable）的变化"""
+        self.unbind_variable()
+        self._var = var
+        self._var_trace = var.trace_add("write", lambda *args: self.update(var.get()))
+
+    def unbind_variable(self):
+        if self._var_trace is not None:
+            self._var.trace_remove("write", self._var_trace)
+            self._var = None
+            self._var_trace = None
+
+    def update(self, query):
+        if self.ignore_case:
+            query = query.casefold()
+        if query == self.query:
+            return
+        narrowing = bool(self.query) and self.query in query and self.result is not None
+        self.cancel()
+        self._generation += 1
+        if not query:
+            self.query = ""
+            self.result = None
+            self.done = True
+            self.callback(None, True)
+            return
+        if narrowing:
+            # 单调收窄：上次的结果 + 上次尚未检查的候选，再接上没扫到的尾部
+            pending = self._candidates[self._cand_pos:] if self._candidates is not None else ()
+            candidates = array("q", self.result)
+            candidates.extend(pending)
+            tail_pos = self._tail_pos
+        else:
+            candidates = None
+            tail_pos = 0
+        self.query = query
+        self.result = array("q")
+        self.done = False
+        self._candidates = candidates
+        self._cand_pos = 0
+        self._tail_pos = tail_pos
+        if self.use_thread:
+            self._start_thread()
+        else:
+            self._job = self.widget.after_idle(self._step, self._generation)
+
+    def cancel(self):
+        self._generation += 1
+        if self._job is not None:
+            try:
+                self.widget.after_cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+
+    @property
+    def running(self):
+        return not self.done
+
+    # ---------- 分块扫描（Tk 线程） ----------
+    def _scan(self, generation, query, cands, deadline, state, out):
+        """从 state=[候选位置, 尾部位置] 继续扫描直到超过 deadline；返回是否扫完"""
+        hay = self._haystack() if not self.use_thread else self._hay
+        clock = time.perf_counter
+        if cands is not None:
+            pos, n = state[0], len(cands)
+            while pos < n:
+                stop = min(n, pos + CHECK_EVERY)
+                out.extend(i for i in cands[pos:stop] if query in hay[i])
+                pos = stop
+                if clock() >= deadline or generation != self._generation:
+                    state[0] = pos
+                    return False
+            state[0] = pos
+        pos, n = state[1], len(hay)
+        while pos < n:
+            stop = min(n, pos + CHECK_EVERY)
+            out.extend(i for i in range(pos, stop) if query in hay[i])
+            pos = stop
+            if clock() >= deadline or generation != self._generation:
+                state[1] = pos
+                return False
+        state[1] = pos
+        return True
+
+    def _step(self, generation):
+        self._job = None
+        if generation != self._generation:
+            return
+        state = [self._cand_pos, self._tail_pos]
+        finished = self._scan(generation, self.query, self._candidates,
+                              time.perf_counter() + self.frame_budget, state, self.result)
+        self._cand_pos, self._tail_pos = state
+        self.done = finished
+        self.callback(self.result, finished)
+        if not finished:
+            self._job = self.widget.after(1, self._step, generation)
+
+    # ---------- 工作线程扫描 ----------
+    def _start_thread(self):
+        generation = self._generation
+        query = self.query
+        cands = self._candidates
+        self._hay = self._haystack()  # 在 Tk 线程中准备好折叠副本
+        dispatcher = get_dispatcher(self.widget)
+        state = [self._cand_pos, self._tail_pos]
+
+        def worker():
+            finished = False
+            while not finished and generation == self._generation:
+                chunk = array("q")
+                finished = self._scan(generation, query, cands,
+                                      time.perf_counter() + self.frame_budget, state, chunk)
+                dispatcher.post(self._deliver, generation, chunk, tuple(state), finished)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _deliver(self, generation, chunk, state, finished):
+        # 位置只随已送达的结果推进，收窄时不会漏掉队列中的匹配
+        if generation != self._generation:
+            return
+        self.result.extend(chunk)
+        self._cand_pos, self._tail_pos = state
+        self.done = finished
+        self.callback(self.result, finished)
@@ -0,0 +1,140 @@
+# focusmanager.py - 每个顶层窗口一个的焦点管理器
+import weakref
+
+
+# ====================== FocusManager ======================
+class FocusManager:
+    """按注册顺序维护可聚焦控件的双向链表
+
+    节点只持有控件的弱引用，next/prev/注销都是 O(1)；
+    控件销毁后自动移出链表，不会因为焦点顺序而无法回收。
+    """
+    def __init__(self, toplevel):
+        self._toplevel = weakref.ref(toplevel)
+        self._nodes = {}      # key -> [prev_key, next_key, weakref]
+        self._head = None
+        self._tail = None
+        self._active = None   # 当前显示光标的控件（弱引用）
+        self_ref = weakref.ref(self)
+
+        def _on_tab(event, step=1):
+            manager = self_ref()
+            return manager._traverse(event, step) if manager is not None else None
+        toplevel.bind("<Tab>", _on_tab, add="+")
+        toplevel.bind("<Shift-Tab>", lambda e: _on_tab(e, -1), add="+")
+        toplevel.bind("<ISO_Left_Tab>", lambda e: _on_tab(e, -1), add="+")
+
+    def __len__(self):
+        return len(self._nodes)
+
+    # ---------- 注册 ----------
+    def register(self, widget):
+        key = id(widget)
+        if key in self._nodes:
+            return
+        self_ref = weakref.ref(self)
+
+        def _gone(ref, key=key):
+            manager = self_ref()
+            if manager is not None:
+                manager._remove(key)
+        self._nodes[key] = [self._tail, None, weakref.ref(widget, _gone)]
+        if self._tail is not None:
+            self._nodes[self._tail][1] = key
+        else:
+            self._head = key
+        self._tail = key
+        widget.bind("<Destroy>", lambda e, key=key: _gone(None, key), add="+")
+
+    def unregister(self, widget):
+        self._remove(id(widget))
+
+    def _remove(self, key):
+        node = self._nodes.pop(key, None)
+        if node is None:
+            return
+        prev_key, next_key, ref = node
+        if prev_key is not None:
+            self._nodes[prev_key][1] = next_key
+        else:
+            self._head = next_key
+        if next_key is not None:
+            self._nodes[next_key][0] = prev_key
+        else:
+            self._tail = prev_key
+        if self._active is ref:
+            self._active = None
+
+    # ---------- 查询 ----------
+    def _widget(self, key):
+        return self._nodes[key][2]() if key is not None else None
+
+    def first(self):
+        return self._widget(self._head)
+
+    def last(self):
+        return self._widget(self._tail)
+
+    def next(self, widget, step=1):
+        """widget 之后（step=-1 时之前）第一个可聚焦的控件，首尾相接"""
+        if not self._nodes:
+            return None
+        key = id(widget)
+        if key not in self._nodes:
+            return self.first() if step > 0 else self.last()
+        for _ in range(len(self._nodes)):
+            key = self._nodes[key][1 if step > 0 else 0]
+            if key is None:
+                key = self._head if step > 0 else self._tail
+            candidate = self._widget(key)
+            if candidate is not None and _can_focus(candidate):
+                return candidate
+        return None
+
+    def prev(self, widget):
+        return self.next(widget, -1)
+
+    # ---------- 活动控件 ----------
+    @property
+    def active(self):
+        return self._active() if self._active is not None else None
+
+    @active.setter
+    def active(self, widget):
+        if widget is None:
+            self._active = None
+        else:
+            node = self._nodes.get(id(widget))
+            self._active = node[2] if node is not None else weakref.ref(widget)
+
+    # ---------- Tab 遍历 ----------
+    def _traverse(self, event, step):
+        focused = event.widget.focus_get()
+        if focused is None or id(focused) not in self._nodes:
+            # 焦点在普通控件上：不拦截，交给 Tk 默认的 tk_focusNext/tk_focusPrev
+            return None
+        if id(focused) == (self._tail if step > 0 else self._head):
+            # 走到链表一端时同样交还给 Tk，让焦点能离开工具包控件去往普通控件
+            return None
+        target = self.next(focused, step)
+        if target is None:
+            return None
+        target.focus_set()
+        return "break"
+
+
+def _can_focus(widget):
+    try:
+        return widget.winfo_viewable() and getattr(widget, "enabled", True)
+    except Exception:
+        return False
+
+
+def get_focus_manager(widget):
+    """获取控件所在顶层窗口的焦点管理器"""
+    toplevel = widget.winfo_toplevel()
+    manager = getattr(toplevel, "_modern_focus_manager", None)
+    if manager is None:
+        manager = FocusManager(toplevel)
+        toplevel._modern_focus_manager = manager
+    return manager
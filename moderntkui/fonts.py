@@ -0,0 +1,18 @@
+# fonts.py - 字体创建与默认字体解析（导入时不触发任何 Tk 操作）
+
+
+def default_family(widget):
+    """TkDefaultFont 的实际字体族，每个 Tk 解释器只解析一次"""
+    root = widget._root()
+    family = getattr(root, "_modern_default_family", None)
+    if family is None:
+        import tkinter.font as tkfont
+        family = tkfont.Font(root=root, name="TkDefaultFont", exists=True).actual()["family"]
+        root._modern_default_family = family
+    return family
+
+
+def make_font(family, size, **options):
+    """创建 tkinter.font.Font；tkinter.font 推迟到第一次创建控件时才导入"""
+    import tkinter.font as tkfont
+    return tkfont.Font(family=family, size=size, **options)
@@ -0,0 +1,54 @@
+# geometry.py - 圆角矩形路径，按参数缓存供各控件共用
+import math
+from functools import lru_cache
+
+
+def rounded_rect_points(x1, y1, x2, y2, r):
+    """供 smooth=True 多边形使用的圆角矩形控制点"""
+    return (
+        x1 + r, y1, x2 - r, y1, x2, y1, x2, y1 + r, x2, y2 - r, x2, y2,
+        x2 - r, y2, x1 + r, y2, x1, y2, x1, y2 - r, x1, y1 + r, x1, y1
+    )
+
+
+@lru_cache(maxsize=256)
+def rounded_rect_geometry(w, h, radius):
+    """按 (w, h, radius) 缓存输入框背景和边框的顶点"""
+    return rounded_rect_points(0, 0, w - 1, h - 1, min(h // 2, radius))
+
+
+@lru_cache(maxsize=256)
+def sprite_border_geometry(w, h, corner):
+    """图片边框模式下四条边线和两块填充矩形的坐标"""
+    c = corner
+    edges = ((c, 0, w - c, 0), (c, h - 1, w - c, h - 1),
+             (0, c, 0, h - c), (w - 1, c, w - 1, h - c))
+    fills = ((1, c, w - 1, h - c), (c, 1, w - c, h - 1))
+    anchors = (("nw", 0, 0), ("ne", w, 0), ("sw", 0, h), ("se", w, h))
+    return edges, fills, anchors
+
+
+def arc_points(cx, cy, radius, start_angle, end_angle, segments=8):
+    """圆弧上等分的点"""
+    points = []
+    for i in range(segments + 1):
+        angle = start_angle + (end_angle - start_angle) * i / segments
+        points.extend([cx + radius * math.cos(angle), cy + radius * math.sin(angle)])
+    return points
+
+
+@lru_cache(maxsize=256)
+def arc_rect_points(x1, y1, x2, y2, radius, segments=8):
+    """按钮面板的圆弧路径：四段圆弧由直边相连"""
+    top, bottom = y1 + radius, y2 - radius
+    left, right = x1 + radius, x2 - radius
+    points = [x1, top]
+    points.extend(arc_points(left, top, radius, math.pi, math.pi * 1.5, segments))
+    points.extend([right, y1])
+    points.extend(arc_points(right, top, radius, math.pi * 1.5, math.pi * 2, segments))
+    points.extend([x2, bottom])
+    points.extend(arc_points(right, bottom, radius, 0, math.pi * 0.5, segments))
+    points.extend([left, y2])
+    points.extend(arc_points(left, bottom, radius, math.pi * 0.5, math.pi, segments))
+    points.extend([x1, top])
+    return tuple(points)
@@ -0,0 +1,118 @@
+# graphemes.py - 字素簇（用户感知字符）切分与增量索引
+import unicodedata
+
+# ====================== 常量定义 ======================
+ZWJ = "‍"
+CR, LF = "\r", "\n"
+RI_FIRST, RI_LAST = 0x1F1E6, 0x1F1FF          # 区域指示符（国旗）
+EMOJI_MODIFIER_FIRST, EMOJI_MODIFIER_LAST = 0x1F3FB, 0x1F3FF
+TAG_FIRST, TAG_LAST = 0xE0020, 0xE007F
+
+
+def _is_extend(ch):
+    """不在其前面断开的字符：组合符、ZWJ、变体选择符、肤色修饰符、标签字符"""
+    if ch == ZWJ:
+        return True
+    cp = ord(ch)
+    if EMOJI_MODIFIER_FIRST <= cp <= EMOJI_MODIFIER_LAST or TAG_FIRST <= cp <= TAG_LAST:
+        return True
+    return unicodedata.category(ch) in ("Mn", "Me", "Mc")
+
+
+def _is_pictographic(ch):
+    cp = ord(ch)
+    return cp >= 0x1F000 or 0x2600 <= cp <= 0x27BF or 0x2300 <= cp <= 0x23FF
+
+
+def _is_ri(ch):
+    return RI_FIRST <= ord(ch) <= RI_LAST
+
+
+def segment(text):
+    """返回长度 len(text)+1 的 bytearray，flags[i]==1 表示 i 处是簇边界
+
+    近似 UAX #29 的扩展字素簇规则，覆盖组合符、emoji ZWJ 序列、
+    变体选择符、肤色修饰符和国旗。
+    """
+    n = len(text)
+    flags = bytearray(n + 1)
+    flags[0] = 1
+    flags[n] = 1
+    ri_run = 0
+    for i in range(1, n):
+        a, b = text[i - 1], text[i]
+        ri_run = ri_run + 1 if _is_ri(a) else 0
+        if a == CR and b == LF:
+            continue
+        if _is_extend(b):
+            continue
+        if a == ZWJ and _is_pictographic(b):
+            continue
+        if _is_ri(a) and _is_ri(b) and ri_run % 2 == 1:
+            continue
+        flags[i] = 1
+    return flags
+
+
+# ====================== GraphemeIndex ======================
+class GraphemeIndex:
+    """按编辑区域增量维护的簇边界
+
+    边界存成与文本等长的标志字节串，插入删除只是一次 memmove，
+    前后跳转用 find/rfind 在 C 层扫描，单次按键的代价与簇长度相关而与全文无关。
+    """
+    def __init__(self, text=""):
+        self.reset(text)
+
+    def reset(self, text):
+        self.text = text
+        self._flags = segment(text)
+
+    def replace(self, start, end, new_text):
+        """文本中 [start, end) 被替换后更新索引，new_text 是替换后的完整文本"""
+        old_flags = self._flags
+        delta = len(new_text) - len(self.text)
+        # 重新切分的窗口：向前多退一个簇并跨过整段国旗序列，向后多进一个簇
+        ws = old_flags.rfind(1, 0, start + 1)
+        ws = old_flags.rfind(1, 0, ws) if ws > 0 else 0
+        while ws > 0 and _is_ri(self.text[ws - 1]):
+            ws = old_flags.rfind(1, 0, ws)
+        old_len = len(self.text)
+        we = old_flags.find(1, end)
+        if we < old_len:
+            we = old_flags.find(1, we + 1)
+        # 删改一个区域指示符会改变其后整段国旗的配对，窗口要覆盖到序列结束
+        while we < old_len and _is_ri(self.text[we]):
+            we = old_flags.find(1, we + 1)
+        window = segment(new_text[ws:we + delta])
+        self._flags[ws:we + 1] = window
+        self.text = new_text
+
+    def ensure(self, text):
+        if text is not self.text:
+            self.reset(text)
+
+    # ---------- 查询 ----------
+    def next(self, pos):
+        """pos 之后的下一个边界"""
+        if pos >= len(self.text):
+            return len(self.text)
+        return self._flags.find(1, pos + 1)
+
+    def prev(self, pos):
+        """pos 之前的上一个边界"""
+        if pos <= 0:
+            return 0
+        return self._flags.rfind(1, 0, pos)
+
+    def is_boundary(self, pos):
+        return 0 <= pos <= len(self.text) and self._flags[pos] == 1
+
+    def floor(self, pos):
+        """不大于 pos 的最近边界"""
+        pos = max(0, min(pos, len(self.text)))
+        return self._flags.rfind(1, 0, pos + 1)
+
+    def ceil(self, pos):
+        pos = max(0, min(pos, len(self.text)))
+        return self._flags.find(1, pos)
@@ -0,0 +1,313 @@
+# listbox.py - ModernList 虚拟化列表
+import bisect
+import tkinter as tk
+from array import array
+from .animation import get_clock, request_frame
+from .dispatcher import get_dispatcher
+from .filterpipeline import FilterPipeline
+from .fonts import make_font
+from .theme import (LIST_BG_COLOR, BORDER_NORMAL_COLOR, TEXT_COLOR,
+                    SELECT_BG_COLOR, SELECT_TEXT_COLOR, LIST_FONT_FAMILY, LIST_FONT_SIZE)
+
+# ====================== 常量定义 ======================
+DEFAULT_WIDTH = 240
+DEFAULT_HEIGHT = 200
+DEFAULT_RADIUS = 8
+ROW_PADDING_Y = 6
+TEXT_PADDING_X = 12
+WHEEL_ROWS = 3
+
+
+# ====================== ModernList ======================
+class ModernList(tk.Canvas):
+    """虚拟化列表：数据只存在后备列表里，画布项只为可见行创建并循环复用"""
+    def __init__(self, master, width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT,
+                 radius=DEFAULT_RADIUS, bg_color=LIST_BG_COLOR, border_color=BORDER_NORMAL_COLOR,
+                 text_color=TEXT_COLOR, select_bg=SELECT_BG_COLOR,
+                 select_fg=SELECT_TEXT_COLOR, font_family=LIST_FONT_FAMILY,
+                 font_size=LIST_FONT_SIZE, yscrollcommand=None, **kwargs):
+        super().__init__(master, width=width, height=height,
+                         highlightthickness=0, bd=0, bg=bg_color, **kwargs)
+        get_dispatcher(self)
+        self.bg_color = bg_color
+        self.border_color = border_color
+        self.text_color = text_color
+        self.select_bg = select_bg
+        self.select_fg = select_fg
+        self.yscrollcommand = yscrollcommand
+        self._radius = radius
+        self._font = make_font(font_family, font_size)
+        self.row_height = self._font.metrics("linespace") + ROW_PADDING_Y
+
+        self._items = []          # 后备数据
+        self._view = None         # 过滤后的数据下标（array），None 表示全部
+        self._top = 0             # 滚动偏移（像素）
+        self._selected = None     # 选中项的数据下标
+        self._filter_query = ""
+        self._pipeline = FilterPipeline(self, self._items, self._on_filter_result)
+        self._dirty = True        # 数据或选中变化，需要刷新行文本
+
+        # 行项池：每个槽位 [背景矩形, 文本, 当前显示的行号]
+        self._slots = []
+        self._outline = None
+        self._width = width
+        self._height = height
+        self._resize_pool(height)
+        self._draw_outline(width, height)
+
+        self.bind("<Configure>", self._on_resize)
+        self.bind("<Button-1>", self._on_click)
+        self.bind("<MouseWheel>", self._on_wheel)
+        self.bind("<Button-4>", lambda e: self.scroll_rows(-WHEEL_ROWS))
+        self.bind("<Button-5>", lambda e: self.scroll_rows(WHEEL_ROWS))
+
+    # ---------- 数据接口（兼容 Listbox 的常用部分） ----------
+    def size(self):
+        return len(self._items) if self._view is None else len(self._view)
+
+    def _data_index(self, idx):
+        """视图下标 -> 数据下标"""
+        return idx if self._view is None else self._view[idx]
+
+    def _fix_index(self, idx, for_insert=False):
+        """与 Listbox 一致："end" 取数、选中、滚动时指最后一行，插入时指末尾之后"""
+        if idx in (tk.END, "end"):
+            return self.size() if for_insert else self.size() - 1
+        return int(idx)
+
+    def append(self, text):
+        """O(1) 追加"""
+        self._items.append(text)
+        # self._view 与管线结果是同一个数组，由管线增量更新
+        self._pipeline.source_appended()
+        self._schedule_render()
+
+    def extend(self, texts):
+        self._items.extend(texts)
+        self._pipeline.source_appended()
+        self._schedule_render()
+
+    def insert(self, idx, text):
+        if self._fix_index(idx, for_insert=True) >= self.size():
+            self.append(text)
+            return
+        pos = self._data_index(self._fix_index(idx))
+        self._items.insert(pos, text)
+        if self._selected is not None and self._selected >= pos:
+            self._selected += 1
+        self._refilter()
+
+    def get(self, first, last=None):
+        if last is None:
+            return self._items[self._data_index(self._fix_index(first))]
+        first, last = self._fix_index(first), min(self._fix_index(last), self.size() - 1)
+        return tuple(self._items[self._data_index(i)] for i in range(first, last + 1))
+
+    def delete(self, first, last=None):
+        """删除视图中的 first..last（含），与 Listbox 语义一致"""
+        if self.size() == 0:
+            return
+        first = min(self._fix_index(first), self.size() - 1)
+        last = first if last is None else min(self._fix_index(last), self.size() - 1)
+        if first == 0 and last >= self.size() - 1 and self._view is None:
+            self.clear()
+            return
+        self.delete_many(self._data_index(i) for i in range(first, last + 1))
+
+    def delete_many(self, data_indices):
+        """批量删除数据下标，单次 O(n) 重建"""
+        removed = sorted(set(data_indices))
+        if not removed:
+            return
+        removed_set = set(removed)
+        self._items = [t for i, t in enumerate(self._items) if i not in removed_set]
+        if self._pipeline.running:
+            self._refilter()
+        elif self._view is not None:
+            view = array("q")
+            for i in self._view:
+                if i not in removed_set:
+                    view.append(i - bisect.bisect_left(removed, i))
+            self._view = view
+            self._pipeline.set_source(self._items, result=view)
+        else:
+            self._pipeline.set_source(self._items)
+        if self._selected is not None:
+            if self._selected in removed_set:
+                self._selected = None
+            else:
+                self._selected -= bisect.bisect_left(removed, self._selected)
+        self._clamp_top()
+        self._schedule_render()
+
+    def clear(self):
+        self._items = []
+        self._selected = None
+        self._top = 0
+        self._refilter()
+
+    def curselection(self):
+        if self._selected is None:
+            return ()
+        if self._view is None:
+            return (self._selected,)
+        pos = bisect.bisect_left(self._view, self._selected)
+        if pos < len(self._view) and self._view[pos] == self._selected:
+            return (pos,)
+        return ()
+
+    def selection_set(self, idx):
+        self._selected = self._data_index(self._fix_index(idx))
+        self._schedule_render()
+
+    def selection_clear(self, *args):
+        self._selected = None
+        self._schedule_render()
+
+    def destroy(self):
+        """取消过滤扫描和帧回调"""
+        self._pipeline.cancel()
+        try:
+            get_clock(self).cancel_owner(self)
+        except tk.TclError:
+            pass
+        super().destroy()
+
+    # ---------- 过滤 ----------
+    def filter(self, query):
+        """按子串过滤；继续输入时在上次结果里收窄，扫描分帧进行不阻塞界面"""
+        if query != self._filter_query:
+            self._top = 0
+        self._filter_query = query
+        self._pipeline.update(query)
+
+    def _on_filter_result(self, result, done):
+        # 部分结果也立即显示
+        self._view = result
+        self._clamp_top()
+        self._schedule_render()
+
+    def _refilter(self):
+        self._pipeline.set_source(self._items)
+        if self._view is not None:
+            self._view = self._pipeline.result
+        self._schedule_render()
+
+    # ---------- 滚动 ----------
+    def _content_height(self):
+        return self.size() * self.row_height
+
+    def _clamp_top(self):
+        max_top = max(0, self._content_height() - self._height)
+        self._top = max(0, min(self._top, max_top))
+
+    def yview(self, *args):
+        """与 Scrollbar 协作的 yview 协议"""
+        total = self._content_height()
+        if not args:
+            if total <= 0:
+                return 0.0, 1.0
+            return self._top / total, min(1.0, (self._top + self._height) / total)
+        if args[0] == "moveto":
+            self._top = float(args[1]) * total
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                self._top += amount * self._height
+            else:
+                self._top += amount * self.row_height
+        self._clamp_top()
+        self._schedule_render(dirty=False)
+
+    def scroll_rows(self, rows):
+        self._top += rows * self.row_height
+        self._clamp_top()
+        self._schedule_render(dirty=False)
+
+    def see(self, idx):
+        y = self._fix_index(idx) * self.row_height
+        if y < self._top:
+            self._top = y
+        elif y + self.row_height > self._top + self._height:
+            self._top = y + self.row_height - self._height
+        self._clamp_top()
+        self._schedule_render()
+
+    # ---------- 渲染 ----------
+    def _draw_outline(self, w, h):
+        if self._outline is not None:
+            super().delete(self._outline)
+        r = min(h // 2, self._radius)
+        x1, y1, x2, y2 = 0, 0, w - 1, h - 1
+        pts = [x1 + r, y1, x2 - r, y1, x2, y1, x2, y1 + r, x2, y2 - r, x2, y2,
+               x2 - r, y2, x1 + r, y2, x1, y2, x1, y2 - r, x1, y1 + r, x1, y1]
+        self._outline = self.create_polygon(pts, fill="", outline=self.border_color,
+                                            smooth=True, width=1)
+
+    def _resize_pool(self, height):
+        needed = height // self.row_height + 2
+        while len(self._slots) < needed:
+            rect = self.create_rectangle(0, 0, 0, 0, fill=self.bg_color, outline="",
+                                         width=0, state="hidden")
+            text = self.create_text(TEXT_PADDING_X, 0, text="", anchor="nw",
+                                    fill=self.text_color, font=self._font, state="hidden")
+            self._slots.append([rect, text, -1])
+        while len(self._slots) > needed:
+            rect, text, _ = self._slots.pop()
+            super().delete(rect)
+            super().delete(text)
+
+    def _schedule_render(self, dirty=True):
+        self._dirty = self._dirty or dirty
+        request_frame(self, "render", self._render)
+
+    def _render(self):
+        rh = self.row_height
+        count = self.size()
+        dirty, self._dirty = self._dirty, False
+        first = int(self._top // rh)
+        offset = -(self._top - first * rh)
+        for i, slot in enumerate(self._slots):
+            rect, text, shown = slot
+            row = first + i
+            if row >= count:
+                if shown != -1:
+                    self.itemconfig(rect, state="hidden")
+                    self.itemconfig(text, state="hidden")
+                    slot[2] = -1
+                continue
+            y = offset + i * rh
+            self.coords(rect, 1, y, self._width - 1, y + rh)
+            self.coords(text, TEXT_PADDING_X, y + ROW_PADDING_Y // 2)
+            if shown == row and not dirty:
+                continue
+            # 槽位换了行号才重新配置内容
+            data_idx = self._data_index(row)
+            selected = data_idx == self._selected
+            self.itemconfig(rect, state="normal",
+                            fill=self.select_bg if selected else self.bg_color)
+            self.itemconfig(text, state="normal", text=self._items[data_idx],
+                            fill=self.select_fg if selected else self.text_color)
+            slot[2] = row
+        self.tag_raise(self._outline)
+        if self.yscrollcommand:
+            self.yscrollcommand(*self.yview())
+
+    # ---------- 事件 ----------
+    def _on_resize(self, event):
+        self._width, self._height = event.width, event.height
+        self._resize_pool(event.height)
+        self._draw_outline(event.width, event.height)
+        self._clamp_top()
+        self._schedule_render()
+
+    def _on_click(self, event):
+        row = int((self._top + event.y) // self.row_height)
+        if 0 <= row < self.size():
+            self._selected = self._data_index(row)
+            self._schedule_render()
+            self.event_generate("<<ListboxSelect>>")
+        self.focus_set()
+
+    def _on_wheel(self, event):
+        self.scroll_rows(-WHEEL_ROWS if event.delta > 0 else WHEEL_ROWS)
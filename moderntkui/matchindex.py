@@ -0,0 +1,92 @@
+# matchindex.py - 查找词在文本中所有出现位置的有序索引，编辑后只重扫编辑点附近
+import re
+from bisect import bisect_left, bisect_right
+
+
+def _compile(term, ignore_case):
+    return re.compile(re.escape(term), re.IGNORECASE if ignore_case else 0)
+
+
+class MatchIndex:
+    """term 在文本中的所有出现位置（允许重叠，与 vim 的 n 一样逐个前进）
+
+    文本编辑后调用 replace()：编辑区之前的匹配原样保留，之后的整体平移，
+    只有可能跨过编辑区的那一段窗口重新搜索。
+    """
+
+    def __init__(self, term, text="", ignore_case=False):
+        self.term = term
+        self.ignore_case = ignore_case
+        self.length = len(term)
+        self._pattern = _compile(term, ignore_case)
+        self._starts = []
+        self.reset(text)
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __iter__(self):
+        m = self.length
+        return ((s, s + m) for s in self._starts)
+
+    def _scan(self, text, pos, endpos):
+        """text[pos:endpos] 内的所有出现位置"""
+        if not self.length:
+            return []
+        search = self._pattern.search
+        starts = []
+        match = search(text, pos, endpos)
+        while match:
+            starts.append(match.start())
+            match = search(text, match.start() + 1, endpos)
+        return starts
+
+    def reset(self, text):
+        """整段重扫"""
+        self._starts = self._scan(text, 0, len(text))
+
+    def refine(self, term, text):
+        """term 是当前词的延长时，新匹配只可能在旧匹配的起点上，逐个核对即可"""
+        pattern = _compile(term, self.ignore_case)
+        self._starts = [s for s in self._starts if pattern.match(text, s)]
+        self.term = term
+        self.length = len(term)
+        self._pattern = pattern
+
+    def replace(self, start, end, text, new_len):
+        """旧文本的 [start, end) 已被替换为 new_len 个字符，text 是替换后的全文"""
+        m = self.length
+        if not m:
+            return
+        starts = self._starts
+        delta = new_len - (end - start)
+        # 起点在 start - m 及以前的匹配整个落在编辑区前；起点不小于 end 的落在编辑区后
+        head = starts[:bisect_right(starts, start - m)]
+        tail = [s + delta for s in starts[bisect_left(starts, end):]]
+        lo = max(0, start - m + 1)
+        hi = min(len(text), start + new_len + m - 1)
+        self._starts = head + self._scan(text, lo, hi) + tail
+
+    def between(self, lo, hi):
+        """与 [lo, hi) 有重叠的匹配 (start, end)"""
+        starts = self._starts
+        m = self.length
+        first = bisect_right(starts, lo - m)
+        last = bisect_left(starts, hi)
+        return [(s, s + m) for s in starts[first:last]]
+
+    def next_after(self, pos):
+        """pos 之后的第一个匹配起点，到末尾后回到第一个；没有匹配时为 None"""
+        starts = self._starts
+        if not starts:
+            return None
+        i = bisect_right(starts, pos)
+        return starts[i] if i < len(starts) else starts[0]
+
+    def prev_before(self, pos):
+        """pos 之前的最后一个匹配起点，到开头后回到最后一个；没有匹配时为 None"""
+        starts = self._starts
+        if not starts:
+            return None
+        i = bisect_left(starts, pos)
+        return starts[i - 1] if i > 0 else starts[-1]
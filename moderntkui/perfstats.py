@@ -0,0 +1,300 @@
+# perfstats.py - 控件性能计数器与实时检查器
+#
+# 用法:
+#     from moderntkui import perfstats
+#     perfstats.enable()                    # 在创建控件之前调用
+#     perfstats.Inspector(root)             # 打开检查器窗口
+#     perfstats.export_json("stats.json")   # 导出供离线分析
+#
+# 未启用时不做任何修补，控件没有额外开销。
+import functools
+import json
+import time
+import tkinter as tk
+import tkinter.font as tkfont
+import weakref
+from tkinter import ttk
+
+# ====================== 常量定义 ======================
+REFRESH_INTERVAL = 500   # 毫秒，检查器刷新间隔
+
+CANVAS_COMMANDS = ("create_text", "create_rectangle", "create_polygon", "create_image",
+                   "create_line", "coords", "itemconfig", "itemconfigure", "delete",
+                   "tag_raise", "tag_lower", "move")
+TIMER_COMMANDS = ("after", "after_idle", "after_cancel")
+
+ENTRY_HANDLERS = ("_on_click", "_on_drag", "_on_release", "_on_key_press", "_on_paste",
+                  "_on_copy", "_on_focus_in", "_on_focus_out", "_redraw_rect",
+                  "_refresh_text_and_cursor", "_scroll_to_cursor", "_update_cursor",
+                  "_update_selection_visual", "_apply_resize", "_render_key_edits", "set")
+BUTTON_HANDLERS = ("_on_enter", "_on_leave", "_on_press", "_on_release",
+                   "_refresh_appearance", "configure")
+LIST_HANDLERS = ("_render", "_on_click", "_on_resize", "filter")
+
+
+# ====================== WidgetStats ======================
+class WidgetStats:
+    """单个控件（或全局）的计数"""
+    def __init__(self, name):
+        self.name = name
+        self.canvas_commands = 0
+        self.measure_calls = 0
+        self.redraws = 0
+        self.timer_calls = 0
+        # 名称 -> [次数, 总耗时(秒), 最大耗时(秒)]；耗时为自身时间，不含嵌套的被计时处理函数
+        self.handlers = {}
+
+    def add_handler(self, name, elapsed):
+        entry = self.handlers.get(name)
+        if entry is None:
+            self.handlers[name] = [1, elapsed, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+            if elapsed > entry[2]:
+                entry[2] = elapsed
+
+    def handler_time(self):
+        """各处理函数自身时间之和，嵌套调用不会重复计入"""
+        return sum(e[1] for e in self.handlers.values())
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "canvas_commands": self.canvas_commands,
+            "measure_calls": self.measure_calls,
+            "redraws": self.redraws,
+            "timer_calls": self.timer_calls,
+            "handlers": {
+                k: {"count": c, "total_ms": t * 1000, "max_ms": m * 1000}
+                for k, (c, t, m) in self.handlers.items()
+            },
+        }
+
+
+# ====================== 注册表 ======================
+_enabled = False
+_originals = []               # (所属类, 属性名, 原值)
+_stats = weakref.WeakKeyDictionary()
+_global = WidgetStats("global")
+_stack = []                   # 正在执行的处理函数所属控件的计数
+_child_time = []              # 与计时中的处理函数一一对应：其内部嵌套处理函数的总耗时
+
+
+def is_enabled():
+    return _enabled
+
+
+def stats_for(widget):
+    """控件的计数对象（未登记时创建）"""
+    stats = _stats.get(widget)
+    if stats is None:
+        stats = _stats[widget] = WidgetStats(_widget_name(widget))
+    return stats
+
+
+def _widget_name(widget):
+    # __init__ 开始前控件还没有 Tk 路径名
+    path = getattr(widget, "_w", None)
+    return "%s %s" % (type(widget).__name__, path or hex(id(widget)))
+
+
+def reset():
+    global _global
+    _global = WidgetStats("global")
+    for widget in list(_stats.keys()):
+        _stats[widget] = WidgetStats(_stats[widget].name)
+
+
+def snapshot():
+    return {
+        "global": _global.as_dict(),
+        "widgets": [s.as_dict() for s in list(_stats.values())],
+    }
+
+
+def export_json(path=None):
+    """导出为 JSON；给出 path 时写入文件，否则返回字符串"""
+    data = json.dumps(snapshot(), ensure_ascii=False, indent=2)
+    if path is None:
+        return data
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(data)
+    return path
+
+
+# ====================== 修补 ======================
+def _patch(owner, name, wrapper_factory):
+    original = owner.__dict__.get(name)
+    if original is None:
+        original = getattr(owner, name)
+        _originals.append((owner, name, None))
+    else:
+        _originals.append((owner, name, original))
+    setattr(owner, name, wrapper_factory(original))
+
+
+def _count_canvas(func):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        stats = _stats.get(self)
+        if stats is not None:
+            stats.canvas_commands += 1
+            _global.canvas_commands += 1
+        return func(self, *args, **kwargs)
+    return wrapper
+
+
+def _count_timer(func):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        stats = _stats.get(self)
+        if stats is not None:
+            stats.timer_calls += 1
+            _global.timer_calls += 1
+        return func(self, *args, **kwargs)
+    return wrapper
+
+
+def _count_measure(func):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        # 字体不知道属于哪个控件，按当前正在执行的处理函数归属
+        _global.measure_calls += 1
+        if _stack:
+            _stack[-1].measure_calls += 1
+        return func(self, *args, **kwargs)
+    return wrapper
+
+
+def _timed(name):
+    def factory(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            stats = stats_for(self)
+            if name == "_redraw_rect" or name == "_render":
+                stats.redraws += 1
+                _global.redraws += 1
+            _stack.append(stats)
+            _child_time.append(0.0)
+            start = time.perf_counter()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                _stack.pop()
+                # 只记自身时间；整段耗时计入外层处理函数的子调用时间
+                own = elapsed - _child_time.pop()
+                if _child_time:
+                    _child_time[-1] += elapsed
+                stats.add_handler(name, own)
+                _global.add_handler(name, own)
+        return wrapper
+    return factory
+
+
+def _registering_init(func):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        stats = stats_for(self)
+        _stack.append(stats)
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            _stack.pop()
+            stats.name = _widget_name(self)
+    return wrapper
+
+
+def enable():
+    """打开计数。处理函数在绑定时取用，所以要在创建控件之前调用"""
+    global _enabled
+    if _enabled:
+        return
+    from .entry import ModernEntry
+    from .listbox import ModernList
+    from .button import RoundedButton
+
+    for name in CANVAS_COMMANDS:
+        _patch(tk.Canvas, name, _count_canvas)
+    for name in TIMER_COMMANDS:
+        _patch(tk.Misc, name, _count_timer)
+    _patch(tkfont.Font, "measure", _count_measure)
+    for cls, handlers in ((ModernEntry, ENTRY_HANDLERS), (RoundedButton, BUTTON_HANDLERS),
+                          (ModernList, LIST_HANDLERS)):
+        _patch(cls, "__init__", _registering_init)
+        for name in handlers:
+            if hasattr(cls, name):
+                _patch(cls, name, _timed(name))
+    _enabled = True
+
+
+def disable():
+    """撤销全部修补，已有计数保留"""
+    global _enabled
+    while _originals:
+        owner, name, original = _originals.pop()
+        if original is None:
+            delattr(owner, name)
+        else:
+            setattr(owner, name, original)
+    _enabled = False
+
+
+# ====================== Inspector ======================
+class Inspector(tk.Toplevel):
+    """实时显示各控件及全局计数的检查器窗口"""
+    COLUMNS = ("canvas", "measure", "redraws", "timers", "handler_ms", "slowest")
+
+    def __init__(self, master, refresh=REFRESH_INTERVAL):
+        super().__init__(master)
+        self.title("性能检查器")
+        self.geometry("760x420")
+        self.refresh = refresh
+        self.tree = ttk.Treeview(self, columns=self.COLUMNS, show="tree headings")
+        self.tree.heading("#0", text="控件")
+        self.tree.column("#0", width=220)
+        for col, text in zip(self.COLUMNS, ("画布命令", "measure", "重绘", "定时器",
+                                            "处理耗时 ms", "最慢处理")):
+            self.tree.heading(col, text=text)
+            self.tree.column(col, width=90, anchor=tk.E)
+        self.tree.column("slowest", width=160, anchor=tk.W)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        bar = ttk.Frame(self)
+        bar.pack(fill=tk.X)
+        ttk.Button(bar, text="重置", command=self._reset).pack(side=tk.LEFT, padx=4, pady=4)
+        ttk.Button(bar, text="导出 JSON", command=self._export).pack(side=tk.LEFT, padx=4, pady=4)
+        self._job = None
+        self._update()
+
+    def _row(self, stats):
+        slowest = ""
+        if stats.handlers:
+            name, (count, total, worst) = max(stats.handlers.items(), key=lambda kv: kv[1][2])
+            slowest = "%s %.2fms" % (name, worst * 1000)
+        return (stats.canvas_commands, stats.measure_calls, stats.redraws, stats.timer_calls,
+                "%.1f" % (stats.handler_time() * 1000), slowest)
+
+    def _update(self):
+        self._job = None
+        self.tree.delete(*self.tree.get_children())
+        self.tree.insert("", tk.END, text=_global.name, values=self._row(_global))
+        for stats in sorted(list(_stats.values()), key=lambda s: -s.handler_time()):
+            self.tree.insert("", tk.END, text=stats.name, values=self._row(stats))
+        self._job = self.after(self.refresh, self._update)
+
+    def _reset(self):
+        reset()
+
+    def _export(self):
+        from tkinter import filedialog
+        path = filedialog.asksaveasfilename(parent=self, defaultextension=".json",
+                                            filetypes=[("JSON", "*.json")])
+        if path:
+            export_json(path)
+
+    def destroy(self):
+        if self._job is not None:
+            self.after_cancel(self._job)
+            self._job = None
+        super().destroy()
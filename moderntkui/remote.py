@@ -0,0 +1,27 @@
+# remote.py - 远程 X 显示（SSH 转发、VNC）检测
+import os
+
+# ====================== 常量定义 ======================
+REMOTE_ENV = "MODERNTKUI_REMOTE"   # "1" 强制远程模式，"0" 强制关闭
+
+
+def is_remote_display(widget):
+    """控件所在显示是否经过网络，每个根窗口只判断一次
+
+    环境变量优先；否则在 X11 下看屏幕名的主机部分：":0" 和 "unix:0" 是本地，
+    "localhost:10.0"（SSH 转发）或 "host:0" 走 TCP。VNC 服务端上的本地显示
+    看不出来，需要用环境变量打开。
+    """
+    root = widget._root()
+    remote = getattr(root, "_modern_remote", None)
+    if remote is None:
+        override = os.environ.get(REMOTE_ENV)
+        if override is not None:
+            remote = override.strip() not in ("", "0", "false", "no")
+        elif root._windowingsystem == "x11":
+            host = root.winfo_screen().rsplit(":", 1)[0]
+            remote = host not in ("", "unix")
+        else:
+            remote = False
+        root._modern_remote = remote
+    return remote
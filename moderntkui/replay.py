@@ -0,0 +1,257 @@
+# replay.py - 输入事件录制与回放，用于可重复的性能回归测试
+#
+# 录制: python -m moderntkui.replay record session.jsonl test:CustomWidgetsTestApp
+#       （用 模块:可调用对象 指定在根窗口上搭建界面的工厂，关闭窗口即保存）
+# 回放: python -m moderntkui.replay replay session.jsonl test:CustomWidgetsTestApp [--max-speed]
+# 无显示环境下用 xvfb-run 运行回放。
+import importlib
+import json
+import sys
+import time
+import tkinter as tk
+from types import SimpleNamespace
+
+from .animation import get_clock
+
+# ====================== 常量定义 ======================
+RECORD_TAG = "ModernRecord"
+SETTLE_TIMEOUT = 1.0   # 秒，每个事件最多等多久让合并的重绘执行完
+RECORD_SEQUENCES = ("<KeyPress>", "<KeyRelease>", "<ButtonPress>", "<ButtonRelease>",
+                    "<Motion>", "<FocusIn>", "<FocusOut>")
+EVENT_NAMES = {
+    str(tk.EventType.KeyPress): "KeyPress",
+    str(tk.EventType.KeyRelease): "KeyRelease",
+    str(tk.EventType.ButtonPress): "ButtonPress",
+    str(tk.EventType.ButtonRelease): "ButtonRelease",
+    str(tk.EventType.Motion): "Motion",
+    str(tk.EventType.FocusIn): "FocusIn",
+    str(tk.EventType.FocusOut): "FocusOut",
+}
+
+
+def _toolkit_classes():
+    from .entry import ModernEntry
+    from .listbox import ModernList
+    from .button import RoundedButton
+    from .sharedcanvas import SharedCanvas
+    return ModernEntry, RoundedButton, ModernList, SharedCanvas
+
+
+def _walk(widget):
+    yield widget
+    for child in widget.winfo_children():
+        yield from _walk(child)
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(p / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+# ====================== Recorder ======================
+class Recorder:
+    """在工具包控件的绑定标签最前面插入录制标签，捕获事件流
+
+    放在最前面是为了不被控件自己返回 "break" 的处理函数吞掉。
+    开始录制后才创建的控件在第一次映射（<Map>，早于任何输入）时补上标签。
+    每条记录: [毫秒, 类型, 路径, x, y, state, keysym, num, char]
+    """
+    def __init__(self, root):
+        self.root = root
+        self.events = []
+        self._start = None
+        self._tagged = []
+        self._classes = None
+        self._map_funcid = None
+        self._prev_map = ""
+
+    def start(self):
+        self._start = time.perf_counter()
+        self._classes = _toolkit_classes()
+        for widget in _walk(self.root):
+            self._tag(widget)
+        for seq in RECORD_SEQUENCES:
+            self.root.bind_class(RECORD_TAG, seq, self._on_event)
+        # "all" 标签上原有的 <Map> 绑定在停止时恢复
+        self._prev_map = self.root.tk.call("bind", "all", "<Map>")
+        self._map_funcid = self.root.bind_class("all", "<Map>", self._on_map, add="+")
+
+    def _tag(self, widget):
+        if isinstance(widget, self._classes):
+            tags = widget.bindtags()
+            if RECORD_TAG not in tags:
+                widget.bindtags((RECORD_TAG,) + tags)
+                self._tagged.append(widget)
+
+    def _on_map(self, event):
+        self._tag(event.widget)
+
+    def stop(self):
+        for seq in RECORD_SEQUENCES:
+            self.root.unbind_class(RECORD_TAG, seq)
+        if self._map_funcid is not None:
+            self.root.tk.call("bind", "all", "<Map>", self._prev_map)
+            self.root.deletecommand(self._map_funcid)
+            self._map_funcid = None
+        for widget in self._tagged:
+            try:
+                widget.bindtags(tuple(t for t in widget.bindtags() if t != RECORD_TAG))
+            except tk.TclError:
+                pass
+        self._tagged = []
+
+    def _on_event(self, event):
+        kind = EVENT_NAMES.get(str(event.type))
+        if kind is None:
+            return
+        elapsed = int((time.perf_counter() - self._start) * 1000)
+        keysym = event.keysym if kind.startswith("Key") else ""
+        char = event.char if kind == "KeyPress" and isinstance(event.char, str) else ""
+        num = event.num if kind.startswith("Button") else 0
+        x = event.x if isinstance(event.x, int) else 0
+        y = event.y if isinstance(event.y, int) else 0
+        state = event.state if isinstance(event.state, int) else 0
+        self.events.append([elapsed, kind, str(event.widget), x, y, state, keysym, num, char])
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            for ev in self.events:
+                f.write(json.dumps(ev, ensure_ascii=False, separators=(",", ":")))
+                f.write("\n")
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+# ====================== Replayer ======================
+class Replayer:
+    """用 event_generate 把录制的事件重新注入，统计每个事件的处理延迟"""
+    def __init__(self, root, events):
+        self.root = root
+        self.events = events
+        self.latencies = {}   # 类型 -> [秒]
+        self.skipped = 0
+
+    def _inject(self, widget, kind, x, y, state, keysym, num, char):
+        if kind == "FocusIn":
+            widget.focus_force()
+            widget.event_generate("<FocusIn>")
+        elif kind == "FocusOut":
+            widget.event_generate("<FocusOut>")
+        elif kind == "KeyPress" and char and not char.isascii() and hasattr(widget, "_on_key_press"):
+            # event_generate 只能给出 keysym，字符由键盘映射推出，输入法提交的文字
+            # 无法还原；这类按键直接交给控件的按键处理函数，带上录制的 char
+            widget._on_key_press(SimpleNamespace(
+                widget=widget, keysym=keysym, char=char, state=state, x=x, y=y))
+        elif kind in ("KeyPress", "KeyRelease"):
+            widget.event_generate("<%s>" % kind, keysym=keysym, state=state)
+        elif kind in ("ButtonPress", "ButtonRelease"):
+            widget.event_generate("<%s-%d>" % (kind, num), x=x, y=y, state=state)
+        else:
+            widget.event_generate("<Motion>", x=x, y=y, state=state)
+
+    def _settle(self):
+        """处理到合并到帧的重绘（按键、尺寸变化等）全部执行完为止"""
+        self.root.update_idletasks()
+        clock = get_clock(self.root)
+        deadline = time.perf_counter() + SETTLE_TIMEOUT
+        while clock.has_pending_frames() and time.perf_counter() < deadline:
+            self.root.update()
+
+    def run(self, max_speed=False):
+        self.root.update()
+        start = time.perf_counter()
+        for elapsed, kind, path, x, y, state, keysym, num, char in self.events:
+            if not max_speed:
+                target = start + elapsed / 1000.0
+                while time.perf_counter() < target:
+                    self.root.update()
+            try:
+                widget = self.root.nametowidget(path)
+            except KeyError:
+                self.skipped += 1
+                continue
+            t0 = time.perf_counter()
+            try:
+                # event_generate 同步分发；再等合并到下一帧的重绘执行完，把重绘也算进延迟
+                self._inject(widget, kind, x, y, state, keysym, num, char)
+                self._settle()
+            except tk.TclError:
+                self.skipped += 1
+                continue
+            self.latencies.setdefault(kind, []).append(time.perf_counter() - t0)
+        self.root.update()
+        return self.report()
+
+    def report(self):
+        result = {}
+        everything = []
+        for kind, values in self.latencies.items():
+            values.sort()
+            everything.extend(values)
+            result[kind] = {
+                "count": len(values),
+                "p50_ms": percentile(values, 50) * 1000,
+                "p99_ms": percentile(values, 99) * 1000,
+                "max_ms": values[-1] * 1000,
+            }
+        everything.sort()
+        result["all"] = {
+            "count": len(everything),
+            "p50_ms": percentile(everything, 50) * 1000,
+            "p99_ms": percentile(everything, 99) * 1000,
+            "max_ms": everything[-1] * 1000 if everything else 0.0,
+            "skipped": self.skipped,
+        }
+        return result
+
+
+def print_report(report):
+    print("%-14s %8s %10s %10s %10s" % ("事件", "次数", "p50 ms", "p99 ms", "max ms"))
+    for kind, r in sorted(report.items(), key=lambda kv: kv[0] == "all"):
+        print("%-14s %8d %10.3f %10.3f %10.3f" % (
+            kind, r["count"], r["p50_ms"], r["p99_ms"], r["max_ms"]))
+    if report.get("all", {}).get("skipped"):
+        print("跳过的事件: %d" % report["all"]["skipped"])
+
+
+def load_factory(spec):
+    """'模块:可调用对象' -> 可调用对象，例如 'test:CustomWidgetsTestApp'"""
+    module_name, sep, attr = spec.partition(":")
+    if not sep or not module_name or not attr:
+        raise ValueError("expected 'module:callable', got %r" % (spec,))
+    obj = importlib.import_module(module_name)
+    for part in attr.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def main(argv):
+    args = [a for a in argv[1:] if not a.startswith("--")]
+    if len(args) != 3 or args[0] not in ("record", "replay"):
+        print("用法: python -m moderntkui.replay record|replay <文件> <模块:工厂> [--max-speed]")
+        return 2
+    mode, path, spec = args
+    factory = load_factory(spec)
+    root = tk.Tk()
+    factory(root)
+    root.update()
+    if mode == "record":
+        recorder = Recorder(root)
+        recorder.start()
+        root.mainloop()
+        recorder.save(path)
+        print("已录制 %d 个事件" % len(recorder.events))
+        return 0
+    replayer = Replayer(root, load(path))
+    print_report(replayer.run(max_speed="--max-speed" in argv))
+    root.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
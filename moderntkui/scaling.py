@@ -0,0 +1,98 @@
+# scaling.py - 跟随 tk scaling 的 HiDPI 缩放
+import weakref
+import tkinter as tk
+from .animation import request_frame
+
+# ====================== 常量定义 ======================
+BASE_TK_SCALING = 96.0 / 72.0   # 96 DPI 下 tk scaling 的值，对应缩放系数 1.0
+POINTS_PER_INCH = 72.0
+CONFIGURE_TAG = "ModernScaling"  # 只挂在根窗口上的绑定标签，子控件的 Configure 不经过它
+
+
+# ====================== ScalingState ======================
+class ScalingState:
+    """每个根窗口一份的缩放系数与订阅者
+
+    系数 = tk scaling / (96/72)，不小于 1.0（DPI 报告偏低的 X 服务器上不缩小控件）。
+    控件按基准像素保存尺寸，系数变化时每个订阅者只重建一次几何、字体度量和宽度缓存；
+    几何表和图片缓存按设备像素尺寸取用，不按系数区分。系数不变时重绘不会再查询或换算。
+
+    Tk 不会因为窗口换了显示器就改 tk scaling，所以根窗口移动或改变大小后
+    比较屏幕的实际 DPI（winfo fpixels 1i），变了才按新 DPI 设置 tk scaling。
+    """
+    def __init__(self, root):
+        self.root = root
+        self.factor = self._read()
+        self._dpi = self._read_dpi()
+        self._widgets = weakref.WeakSet()
+        self_ref = weakref.ref(self)
+
+        def _on_configure(event):
+            # Configure 在拖动窗口时成串到来，合并到帧内检查一次
+            state = self_ref()
+            if state is not None and event.widget is state.root:
+                request_frame(state.root, "scaling", state.check_display)
+        root.bind_class(CONFIGURE_TAG, "<Configure>", _on_configure)
+        root.bindtags((CONFIGURE_TAG,) + tuple(root.bindtags()))
+
+    def _read(self):
+        try:
+            value = float(self.root.tk.call("tk", "scaling"))
+        except (tk.TclError, ValueError):
+            return 1.0
+        return max(1.0, value / BASE_TK_SCALING)
+
+    def _read_dpi(self):
+        try:
+            return self.root.winfo_fpixels("1i")
+        except tk.TclError:
+            return None
+
+    def register(self, widget):
+        self._widgets.add(widget)
+
+    def unregister(self, widget):
+        self._widgets.discard(widget)
+
+    def scaled(self, px):
+        return int(round(px * self.factor))
+
+    def check_display(self):
+        """根窗口所在屏幕的 DPI 变化时（换到另一台显示器），按新 DPI 设置 tk scaling"""
+        dpi = self._read_dpi()
+        if dpi is None or dpi == self._dpi:
+            return
+        self._dpi = dpi
+        try:
+            self.root.tk.call("tk", "scaling", dpi / POINTS_PER_INCH)
+        except tk.TclError:
+            return
+        self.refresh()
+
+    def refresh(self):
+        """重新读取 tk scaling，变化时通知所有订阅控件"""
+        factor = self._read()
+        if factor == self.factor:
+            return
+        self.factor = factor
+        for widget in list(self._widgets):
+            try:
+                widget._on_scaling_changed(factor)
+            except tk.TclError:
+                self._widgets.discard(widget)
+
+
+def get_scaling(widget):
+    """获取控件所在根窗口的缩放状态"""
+    root = widget._root()
+    state = getattr(root, "_modern_scaling", None)
+    if state is None:
+        state = ScalingState(root)
+        root._modern_scaling = state
+    return state
+
+
+def set_scaling(widget, tk_scaling):
+    """修改 tk scaling 并让已创建的控件按新系数重建"""
+    widget.tk.call("tk", "scaling", tk_scaling)
+    get_scaling(widget).refresh()
@@ -0,0 +1,72 @@
+# selection.py - 输入框的选区模型：锚点、活动端和附加高亮区间
+
+
+class SelectionModel:
+    """主选区由锚点 anchor 和活动端 head（即光标位置）确定，anchor 为 None 表示没有选区
+
+    另外可以按标签挂若干附加区间（例如查找结果的高亮），它们只用于绘制，
+    不参与复制、删除等编辑操作；文本编辑后用 adjust() 平移。
+    """
+    __slots__ = ("anchor", "head", "_ranges")
+
+    def __init__(self):
+        self.anchor = None
+        self.head = 0
+        self._ranges = {}   # 标签 -> [(start, end), ...]，按 start 升序
+
+    @property
+    def active(self):
+        """是否有非空的主选区"""
+        return self.anchor is not None and self.anchor != self.head
+
+    def span(self):
+        """主选区的 (start, end)；没有锚点时返回 (None, None)"""
+        if self.anchor is None:
+            return None, None
+        if self.anchor <= self.head:
+            return self.anchor, self.head
+        return self.head, self.anchor
+
+    def begin(self):
+        """扩展选区前调用：还没有锚点时以当前光标为锚点"""
+        if self.anchor is None:
+            self.anchor = self.head
+
+    def select(self, anchor, head):
+        self.anchor = anchor
+        self.head = head
+
+    def clear(self):
+        self.anchor = None
+
+    # ---------------------- 附加区间 ----------------------
+    def set_ranges(self, tag, ranges):
+        ranges = sorted(r for r in ranges if r[0] < r[1])
+        if ranges:
+            self._ranges[tag] = ranges
+        else:
+            self._ranges.pop(tag, None)
+
+    def ranges(self, tag):
+        return self._ranges.get(tag, ())
+
+    def clear_ranges(self, tag):
+        self._ranges.pop(tag, None)
+
+    def tags(self):
+        return list(self._ranges)
+
+    def adjust(self, start, end, new_len):
+        """[start, end) 被替换为 new_len 个字符：其后的区间平移，与编辑区重叠的丢弃"""
+        delta = new_len - (end - start)
+        for tag in list(self._ranges):
+            kept = []
+            for s, e in self._ranges[tag]:
+                if e <= start:
+                    kept.append((s, e))
+                elif s >= end:
+                    kept.append((s + delta, e + delta))
+            if kept:
+                self._ranges[tag] = kept
+            else:
+                del self._ranges[tag]
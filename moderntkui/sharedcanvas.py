@@ -0,0 +1,501 @@
+# sharedcanvas.py - 共享画布模式：大量输入框/按钮绘制在同一个画布上
+import tkinter as tk
+from .animation import animate, get_clock, DEFAULT_DURATION
+from .dispatcher import get_dispatcher
+from .graphemes import GraphemeIndex
+from .fonts import default_family, make_font
+from .geometry import arc_rect_points, rounded_rect_points
+from .entry import (PureCursor, DEFAULT_WIDTH, DEFAULT_HEIGHT, DEFAULT_RADIUS,
+                    DEFAULT_CURSOR_HEIGHT, DEFAULT_CURSOR_BLINK_SPEED, TEXT_PADDING_X,
+                    MAX_TEXT_LENGTH)
+from .theme import (BG_COLOR, ENTRY_BG_COLOR, BORDER_NORMAL_COLOR, BORDER_FOCUS_COLOR,
+                    TEXT_COLOR, PLACEHOLDER_COLOR, CURSOR_COLOR, ENTRY_FONT_FAMILY,
+                    ENTRY_FONT_SIZE, BUTTON_COLOR, BUTTON_HOVER_COLOR, BUTTON_PRESS_COLOR,
+                    BUTTON_OUTLINE_COLOR, BUTTON_DISABLED_COLOR, BUTTON_DISABLED_TEXT_COLOR,
+                    BUTTON_FONT_SIZE)
+
+TAG_PREFIX = "mw"
+
+
+# ====================== HostedWidget ======================
+class HostedWidget:
+    """共享画布上的逻辑控件：一组带相同标签的画布项"""
+    focusable = False
+
+    def __init__(self, host, x, y, width, height):
+        self.host = host
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.tag = "%s%d" % (TAG_PREFIX, id(self))
+
+    def _root(self):
+        """帧时钟按根窗口查找；动画 key 仍以逻辑控件本身区分"""
+        return self.host._root()
+
+    def contains(self, x, y):
+        return self.x <= x < self.x + self.width and self.y <= y < self.y + self.height
+
+    def move_to(self, x, y):
+        self.host.move(self.tag, x - self.x, y - self.y)
+        self.x, self.y = x, y
+
+    def destroy(self):
+        get_clock(self.host).cancel_owner(self)
+        self.host.delete(self.tag)
+        self.host._unregister(self)
+
+    # 事件钩子，由 SharedCanvas 分发
+    def on_enter(self): pass
+    def on_leave(self): pass
+    def on_press(self, x, y): pass
+    def on_drag(self, x, y): pass
+    def on_release(self, x, y): pass
+    def on_key(self, event): pass
+    def on_focus_in(self): pass
+    def on_focus_out(self): pass
+
+
+# ====================== HostedButton ======================
+class HostedButton(HostedWidget):
+    """共享画布上的圆角按钮，外观与 RoundedButton 一致"""
+    def __init__(self, host, x, y, text, command=None, width=60, height=25, radius=4,
+                 button_color=BUTTON_COLOR, hover_color=BUTTON_HOVER_COLOR,
+                 press_color=BUTTON_PRESS_COLOR, text_color=TEXT_COLOR,
+                 outline_color=BUTTON_OUTLINE_COLOR, font=None,
+                 animation_duration=DEFAULT_DURATION):
+        super().__init__(host, x, y, width, height)
+        self.command = command
+        self.enabled = True
+        self.disabled_color = BUTTON_DISABLED_COLOR
+        self.disabled_text_color = BUTTON_DISABLED_TEXT_COLOR
+        self.button_color = button_color
+        self.hover_color = hover_color
+        self.press_color = press_color
+        self.text_color = text_color
+        self.animation_duration = animation_duration
+        self._current_fill = button_color
+        self.btn_id = host.create_polygon(
+            arc_rect_points(x + 1, y + 1, x + width - 1, y + height - 1, radius),
+            fill=button_color, outline=outline_color, smooth=True, tags=(self.tag,))
+        self.text_id = host.create_text(
+            x + width // 2, y + height // 2, text=text, fill=text_color,
+            font=font or host.button_font, tags=(self.tag,))
+
+    def _set_fill(self, color):
+        self._current_fill = color
+        self.host.itemconfig(self.btn_id, fill=color)
+
+    def _animate_fill(self, color):
+        animate(self, "fill", self._current_fill, color, self._set_fill,
+                duration=self.animation_duration)
+
+    def on_enter(self):
+        if self.enabled:
+            self._animate_fill(self.hover_color)
+
+    def on_leave(self):
+        self._refresh_appearance()
+
+    def on_press(self, x, y):
+        if self.enabled:
+            self._animate_fill(self.press_color)
+
+    def on_release(self, x, y):
+        if not self.enabled:
+            return
+        self._animate_fill(self.hover_color)
+        if self.command and self.contains(x, y):
+            self.command()
+
+    def configure(self, **kwargs):
+        if 'text' in kwargs:
+            self.host.itemconfig(self.text_id, text=kwargs.pop('text'))
+        if 'command' in kwargs:
+            self.command = kwargs.pop('command')
+        if 'state' in kwargs:
+            self.set_enabled(kwargs.pop('state') == 'normal')
+        for key in ('button_color', 'hover_color', 'press_color', 'text_color'):
+            if key in kwargs:
+                setattr(self, key, kwargs.pop(key))
+        self._refresh_appearance()
+
+    def set_enabled(self, flag=True):
+        self.enabled = bool(flag)
+        self._refresh_appearance()
+
+    def _refresh_appearance(self):
+        if self.enabled:
+            fill_color, text_fill_color = self.button_color, self.text_color
+        else:
+            fill_color, text_fill_color = self.disabled_color, self.disabled_text_color
+        self._animate_fill(fill_color)
+        self.host.itemconfig(self.text_id, fill=text_fill_color)
+
+
+# ====================== HostedEntry ======================
+class HostedEntry(HostedWidget):
+    """共享画布上的输入框
+
+    画布项不能裁剪，所以超出宽度的文本不是靠平移文本项，
+    而是只显示光标附近能放下的那一段。
+    """
+    focusable = True
+
+    def __init__(self, host, x, y, width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT,
+                 radius=DEFAULT_RADIUS, bg_color=ENTRY_BG_COLOR,
+                 border_normal=BORDER_NORMAL_COLOR, border_focus=BORDER_FOCUS_COLOR,
+                 text_color=TEXT_COLOR, placeholder="", placeholder_color=PLACEHOLDER_COLOR,
+                 max_length=MAX_TEXT_LENGTH, animation_duration=DEFAULT_DURATION):
+        super().__init__(host, x, y, width, height)
+        self.border_normal = border_normal
+        self.border_focus = border_focus
+        self.text_color = text_color
+        self.placeholder = placeholder
+        self.placeholder_color = placeholder_color
+        self.max_length = max_length
+        self.animation_duration = animation_duration
+        self._font = host.entry_font
+        self._text = ""
+        self._graphemes = GraphemeIndex()
+        self._cursor_pos = 0
+        self._view_start = 0
+        self._border_color = border_normal
+        font_height = host.entry_linespace
+        self.text_x = x + TEXT_PADDING_X
+        self.text_y = y + (height - font_height) // 2
+        self._visible_w = width - 2 * TEXT_PADDING_X
+        pts = rounded_rect_points(x, y, x + width - 1, y + height - 1, min(height // 2, radius))
+        self._rect_bg = host.create_polygon(pts, fill=bg_color, outline="", smooth=True,
+                                            tags=(self.tag,))
+        self._rect_outline = host.create_polygon(pts, fill="", outline=border_normal,
+                                                 smooth=True, width=1, tags=(self.tag,))
+        self.text_id = host.create_text(self.text_x, self.text_y, text=placeholder, anchor="nw",
+                                        fill=placeholder_color, font=self._font, tags=(self.tag,))
+        # 光标延迟到第一次获得焦点时创建
+        self.cursor = None
+        self._cursor_y = self.text_y + max(0, (font_height - DEFAULT_CURSOR_HEIGHT) // 2)
+
+    # ---------- 数据 ----------
+    def get(self):
+        return self._text
+
+    def set(self, text):
+        if self.max_length is not None:
+            text = text[:self.max_length]
+        self._text = text
+        self._cursor_pos = len(text)
+        self._refresh()
+
+    def insert(self, idx, txt):
+        idx = len(self._text) if idx in (tk.END, "end") else max(0, min(int(idx), len(self._text)))
+        if self.max_length is not None:
+            txt = txt[:max(0, self.max_length - len(self._text))]
+        self._text = self._text[:idx] + txt + self._text[idx:]
+        self._cursor_pos = idx + len(txt)
+        self._refresh()
+
+    # ---------- 渲染 ----------
+    def _fit_view(self):
+        """调整可见段起点，使光标落在可见宽度内"""
+        measure = self._font.measure
+        clusters = self._clusters()
+        # 可见段总是从簇边界开始，不会把组合字符或 ZWJ 表情切成两半
+        self._view_start = clusters.floor(min(self._view_start, len(self._text)))
+        if self._cursor_pos < self._view_start:
+            self._view_start = self._cursor_pos
+        while self._view_start < self._cursor_pos and \
+                measure(self._text[self._view_start:self._cursor_pos]) > self._visible_w:
+            step = max(1, (self._cursor_pos - self._view_start) // 4)
+            self._view_start = clusters.ceil(self._view_start + step)
+        self._view_start = min(self._view_start, self._cursor_pos)
+
+    def _visible_text(self):
+        text = self._text[self._view_start:]
+        if self._font.measure(text) <= self._visible_w:
+            return text
+        lo, hi = self._cursor_pos - self._view_start, len(text)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self._font.measure(text[:mid]) <= self._visible_w:
+                lo = mid
+            else:
+                hi = mid - 1
+        # 右端同样退到簇边界；光标在边界上，所以不会退到光标之前
+        return text[:self._clusters().floor(self._view_start + lo) - self._view_start]
+
+    def _refresh(self):
+        if not self._text:
+            self._view_start = 0
+            self.host.itemconfig(self.text_id, text=self.placeholder, fill=self.placeholder_color)
+        else:
+            self._fit_view()
+            self.host.itemconfig(self.text_id, text=self._visible_text(), fill=self.text_color)
+        self._update_cursor()
+
+    def _update_cursor(self):
+        if self.cursor is None:
+            return
+        x = self.text_x + self._font.measure(self._text[self._view_start:self._cursor_pos])
+        self.cursor.move(x, self._cursor_y)
+
+    def _index_at(self, x):
+        rel = x - self.text_x
+        text = self._text[self._view_start:]
+        lo, hi = 0, len(text)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._font.measure(text[:mid]) < rel:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo > 0 and rel - self._font.measure(text[:lo - 1]) < self._font.measure(text[:lo]) - rel:
+            lo -= 1
+        return self._view_start + lo
+
+    def _clusters(self):
+        self._graphemes.ensure(self._text)
+        return self._graphemes
+
+    def _replace_text(self, start, end, txt=""):
+        clusters = self._clusters()
+        self._text = self._text[:start] + txt + self._text[end:]
+        clusters.replace(start, end, self._text)
+
+    # ---------- 事件 ----------
+    def on_press(self, x, y):
+        self._cursor_pos = self._clusters().floor(self._index_at(x))
+        self._update_cursor()
+
+    def on_focus_in(self):
+        if self.cursor is None:
+            self.cursor = PureCursor(self.host, x=self.text_x, y=self._cursor_y,
+                                     height=DEFAULT_CURSOR_HEIGHT, width=2, color=CURSOR_COLOR,
+                                     blink_speed=DEFAULT_CURSOR_BLINK_SPEED)
+            self.host.addtag_withtag(self.tag, self.cursor.cursor_id)
+        self.cursor.show()
+        self.cursor.start_blinking()
+        self._update_cursor()
+        animate(self, "border", self._border_color, self.border_focus, self._set_border_color,
+                duration=self.animation_duration)
+
+    def on_focus_out(self):
+        if self.cursor is not None:
+            self.cursor.stop_blinking()
+            self.cursor.hide()
+        animate(self, "border", self._border_color, self.border_normal, self._set_border_color,
+                duration=self.animation_duration)
+
+    def _set_border_color(self, color):
+        self._border_color = color
+        self.host.itemconfig(self._rect_outline, outline=color)
+
+    def on_key(self, event):
+        keysym = event.keysym
+        text, pos = self._text, self._cursor_pos
+        if keysym == "BackSpace":
+            if pos == 0:
+                return
+            prev_pos = self._clusters().prev(pos)
+            self._replace_text(prev_pos, pos)
+            self._cursor_pos = prev_pos
+        elif keysym == "Delete":
+            if pos >= len(text):
+                return
+            self._replace_text(pos, self._clusters().next(pos))
+        elif keysym == "Left":
+            self._cursor_pos = self._clusters().prev(pos)
+        elif keysym == "Right":
+            self._cursor_pos = self._clusters().next(pos)
+        elif keysym == "Home":
+            self._cursor_pos = 0
+        elif keysym == "End":
+            self._cursor_pos = len(text)
+        elif event.char and event.char.isprintable():
+            if self.max_length is not None and len(text) >= self.max_length:
+                return
+            self._replace_text(pos, pos, event.char)
+            self._cursor_pos = pos + len(event.char)
+        else:
+            return
+        self._refresh()
+
+    def move_to(self, x, y):
+        dx, dy = x - self.x, y - self.y
+        super().move_to(x, y)
+        self.text_x += dx
+        self.text_y += dy
+        self._cursor_y += dy
+        if self.cursor is not None:
+            self.cursor.x += dx
+            self.cursor.y += dy
+
+    def destroy(self):
+        if self.cursor is not None:
+            self.cursor.destroy()
+            self.cursor = None
+        super().destroy()
+
+
+# ====================== SharedCanvas ======================
+class SharedCanvas(tk.Canvas):
+    """承载 HostedEntry / HostedButton 的单一画布
+
+    只有一个 X 窗口和一套事件绑定，点击、按键和焦点由这里按画布项标签
+    分发给对应的逻辑控件。
+    """
+    def __init__(self, master, bg=BG_COLOR, entry_font_family=ENTRY_FONT_FAMILY,
+                 entry_font_size=ENTRY_FONT_SIZE, **kwargs):
+        kwargs.setdefault("highlightthickness", 0)
+        kwargs.setdefault("bd", 0)
+        super().__init__(master, bg=bg, **kwargs)
+        get_dispatcher(self)
+        # 所有逻辑控件共享字体对象和度量
+        self.entry_font = make_font(entry_font_family, entry_font_size)
+        self.entry_linespace = self.entry_font.metrics("linespace")
+        self.button_font = (default_family(self), BUTTON_FONT_SIZE, "normal")
+        self._widgets = {}      # 标签 -> 逻辑控件
+        self._focus_order = []
+        self._focused = None
+        self._restore_focus = None  # 窗口失去焦点前的逻辑焦点，重新获得焦点时恢复
+        self._hover = None
+        self._pressed = None
+        self.bind("<Motion>", self._on_motion)
+        self.bind("<Leave>", self._on_leave)
+        self.bind("<Button-1>", self._on_press)
+        self.bind("<B1-Motion>", self._on_drag)
+        self.bind("<ButtonRelease-1>", self._on_release)
+        self.bind("<Key>", self._on_key)
+        self.bind("<Tab>", self._on_tab)
+        self.bind("<Shift-Tab>", self._on_shift_tab)
+        self.bind("<FocusIn>", self._on_focus_in)
+        self.bind("<FocusOut>", self._on_focus_out)
+
+    # ---------- 控件管理 ----------
+    def add_entry(self, x, y, **kwargs):
+        return self._register(HostedEntry(self, x, y, **kwargs))
+
+    def add_button(self, x, y, text, **kwargs):
+        return self._register(HostedButton(self, x, y, text, **kwargs))
+
+    def _register(self, widget):
+        self._widgets[widget.tag] = widget
+        if widget.focusable:
+            self._focus_order.append(widget)
+        return widget
+
+    def _unregister(self, widget):
+        self._widgets.pop(widget.tag, None)
+        if widget in self._focus_order:
+            self._focus_order.remove(widget)
+        if self._focused is widget:
+            self._focused = None
+        if self._restore_focus is widget:
+            self._restore_focus = None
+        if self._hover is widget:
+            self._hover = None
+        if self._pressed is widget:
+            self._pressed = None
+
+    def destroy(self):
+        """先销毁逻辑控件，停掉光标闪烁和动画，免得定时器落在已删除的画布项上"""
+        for widget in list(self._widgets.values()):
+            try:
+                widget.destroy()
+            except tk.TclError:
+                pass
+        self._widgets.clear()
+        self._focus_order = []
+        super().destroy()
+
+    def widget_at(self, x, y):
+        """当前鼠标下的逻辑控件"""
+        for tag in self.gettags("current"):
+            widget = self._widgets.get(tag)
+            if widget is not None:
+                return widget
+        # "current" 尚未更新（例如合成事件）时按坐标查找
+        for item in reversed(self.find_overlapping(x, y, x, y)):
+            for tag in self.gettags(item):
+                widget = self._widgets.get(tag)
+                if widget is not None:
+                    return widget
+        return None
+
+    # ---------- 焦点 ----------
+    def focus_widget(self, widget):
+        self._restore_focus = None
+        if widget is self._focused:
+            return
+        if self._focused is not None:
+            self._focused.on_focus_out()
+        self._focused = widget
+        if widget is not None:
+            self.focus_set()
+            widget.on_focus_in()
+
+    def _move_focus(self, step):
+        if not self._focus_order:
+            return "break"
+        if self._focused in self._focus_order:
+            idx = (self._focus_order.index(self._focused) + step) % len(self._focus_order)
+        else:
+            idx = 0 if step > 0 else len(self._focus_order) - 1
+        self.focus_widget(self._focus_order[idx])
+        return "break"
+
+    # ---------- 事件分发 ----------
+    def _on_motion(self, event):
+        widget = self.widget_at(event.x, event.y)
+        if widget is not self._hover:
+            if self._hover is not None:
+                self._hover.on_leave()
+            self._hover = widget
+            if widget is not None:
+                widget.on_enter()
+
+    def _on_leave(self, event):
+        if self._hover is not None:
+            self._hover.on_leave()
+            self._hover = None
+
+    def _on_press(self, event):
+        widget = self.widget_at(event.x, event.y)
+        self._pressed = widget
+        if widget is None:
+            self.focus_widget(None)
+            return
+        if widget.focusable:
+            self.focus_widget(widget)
+        widget.on_press(event.x, event.y)
+
+    def _on_drag(self, event):
+        if self._pressed is not None:
+            self._pressed.on_drag(event.x, event.y)
+
+    def _on_release(self, event):
+        widget, self._pressed = self._pressed, None
+        if widget is not None:
+            widget.on_release(event.x, event.y)
+
+    def _on_key(self, event):
+        if self._focused is not None:
+            self._focused.on_key(event)
+
+    def _on_tab(self, event):
+        return self._move_focus(1)
+
+    def _on_shift_tab(self, event):
+        return self._move_focus(-1)
+
+    def _on_focus_in(self, event):
+        widget, self._restore_focus = self._restore_focus, None
+        if self._focused is None and widget is not None:
+            self._focused = widget
+            widget.on_focus_in()
+
+    def _on_focus_out(self, event):
+        if self._focused is not None:
+            self._focused.on_focus_out()
+            self._restore_focus, self._focused = self._focused, None
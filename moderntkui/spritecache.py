@@ -0,0 +1,149 @@
+# spritecache.py - 预渲染的圆角矩形图片，按外观参数共享
+import math
+import tkinter as tk
+from collections import OrderedDict
+
+# ====================== 常量定义 ======================
+DEFAULT_CACHE_SIZE = 256   # 每个根窗口最多缓存的图片数
+
+
+def _clamp01(v):
+    return 0.0 if v < 0.0 else 1.0 if v > 1.0 else v
+
+
+def _rounded_rect_distance(px, py, hw, hh, r):
+    """点到圆角矩形边界的有向距离（内部为负），坐标相对矩形中心"""
+    qx = abs(px) - (hw - r)
+    qy = abs(py) - (hh - r)
+    outside = math.hypot(max(qx, 0.0), max(qy, 0.0))
+    return outside + min(max(qx, qy), 0.0) - r
+
+
+def _mix(rgbs, weights):
+    r = g = b = 0.0
+    for (cr, cg, cb), w in zip(rgbs, weights):
+        r += cr * w
+        g += cg * w
+        b += cb * w
+    return "#%02x%02x%02x" % (int(r + 0.5), int(g + 0.5), int(b + 0.5))
+
+
+def render_rounded_rect(width, height, radius, fill, outline, bg, outline_width=1,
+                        inset=1, region=None):
+    """把抗锯齿圆角矩形光栅化成 PhotoImage.put 接受的行数据
+
+    fill/outline/bg 是 0-255 的 (r, g, b)。矩形占据 [inset, w-inset] x [inset, h-inset]，
+    与矢量模式的多边形位置一致；角外的像素混合背景色，不需要透明通道。
+    region=(x0, y0, w, h) 时只输出这一块（用于切出单个圆角）。
+    只有上下 radius+1 行需要逐像素计算，中间各行完全相同，只算一次。
+    """
+    x0, y0, out_w, out_h = region if region is not None else (0, 0, width, height)
+    hw, hh = (width - 2 * inset) / 2.0, (height - 2 * inset) / 2.0
+    cx, cy = width / 2.0, height / 2.0
+    r = max(0.0, min(radius, hw, hh))
+    colors = (bg, outline, fill)
+
+    def row(y):
+        pixels = []
+        py = y + 0.5 - cy
+        for x in range(x0, x0 + out_w):
+            d = _rounded_rect_distance(x + 0.5 - cx, py, hw, hh, r)
+            outer = _clamp01(0.5 - d)
+            inner = _clamp01(0.5 - d - outline_width)
+            pixels.append(_mix(colors, (1.0 - outer, outer - inner, inner)))
+        return "{" + " ".join(pixels) + "}"
+
+    band = int(math.ceil(r)) + 2
+    middle = None
+    rows = []
+    for y in range(y0, y0 + out_h):
+        if band <= y < height - band:
+            if middle is None:
+                middle = row(y)
+            rows.append(middle)
+        else:
+            rows.append(row(y))
+    return " ".join(rows)
+
+
+# ====================== SpriteCache ======================
+class SpriteCache:
+    """按 (尺寸, 圆角, 颜色…) 共享 PhotoImage 的有界 LRU 缓存
+
+    淘汰只是丢掉缓存对图片的引用；仍在显示它的按钮各自持有引用，
+    图片要等最后一个使用者放手才会被 Tk 删除，不会出现空白按钮。
+    """
+    def __init__(self, root, maxsize=DEFAULT_CACHE_SIZE):
+        self.root = root
+        self.maxsize = maxsize
+        self._images = OrderedDict()
+        self._rgb = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._images)
+
+    def _to_rgb(self, color):
+        rgb = self._rgb.get(color)
+        if rgb is None:
+            r, g, b = self.root.winfo_rgb(color)
+            rgb = self._rgb[color] = (r >> 8, g >> 8, b >> 8)
+        return rgb
+
+    def rounded_rect(self, width, height, radius, fill, outline, bg):
+        key = (width, height, radius, fill, outline, bg)
+        image = self._lookup(key)
+        if image is not None:
+            return image
+        image = tk.PhotoImage(master=self.root, width=width, height=height)
+        image.put(render_rounded_rect(width, height, radius, self._to_rgb(fill),
+                                      self._to_rgb(outline), self._to_rgb(bg)))
+        self._store(key, image)
+        return image
+
+    def corner(self, size, radius, fill, outline, bg, which):
+        """输入框边框的单个圆角（which 为 nw/ne/sw/se），size x size 像素
+
+        取自一个 2*size 见方、贴边绘制的圆角矩形的对应象限，
+        与只画直线的四条边拼起来就是完整边框。
+        """
+        key = ("corner", size, radius, fill, outline, bg, which)
+        image = self._lookup(key)
+        if image is not None:
+            return image
+        x0 = size if which[1] == "e" else 0
+        y0 = size if which[0] == "s" else 0
+        image = tk.PhotoImage(master=self.root, width=size, height=size)
+        image.put(render_rounded_rect(2 * size, 2 * size, radius, self._to_rgb(fill),
+                                      self._to_rgb(outline), self._to_rgb(bg),
+                                      inset=0, region=(x0, y0, size, size)))
+        self._store(key, image)
+        return image
+
+    def _lookup(self, key):
+        image = self._images.get(key)
+        if image is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._images.move_to_end(key)
+        return image
+
+    def _store(self, key, image):
+        self._images[key] = image
+        while len(self._images) > self.maxsize:
+            self._images.popitem(last=False)
+
+    def clear(self):
+        self._images.clear()
+
+
+def get_sprite_cache(widget):
+    """获取控件所在根窗口共享的图片缓存"""
+    root = widget._root()
+    cache = getattr(root, "_modern_sprite_cache", None)
+    if cache is None:
+        cache = SpriteCache(root)
+        root._modern_sprite_cache = cache
+    return cache
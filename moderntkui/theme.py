@@ -0,0 +1,30 @@
+# theme.py - 各控件共用的默认颜色与字体
+
+# ====================== 颜色 ======================
+BG_COLOR = "#1e1e1e"
+ENTRY_BG_COLOR = "#2d2d2d"
+BORDER_NORMAL_COLOR = "#444444"
+BORDER_FOCUS_COLOR = "#4ec9b0"
+TEXT_COLOR = "#e0e0e0"
+PLACEHOLDER_COLOR = "#888888"
+CURSOR_COLOR = "#6bd8c9"
+SELECTION_COLOR = "#348b81"
+HIGHLIGHT_COLOR = "#6b5a24"
+
+BUTTON_COLOR = "#252525"
+BUTTON_HOVER_COLOR = "#353535"
+BUTTON_PRESS_COLOR = "#1e1e1e"
+BUTTON_OUTLINE_COLOR = "#404040"
+BUTTON_DISABLED_COLOR = "#353535"
+BUTTON_DISABLED_TEXT_COLOR = "#808080"
+
+LIST_BG_COLOR = ENTRY_BG_COLOR
+SELECT_BG_COLOR = BORDER_FOCUS_COLOR
+SELECT_TEXT_COLOR = "#ffffff"
+
+# ====================== 字体 ======================
+ENTRY_FONT_FAMILY = "dengxian"
+ENTRY_FONT_SIZE = 12
+LIST_FONT_FAMILY = ENTRY_FONT_FAMILY
+LIST_FONT_SIZE = 11
+BUTTON_FONT_SIZE = 9
@@ -1,8 +1,7 @@
 # test.py - 深色主题优化版
 import tkinter as tk
 from tkinter import ttk
-from button import RoundedButton
-from ModernEntry import ModernEntry
+from moderntkui import ModernEntry, ModernList, RoundedButton
 
 class CustomWidgetsTestApp:
     def __init__(self, root):
@@ -432,16 +431,25 @@ class CustomWidgetsTestApp:
         )
         add_btn.pack(side=tk.LEFT, padx=5)
 
-        self.data_listbox = tk.Listbox(
-            display_frame,
-            bg="#2d2d2d",
-            fg="#e0e0e0",
-            selectbackground="#4ec9b0",
-            selectforeground="#ffffff",
-            bd=0,
-            highlightthickness=0
-        )
-        self.data_listbox.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # 搜索过滤
+        search_frame = ttk.Frame(display_frame)
+        search_frame.pack(fill=tk.X, padx=5, pady=5)
+
+        ttk.Label(search_frame, text="搜索:", style="Status.TLabel").pack(side=tk.LEFT, padx=5)
+        self.search_var = tk.StringVar()
+        self.search_entry = ModernEntry(search_frame, width=200, placeholder="输入关键字过滤...",
+                                        textvariable=self.search_var)
+        self.search_entry.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        self.search_var.trace_add("write", lambda *args: self.data_listbox.filter(self.search_var.get()))
+
+        list_frame = ttk.Frame(display_frame)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL)
+        self.data_listbox = ModernList(list_frame, yscrollcommand=scrollbar.set)
+        scrollbar.configure(command=self.data_listbox.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.data_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # 操作按钮
         btn_frame = ttk.Frame(display_frame)
@@ -0,0 +1,57 @@
+# conftest.py - 不需要显示环境的测试夹具
+import gc
+import time
+import tkinter as tk
+
+import _tkinter
+import pytest
+
+
+class _TclRoot:
+    """Tcl() 有真实的 after 和文件事件，但没有 Tk 的 bind"""
+    def __init__(self):
+        self.interp = tk.Tcl()
+        self.tk = self.interp.tk
+        self.errors = []
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def _root(self):
+        return self
+
+    def dooneevent(self, flags):
+        return self.tk.dooneevent(flags)
+
+    def after(self, ms, func):
+        return self.interp.after(ms, func)
+
+    def after_idle(self, func):
+        return self.interp.after_idle(func)
+
+    def after_cancel(self, after_id):
+        self.interp.after_cancel(after_id)
+
+    def report_callback_exception(self, exc, val, tb):
+        self.errors.append(val)
+
+    def pump(self, until, timeout=2.0):
+        """像 asyncio 桥一样用 dooneevent 驱动，不进入 mainloop"""
+        deadline = time.perf_counter() + timeout
+        while not until() and time.perf_counter() < deadline:
+            self.tk.dooneevent(_tkinter.ALL_EVENTS | _tkinter.DONT_WAIT)
+
+    def pending_after(self):
+        return self.tk.splitlist(self.tk.call("after", "info"))
+
+
+@pytest.fixture
+def tcl_root():
+    root = _TclRoot()
+    yield root
+    dispatcher = getattr(root, "_modern_dispatcher", None)
+    if dispatcher is not None:
+        dispatcher.close()
+    # 解释器只能在创建它的线程里释放：拆掉引用环，不让后台线程的垃圾回收碰到它
+    root.__dict__.clear()
+    gc.collect()
@@ -0,0 +1,55 @@
+# test_animation.py - 颜色解析与插值，不需要显示环境
+import pytest
+
+from moderntkui.animation import FrameClock, _parse_color, is_hex_color, lerp, lerp_color
+
+
+@pytest.mark.parametrize("color, rgb", [
+    ("#fff", (255, 255, 255)),
+    ("#1e1e1e", (0x1e, 0x1e, 0x1e)),
+    ("#123456", (0x12, 0x34, 0x56)),
+    ("#fff000fff", (255, 0, 255)),
+    ("#ffff80000000", (255, 128, 0)),
+])
+def test_parse_color_hex_forms(color, rgb):
+    assert _parse_color(color) == rgb
+
+
+@pytest.mark.parametrize("color", ["red", "", "#", "#12", "#12345", "#gggggg", "123456"])
+def test_parse_color_rejects_non_hex(color):
+    with pytest.raises(ValueError):
+        _parse_color(color)
+    assert not is_hex_color(color)
+
+
+def test_lerp_color_endpoints_and_midpoint():
+    assert lerp_color("#000000", "#ffffff", 0) == "#000000"
+    assert lerp_color("#000000", "#ffffff", 1) == "#ffffff"
+    assert lerp_color("#000", "#fff", 0.5) == "#808080"
+    assert lerp_color("#102030", "#102030", 0.3) == "#102030"
+
+
+def test_lerp_dispatches_on_type():
+    assert lerp("#000000", "#0000ff", 1.0) == "#0000ff"
+    assert lerp((0, 10), (10, 20), 0.5) == (5.0, 15.0)
+    assert lerp(1.0, 3.0, 0.25) == 1.5
+
+
+class _FakeRoot:
+    """只实现 winfo_rgb：Tk 返回 16 位通道"""
+    def __init__(self):
+        self.lookups = []
+
+    def winfo_rgb(self, color):
+        self.lookups.append(color)
+        return {"red": (65535, 0, 0)}[color]
+
+
+def test_resolve_color_uses_winfo_rgb_once():
+    root = _FakeRoot()
+    clock = FrameClock(root)
+    assert clock.resolve_color("#abc") == "#abc"
+    assert clock.resolve_color("red") == "#ff0000"
+    assert clock.resolve_color("red") == "#ff0000"
+    assert root.lookups == ["red"]
+    assert lerp_color(clock.resolve_color("red"), "#000000", 0.5) == "#800000"
@@ -0,0 +1,72 @@
+# test_asynctk.py - asyncio 桥与协程命令；tcl_root 见 conftest.py
+import asyncio
+import threading
+import time
+
+from moderntkui.asynctk import TkAsyncBridge, spawn_command
+from moderntkui.dispatcher import get_dispatcher
+
+
+class _FakeButton:
+    def __init__(self, root):
+        self.root = root
+        self.enabled = True
+        self._command_task = None
+
+    def _root(self):
+        return self.root
+
+    def set_enabled(self, flag=True):
+        self.enabled = bool(flag)
+
+    def winfo_exists(self):
+        return True
+
+    def report_callback_exception(self, exc, val, tb):
+        self.root.errors.append(val)
+
+
+def test_bridge_runs_worker_posts(tcl_root):
+    dispatcher = get_dispatcher(tcl_root)
+    got = []
+
+    async def main():
+        bridge = TkAsyncBridge(tcl_root)
+        bridge.start()
+        threading.Thread(target=lambda: [dispatcher.post(got.append, i) for i in range(50)]).start()
+        deadline = time.perf_counter() + 2
+        while len(got) < 50 and time.perf_counter() < deadline:
+            await asyncio.sleep(0.005)
+        bridge.stop()
+
+    asyncio.run(main())
+    assert got == list(range(50))
+
+
+def test_coroutine_command_without_running_loop(tcl_root):
+    button = _FakeButton(tcl_root)
+    get_dispatcher(button)
+    ran = []
+
+    async def command():
+        await asyncio.sleep(0)
+        ran.append(threading.current_thread() is not threading.main_thread())
+
+    task = spawn_command(button, command)
+    assert not button.enabled and button._command_task is task
+    task.result(timeout=2)
+    # 完成回调经调度器回到 Tk 线程才重新启用按钮
+    tcl_root.pump(lambda: button.enabled)
+    assert ran == [True] and button.enabled and button._command_task is None
+
+
+def test_coroutine_command_error_is_reported(tcl_root):
+    button = _FakeButton(tcl_root)
+    get_dispatcher(button)
+
+    async def command():
+        raise ValueError("boom")
+
+    spawn_command(button, command)
+    tcl_root.pump(lambda: tcl_root.errors)
+    assert [type(e) for e in tcl_root.errors] == [ValueError] and button.enabled
@@ -0,0 +1,65 @@
+# test_dispatcher.py - 工作线程提交、Tk 线程执行；tcl_root 见 conftest.py
+import threading
+import time
+
+from moderntkui.dispatcher import Dispatcher
+
+
+def test_worker_posts_run_without_mainloop(tcl_root):
+    tcl_root._modern_dispatcher = dispatcher = Dispatcher(tcl_root)
+    got = []
+
+    def worker():
+        for i in range(200):
+            dispatcher.post(got.append, i)
+
+    started = time.perf_counter()
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    # 工作线程不调用 Tk，不会因为没有 mainloop 而阻塞
+    assert time.perf_counter() - started < 0.5
+    tcl_root.pump(lambda: len(got) == 200)
+    assert got == list(range(200))
+    assert not dispatcher._armed
+    assert tcl_root.pending_after() == ()
+
+
+def test_errors_are_reported_and_queue_keeps_draining(tcl_root):
+    tcl_root._modern_dispatcher = dispatcher = Dispatcher(tcl_root)
+    got = []
+    dispatcher.post(lambda: 1 / 0)
+    dispatcher.post(got.append, "after error")
+    tcl_root.pump(lambda: got)
+    assert got == ["after error"]
+    assert len(tcl_root.errors) == 1 and isinstance(tcl_root.errors[0], ZeroDivisionError)
+
+
+def test_budget_spreads_work_over_frames(tcl_root):
+    tcl_root._modern_dispatcher = dispatcher = Dispatcher(tcl_root, poll_interval=1, frame_budget=0)
+    got = []
+    for i in range(3):
+        dispatcher.post(got.append, i)
+    tcl_root.pump(lambda: got)
+    # 预算为 0：每轮只执行一条，其余的排到下一帧
+    assert got == [0]
+    tcl_root.pump(lambda: len(got) == 3)
+    assert got == [0, 1, 2] and tcl_root.pending_after() == ()
+
+
+def test_drain_runs_queue_immediately(tcl_root):
+    tcl_root._modern_dispatcher = dispatcher = Dispatcher(tcl_root)
+    got = []
+    thread = threading.Thread(target=dispatcher.post, args=(got.append, 1))
+    thread.start()
+    thread.join()
+    dispatcher.drain()
+    assert got == [1]
+
+
+def test_closed_dispatcher_drops_posts(tcl_root):
+    dispatcher = Dispatcher(tcl_root)
+    dispatcher.close()
+    dispatcher.post(lambda: None)
+    dispatcher.drain()
+    assert tcl_root.pending_after() == ()
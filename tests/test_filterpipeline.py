@@ -0,0 +1,98 @@
+# test_filterpipeline.py - 分块扫描与单调收窄，用假控件代替 Tk 的 after 队列
+from moderntkui.filterpipeline import CHECK_EVERY, FilterPipeline
+
+
+class _FakeWidget:
+    """按先后顺序执行 after/after_idle 回调"""
+    def __init__(self):
+        self.queue = []
+        self._next = 0
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after(self, ms, func, *args):
+        self._next += 1
+        job = "after#%d" % self._next
+        self.queue.append((job, func, args))
+        return job
+
+    def after_cancel(self, job):
+        self.queue = [item for item in self.queue if item[0] != job]
+
+    def run(self):
+        while self.queue:
+            _, func, args = self.queue.pop(0)
+            func(*args)
+
+
+def _make(source, **kw):
+    widget = _FakeWidget()
+    calls = []
+    pipeline = FilterPipeline(widget, source, lambda result, done: calls.append(
+        (None if result is None else list(result), done)), **kw)
+    return widget, pipeline, calls
+
+
+def _brute(source, query, ignore_case=False):
+    if ignore_case:
+        query = query.casefold()
+        return [i for i, s in enumerate(source) if query in s.casefold()]
+    return [i for i, s in enumerate(source) if query in s]
+
+
+SOURCE = ["item %d %s" % (i, "abc" if i % 3 == 0 else "abx") for i in range(3 * CHECK_EVERY)]
+
+
+def test_full_scan_and_narrowing():
+    widget, pipeline, calls = _make(SOURCE)
+    pipeline.update("ab")
+    widget.run()
+    assert calls[-1] == (_brute(SOURCE, "ab"), True)
+    pipeline.update("abc")
+    # 收窄时候选来自上一次的结果
+    assert list(pipeline._candidates) == _brute(SOURCE, "ab")
+    widget.run()
+    assert calls[-1] == (_brute(SOURCE, "abc"), True)
+
+
+def test_narrowing_from_unfinished_scan():
+    # 预算为 0：每块只扫 CHECK_EVERY 项就让出
+    widget, pipeline, calls = _make(SOURCE, frame_budget=0)
+    pipeline.update("ab")
+    _, func, args = widget.queue.pop(0)
+    func(*args)
+    assert not pipeline.done and len(calls) == 1
+    pipeline.update("abc")
+    widget.run()
+    assert pipeline.done
+    assert calls[-1] == (_brute(SOURCE, "abc"), True)
+
+
+def test_new_query_cancels_stale_scan():
+    widget, pipeline, calls = _make(SOURCE, frame_budget=0)
+    pipeline.update("abx")
+    pipeline.update("1")
+    widget.run()
+    assert calls[-1] == (_brute(SOURCE, "1"), True)
+    assert all(result != _brute(SOURCE, "abx") for result, _ in calls)
+
+
+def test_clear_query_and_ignore_case():
+    source = ["Alpha", "beta", "ALPS", "gamma"]
+    widget, pipeline, calls = _make(source, ignore_case=True)
+    pipeline.update("AL")
+    widget.run()
+    assert calls[-1] == (_brute(source, "al", True), True)
+    pipeline.update("")
+    assert calls[-1] == (None, True) and pipeline.result is None
+
+
+def test_source_appended_extends_result():
+    source = ["one", "two"]
+    widget, pipeline, calls = _make(source)
+    pipeline.update("o")
+    widget.run()
+    source.extend(["four", "five"])
+    pipeline.source_appended()
+    assert list(pipeline.result) == _brute(source, "o")
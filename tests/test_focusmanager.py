@@ -0,0 +1,86 @@
+# test_focusmanager.py - 焦点链的顺序、跳过和 Tab 交还，用假控件代替 Tk
+import gc
+
+from moderntkui.focusmanager import FocusManager
+
+
+class _Widget:
+    """只实现焦点管理器用到的接口"""
+    focused = None
+
+    def __init__(self, name, viewable=True, enabled=True):
+        self.name = name
+        self.viewable = viewable
+        self.enabled = enabled
+        self.bindings = {}
+
+    def __repr__(self):
+        return "<%s>" % self.name
+
+    def bind(self, sequence, func, add=None):
+        self.bindings[sequence] = func
+
+    def winfo_viewable(self):
+        return self.viewable
+
+    def focus_set(self):
+        _Widget.focused = self
+
+    def focus_get(self):
+        return _Widget.focused
+
+
+class _Event:
+    def __init__(self, widget):
+        self.widget = widget
+
+
+def _manager(*widgets):
+    manager = FocusManager(_Widget("toplevel"))
+    for widget in widgets:
+        manager.register(widget)
+    return manager
+
+
+def test_next_and_prev_follow_registration_order_and_wrap():
+    a, b, c = _Widget("a"), _Widget("b"), _Widget("c")
+    manager = _manager(a, b, c)
+    assert [manager.next(a), manager.next(b), manager.next(c)] == [b, c, a]
+    assert [manager.prev(a), manager.prev(b), manager.prev(c)] == [c, a, b]
+    assert manager.first() is a and manager.last() is c
+    # 未注册的控件从链表一端开始
+    assert manager.next(_Widget("x")) is a and manager.prev(_Widget("x")) is c
+
+
+def test_disabled_and_hidden_widgets_are_skipped():
+    a, b, c, d = _Widget("a"), _Widget("b", enabled=False), _Widget("c", viewable=False), _Widget("d")
+    manager = _manager(a, b, c, d)
+    assert manager.next(a) is d
+    assert manager.prev(d) is a
+
+
+def test_unregister_and_garbage_collection_unlink_nodes():
+    a, b, c = _Widget("a"), _Widget("b"), _Widget("c")
+    manager = _manager(a, b, c)
+    manager.unregister(b)
+    assert len(manager) == 2 and manager.next(a) is c
+    manager.active = c
+    del c
+    gc.collect()
+    assert len(manager) == 1 and manager.last() is a and manager.active is None
+    assert manager.next(a) is a
+
+
+def test_tab_is_handed_back_to_tk_at_either_end_and_for_foreign_widgets():
+    a, b, c = _Widget("a"), _Widget("b"), _Widget("c")
+    manager = _manager(a, b, c)
+    a.focus_set()
+    assert manager._traverse(_Event(a), 1) == "break" and _Widget.focused is b
+    assert manager._traverse(_Event(b), -1) == "break" and _Widget.focused is a
+    # 链表头上的 Shift-Tab、链表尾上的 Tab 都不拦截
+    assert manager._traverse(_Event(a), -1) is None
+    c.focus_set()
+    assert manager._traverse(_Event(c), 1) is None
+    # 焦点在普通控件上
+    _Widget("plain").focus_set()
+    assert manager._traverse(_Event(a), 1) is None
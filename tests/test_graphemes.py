@@ -0,0 +1,46 @@
+# test_graphemes.py - GraphemeIndex.replace 的增量结果应与整段重新切分一致
+import random
+
+from moderntkui.graphemes import GraphemeIndex, segment
+
+# 组合符、ZWJ 序列、肤色修饰符、变体选择符、国旗和 CRLF 都要覆盖
+PIECES = ["a", "b", " ", "é", "́", "‍", "\U0001F468", "\U0001F3FD",
+          "️", "❤", "\U0001F1E8", "\U0001F1F3", "\r", "\n", "中"]
+
+
+def _random_text(rnd, n):
+    return "".join(rnd.choice(PIECES) for _ in range(n))
+
+
+def test_segment_basic_clusters():
+    flags = segment("éx")
+    assert list(flags) == [1, 0, 1, 1]
+    flags = segment("\U0001F1E8\U0001F1F3\U0001F1E8")
+    assert [i for i, f in enumerate(flags) if f] == [0, 2, 3]
+    assert list(segment("\r\n")) == [1, 0, 1]
+
+
+def test_replace_matches_full_rescan():
+    rnd = random.Random(26)
+    for _ in range(2000):
+        text = _random_text(rnd, rnd.randint(0, 12))
+        index = GraphemeIndex(text)
+        start = rnd.randint(0, len(text))
+        end = rnd.randint(start, len(text))
+        new_text = text[:start] + _random_text(rnd, rnd.randint(0, 4)) + text[end:]
+        index.replace(start, end, new_text)
+        assert index.text == new_text
+        expected = segment(new_text)
+        assert [index.is_boundary(i) for i in range(len(new_text) + 1)] == \
+            [bool(f) for f in expected]
+
+
+def test_floor_ceil_next_prev():
+    text = "a\U0001F1E8\U0001F1F3é"
+    index = GraphemeIndex(text)
+    assert index.next(1) == 3
+    assert index.prev(3) == 1
+    assert index.floor(2) == 1
+    assert index.ceil(2) == 3
+    assert index.floor(4) == 3
+    assert index.ceil(4) == 5
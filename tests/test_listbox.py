@@ -0,0 +1,98 @@
+# test_listbox.py - ModernList 的下标换算和批量删除；只用数据部分，不创建画布
+from moderntkui.filterpipeline import FilterPipeline
+from moderntkui.listbox import ModernList
+
+
+class _AfterQueue:
+    """FilterPipeline 用到的 after 接口，run() 依次执行"""
+    def __init__(self):
+        self.queue = []
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after(self, ms, func, *args):
+        self.queue.append((func, args))
+        return len(self.queue)
+
+    def after_cancel(self, job):
+        pass
+
+    def run(self):
+        while self.queue:
+            func, args = self.queue.pop(0)
+            func(*args)
+
+
+def _bare_list(items):
+    """跳过 Canvas 初始化，只装上数据接口需要的状态"""
+    lst = ModernList.__new__(ModernList)
+    lst._items = list(items)
+    lst._view = None
+    lst._top = 0
+    lst._selected = None
+    lst._filter_query = ""
+    lst._after = _AfterQueue()
+    lst._pipeline = FilterPipeline(lst._after, lst._items, lst._on_filter_result)
+    lst._schedule_render = lambda dirty=True: None
+    lst._clamp_top = lambda: None
+    return lst
+
+
+def _filtered(lst, query):
+    lst.filter(query)
+    lst._after.run()
+    return lst
+
+
+def _shown(lst):
+    return [lst.get(i) for i in range(lst.size())]
+
+
+def test_end_means_last_row_except_for_insert():
+    lst = _bare_list(["a", "b", "c"])
+    assert lst._fix_index("end") == 2
+    assert lst._fix_index("end", for_insert=True) == 3
+    assert lst._fix_index("1") == 1
+    assert lst.get("end") == "c"
+    assert lst.get(0, "end") == ("a", "b", "c")
+    lst.insert("end", "d")
+    assert _shown(lst) == ["a", "b", "c", "d"]
+    lst.selection_set("end")
+    assert lst.curselection() == (3,)
+
+
+def test_end_follows_the_filtered_view():
+    lst = _filtered(_bare_list(["apple", "berry", "apricot", "cherry"]), "ap")
+    assert _shown(lst) == ["apple", "apricot"]
+    assert lst.get("end") == "apricot"
+    lst.insert("end", "grape")
+    assert lst._items[-1] == "grape"
+
+
+def test_delete_many_shifts_selection():
+    lst = _bare_list(list("abcdef"))
+    lst.selection_set(4)
+    lst.delete_many([0, 2, 2])
+    assert _shown(lst) == ["b", "d", "e", "f"]
+    assert lst.curselection() == (2,) and lst.get(2) == "e"
+    lst.delete_many([2])
+    assert lst.curselection() == ()
+
+
+def test_delete_many_remaps_filtered_view():
+    items = ["x%d" % i if i % 2 else "y%d" % i for i in range(20)]
+    lst = _filtered(_bare_list(items), "x")
+    lst.delete_many([0, 1, 5, 6])
+    expected = [t for i, t in enumerate(items) if i not in (0, 1, 5, 6)]
+    assert lst._items == expected
+    assert _shown(lst) == [t for t in expected if "x" in t]
+    # 删除后接着收窄，结果仍与重新过滤一致
+    _filtered(lst, "x1")
+    assert _shown(lst) == [t for t in expected if "x1" in t]
+
+
+def test_delete_range_with_end():
+    lst = _filtered(_bare_list(["a1", "b1", "a2", "a3"]), "a")
+    lst.delete(1, "end")
+    assert lst._items == ["a1", "b1"] and _shown(lst) == ["a1"]
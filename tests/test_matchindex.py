@@ -0,0 +1,54 @@
+# test_matchindex.py - MatchIndex 的增量更新应与整段重扫一致
+import random
+
+from moderntkui.matchindex import MatchIndex
+
+
+def _brute(term, text, ignore_case=False):
+    if ignore_case:
+        term, text = term.lower(), text.lower()
+    m = len(term)
+    if not m:
+        return []
+    return [(i, i + m) for i in range(len(text) - m + 1) if text[i:i + m] == term]
+
+
+def test_overlapping_matches():
+    index = MatchIndex("aa", "aaaa")
+    assert list(index) == [(0, 2), (1, 3), (2, 4)]
+
+
+def test_replace_matches_full_rescan():
+    rnd = random.Random(26)
+    for _ in range(3000):
+        term = "".join(rnd.choice("ab") for _ in range(rnd.randint(1, 3)))
+        text = "".join(rnd.choice("abc") for _ in range(rnd.randint(0, 20)))
+        index = MatchIndex(term, text)
+        start = rnd.randint(0, len(text))
+        end = rnd.randint(start, len(text))
+        inserted = "".join(rnd.choice("abc") for _ in range(rnd.randint(0, 4)))
+        text = text[:start] + inserted + text[end:]
+        index.replace(start, end, text, len(inserted))
+        assert list(index) == _brute(term, text)
+
+
+def test_refine_matches_full_rescan():
+    rnd = random.Random(7)
+    for _ in range(1000):
+        text = "".join(rnd.choice("abAB") for _ in range(rnd.randint(0, 30)))
+        term = rnd.choice("ab")
+        ignore_case = rnd.random() < 0.5
+        index = MatchIndex(term, text, ignore_case=ignore_case)
+        for _ in range(3):
+            term += rnd.choice("ab")
+            index.refine(term, text)
+            assert list(index) == _brute(term, text, ignore_case)
+
+
+def test_navigation_wraps():
+    index = MatchIndex("x", "x.x.x")
+    assert index.next_after(0) == 2
+    assert index.next_after(4) == 0
+    assert index.prev_before(0) == 4
+    assert index.between(1, 3) == [(2, 3)]
+    assert MatchIndex("z", "abc").next_after(0) is None
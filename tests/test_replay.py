@@ -0,0 +1,62 @@
+# test_replay.py - 录制文件、百分位和录制标签，不需要显示环境
+import tkinter as tk
+from types import SimpleNamespace
+
+import pytest
+
+from moderntkui.replay import RECORD_TAG, Recorder, load, load_factory, percentile
+
+
+def test_percentile_picks_nearest_rank():
+    values = [0.001 * i for i in range(1, 101)]
+    assert percentile([], 50) == 0.0
+    assert percentile([5.0], 99) == 5.0
+    assert percentile(values, 0) == values[0]
+    assert percentile(values, 50) == values[50]
+    assert percentile(values, 100) == values[-1]
+
+
+def test_recorded_events_round_trip(tmp_path):
+    recorder = Recorder(root=None)
+    recorder._start = 0.0
+    recorder._on_event(SimpleNamespace(
+        type=tk.EventType.KeyPress, widget=".f.entry", keysym="eacute", char="é",
+        num="??", x=3, y=4, state=0))
+    recorder._on_event(SimpleNamespace(
+        type=tk.EventType.ButtonPress, widget=".f.entry", keysym="??", char="??",
+        num=1, x="??", y=7, state=16))
+    path = tmp_path / "session.jsonl"
+    recorder.save(path)
+    events = load(path)
+    assert [ev[1:] for ev in events] == [
+        ["KeyPress", ".f.entry", 3, 4, 0, "eacute", 0, "é"],
+        ["ButtonPress", ".f.entry", 0, 7, 16, "", 1, ""],
+    ]
+
+
+class _Widget:
+    def __init__(self):
+        self.tags = (".w", "Canvas", ".", "all")
+
+    def bindtags(self, tags=None):
+        if tags is None:
+            return self.tags
+        self.tags = tags
+
+
+def test_widgets_mapped_after_start_are_tagged_once():
+    recorder = Recorder(root=None)
+    recorder._classes = (_Widget,)
+    widget = _Widget()
+    for _ in range(2):
+        recorder._on_map(SimpleNamespace(widget=widget))
+    recorder._on_map(SimpleNamespace(widget=".not.a.tkinter.widget"))
+    assert widget.tags[0] == RECORD_TAG and widget.tags.count(RECORD_TAG) == 1
+    assert recorder._tagged == [widget]
+
+
+def test_load_factory():
+    assert load_factory("moderntkui.replay:percentile") is percentile
+    assert load_factory("os.path:join") is __import__("os").path.join
+    with pytest.raises(ValueError):
+        load_factory("moderntkui.replay")
@@ -0,0 +1,94 @@
+# test_scaling.py - 屏幕 DPI 变化的检测与订阅者通知，用假根窗口代替 Tk
+from moderntkui.scaling import CONFIGURE_TAG, ScalingState
+
+
+class _FakeTk:
+    def __init__(self, scaling):
+        self.scaling = scaling
+
+    def call(self, *args):
+        assert args[:2] == ("tk", "scaling")
+        if len(args) == 3:
+            self.scaling = args[2]
+        return self.scaling
+
+
+class _FakeRoot:
+    def __init__(self, dpi=96.0):
+        self.dpi = dpi
+        self.tk = _FakeTk(dpi / 72.0)
+        self.tags = (".", "Tk", "all")
+        self.class_bindings = {}
+        self.timers = []
+
+    def _root(self):
+        return self
+
+    def bindtags(self, tags=None):
+        if tags is None:
+            return self.tags
+        self.tags = tags
+
+    def bind_class(self, tag, sequence, func):
+        self.class_bindings[(tag, sequence)] = func
+
+    def winfo_fpixels(self, distance):
+        assert distance == "1i"
+        return self.dpi
+
+    def after(self, ms, func):
+        self.timers.append(func)
+        return "after#%d" % len(self.timers)
+
+    def run_timers(self):
+        timers, self.timers = self.timers, []
+        for func in timers:
+            func()
+
+
+class _Event:
+    def __init__(self, widget):
+        self.widget = widget
+
+
+class _Subscriber:
+    def __init__(self):
+        self.factors = []
+
+    def _on_scaling_changed(self, factor):
+        self.factors.append(factor)
+
+
+def test_binding_is_only_on_the_root():
+    root = _FakeRoot()
+    ScalingState(root)
+    # 子控件的 bindtags 里只有 "."，不含这个标签
+    assert root.tags[0] == CONFIGURE_TAG
+    assert (CONFIGURE_TAG, "<Configure>") in root.class_bindings
+
+
+def test_moving_to_another_dpi_rescales_once():
+    root = _FakeRoot(96.0)
+    state = ScalingState(root)
+    widget = _Subscriber()
+    state.register(widget)
+    on_configure = root.class_bindings[(CONFIGURE_TAG, "<Configure>")]
+    # 同一屏幕上的移动：不换算、不通知
+    on_configure(_Event(root))
+    root.run_timers()
+    assert state.factor == 1.0 and widget.factors == []
+    # 换到 192 DPI 的显示器：一串 Configure 合并成一次检查
+    root.dpi = 192.0
+    for _ in range(5):
+        on_configure(_Event(root))
+    root.run_timers()
+    assert state.factor == 2.0 and widget.factors == [2.0]
+    assert state.scaled(10) == 20
+
+
+def test_other_widgets_are_ignored():
+    root = _FakeRoot(96.0)
+    ScalingState(root)
+    root.dpi = 144.0
+    root.class_bindings[(CONFIGURE_TAG, "<Configure>")](_Event(object()))
+    assert root.timers == []
@@ -0,0 +1,48 @@
+# test_selection.py - SelectionModel 的锚点/活动端与附加区间平移
+from moderntkui.selection import SelectionModel
+
+
+def test_no_selection_by_default():
+    model = SelectionModel()
+    assert not model.active
+    assert model.span() == (None, None)
+
+
+def test_begin_anchors_at_cursor_and_extends_both_ways():
+    model = SelectionModel()
+    model.head = 5
+    model.begin()
+    assert model.anchor == 5 and not model.active
+    model.head = 9
+    assert model.active and model.span() == (5, 9)
+    # 越过锚点向左扩展时 span 仍然有序
+    model.head = 2
+    assert model.span() == (2, 5)
+    # 已有锚点时 begin 不移动它
+    model.begin()
+    assert model.anchor == 5
+
+
+def test_clear_keeps_head():
+    model = SelectionModel()
+    model.select(1, 4)
+    model.clear()
+    assert model.head == 4 and not model.active
+
+
+def test_set_ranges_sorts_and_drops_empty():
+    model = SelectionModel()
+    model.set_ranges("find", [(6, 8), (3, 3), (0, 2)])
+    assert model.ranges("find") == [(0, 2), (6, 8)]
+    model.set_ranges("find", [(1, 1)])
+    assert not model.ranges("find") and model.tags() == []
+
+
+def test_adjust_shifts_and_drops_overlapping():
+    model = SelectionModel()
+    model.set_ranges("find", [(0, 2), (3, 5), (8, 10)])
+    # 把 [4, 6) 替换为 3 个字符：(0, 2) 不动，(3, 5) 丢弃，(8, 10) 后移 1
+    model.adjust(4, 6, 3)
+    assert model.ranges("find") == [(0, 2), (9, 11)]
+    model.adjust(0, 20, 0)
+    assert "find" not in model.tags()
@@ -0,0 +1,120 @@
+# test_sharedcanvas.py - 逻辑控件的事件分发，用假画布代替 SharedCanvas
+from types import SimpleNamespace
+
+from moderntkui.animation import get_clock
+from moderntkui.sharedcanvas import HostedButton, HostedEntry, SharedCanvas
+
+
+class _FakeRoot:
+    def __init__(self):
+        self.timers = {}
+        self._next = 0
+
+    def after(self, ms, func, *args):
+        self._next += 1
+        job = "after#%d" % self._next
+        self.timers[job] = (func, args)
+        return job
+
+    def after_cancel(self, job):
+        self.timers.pop(job, None)
+
+    def winfo_rgb(self, color):
+        raise AssertionError("theme colors are hex")
+
+
+class _FakeFont:
+    def measure(self, text):
+        return 7 * len(text)
+
+
+class _FakeHost:
+    """只实现逻辑控件和事件分发用到的画布接口；分发逻辑直接借用 SharedCanvas 的"""
+    _register = SharedCanvas._register
+    _unregister = SharedCanvas._unregister
+    focus_widget = SharedCanvas.focus_widget
+    _on_motion = SharedCanvas._on_motion
+    _on_press = SharedCanvas._on_press
+    _on_release = SharedCanvas._on_release
+
+    def __init__(self):
+        self.root = _FakeRoot()
+        self.entry_font = _FakeFont()
+        self.entry_linespace = 14
+        self.button_font = ("TkDefaultFont", 10, "normal")
+        self._widgets = {}
+        self._focus_order = []
+        self._focused = None
+        self._restore_focus = None
+        self._hover = None
+        self._pressed = None
+        self._items = 0
+
+    # PureCursor.destroy 直接调用 tk.Canvas.delete
+    _w = ".shared"
+    tk = SimpleNamespace(call=lambda *args: None)
+
+    def _root(self):
+        return self.root
+
+    def _item(self, *args, **kwargs):
+        self._items += 1
+        return self._items
+
+    create_polygon = create_text = create_rectangle = _item
+
+    def itemconfig(self, *args, **kwargs): pass
+    def coords(self, *args): pass
+    def addtag_withtag(self, *args): pass
+    def move(self, *args): pass
+    def delete(self, *args): pass
+    def focus_set(self): pass
+    after = property(lambda self: self.root.after)
+    after_cancel = property(lambda self: self.root.after_cancel)
+
+    def widget_at(self, x, y):
+        for widget in self._widgets.values():
+            if widget.contains(x, y):
+                return widget
+        return None
+
+
+def _event(x, y):
+    return SimpleNamespace(x=x, y=y)
+
+
+def test_hosted_button_click_runs_command():
+    host = _FakeHost()
+    clicks = []
+    button = host._register(HostedButton(host, 10, 10, "OK", command=lambda: clicks.append(1)))
+    host._on_motion(_event(20, 20))
+    host._on_press(_event(20, 20))
+    host._on_release(_event(20, 20))
+    assert clicks == [1]
+    # 动画挂在宿主的根窗口上，但按逻辑控件区分
+    clock = get_clock(button)
+    assert clock is host.root._modern_frame_clock
+    assert (button, "fill") in clock._animations
+    button.destroy()
+    assert not clock._animations and not host._widgets
+
+
+def test_release_outside_button_does_not_fire():
+    host = _FakeHost()
+    clicks = []
+    host._register(HostedButton(host, 10, 10, "OK", command=lambda: clicks.append(1)))
+    host._on_press(_event(20, 20))
+    host._on_release(_event(200, 200))
+    assert clicks == []
+
+
+def test_press_on_hosted_entry_focuses_and_places_caret():
+    host = _FakeHost()
+    entry = host._register(HostedEntry(host, 0, 0, width=200, height=30))
+    entry.set("hello")
+    host._on_press(_event(entry.text_x + 7 * 2, 10))
+    assert host._focused is entry
+    assert entry._cursor_pos == 2
+    assert entry.cursor.blink_id in host.root.timers
+    entry.destroy()
+    assert entry.cursor is None and not host.root.timers